@@ -0,0 +1,57 @@
+import argparse
+import asyncio
+import signal
+from config.settings import Settings
+from repositories.search_repository import SearchRepository
+from services.api_service import ApiServer
+from services.trend_service import attach_trend_tracking
+from services.warmup_service import start_warmup
+from utils.timing import configure_timing
+
+
+async def serve(settings: Settings, host: str, port: int):
+    repository = SearchRepository(settings.CSV_PATH)
+    attach_trend_tracking(repository, settings.TRENDS_PATH)
+    server = ApiServer(repository, settings, max_workers=settings.API_WORKERS)
+    listener = await server.start(host, port)
+    print(f"TrendTracker API 서버 실행 중: http://{host}:{port}")
+    # 자주 찾는 키워드의 검색/요약 캐시를 백그라운드에서 미리 채움 (요청 처리는 바로 시작)
+    start_warmup(repository, settings)
+
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, stop.set)
+        except NotImplementedError:  # Windows
+            pass
+
+    async with listener:
+        await stop.wait()
+    server.close()
+
+
+def main():
+    """
+    검색/요약/기록 조회를 HTTP로 제공하는 API 서버를 실행합니다.
+
+    사용 예시:
+        uv run python api_server.py
+        curl -X POST localhost:8080/search -d '{"keyword": "AI", "num_results": 5}'
+        curl 'localhost:8080/history?prefix=AI&page=1'
+    """
+    settings = Settings()
+    parser = argparse.ArgumentParser(description="TrendTracker HTTP API 서버")
+    parser.add_argument("--host", default=settings.API_HOST)
+    parser.add_argument("--port", type=int, default=settings.API_PORT)
+    args = parser.parse_args()
+
+    configure_timing(settings)
+    try:
+        asyncio.run(serve(settings, args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -1,23 +1,37 @@
+import uuid
 import streamlit as st
-from datetime import datetime
-from config.settings import Settings
-from repositories.search_repository import SearchRepository
-from services.search_service import search_news
-from services.ai_service import summarize_news
-from domain.search_result import SearchResult
-from utils.exceptions import AppError
+from utils.app_cache import (
+    get_settings,
+    get_repository,
+    get_history_index,
+    find_by_key,
+    get_all_as_csv,
+    get_cache_stats,
+    start_sdk_preload,
+    start_cache_warmup
+)
+from services.pipeline_service import get_pipeline_metrics
+from services.job_service import get_job_runner
 from utils.error_handler import handle_error
-from utils.key_generator import generate_search_key
+from utils.rate_limiter import get_quota_status
+from utils.retry import get_retry_metrics
 from components.search_form import render_search_form
 from components.sidebar import (
     render_sidebar_header, 
     render_settings, 
+    render_search_mode,
     render_info, 
     render_history_list, 
     render_download_button
 )
-from components.result_section import render_summary, render_news_list
-from components.loading import show_loading
+from components.result_section import render_summary, render_summary_stream, render_news_list
+from components.metrics_panel import render_prompt_stats, render_model_stats, render_cache_stats, render_timing_stats
+from services.ai_service import get_prompt_stats
+from services.model_router import get_model_stats
+from services.warmup_service import get_warmup_status
+from utils.search_cache import get_search_cache_stats
+from utils.summary_cache import get_summary_cache_stats
+from utils.timing import configure_timing, get_timing_stats, span
 
 def main():
     # 1. 페이지 설정
@@ -27,14 +41,16 @@ def main():
         layout="wide"
     )
 
-    # 2. 초기화 (설정 및 리포지토리)
+    # 2. 초기화 (설정 및 리포지토리는 프로세스에 한 번만 생성하여 재사용)
     try:
-        settings = Settings()
+        settings = get_settings()
+        configure_timing(settings)
     except ValueError as e:
         st.error(str(e))
         st.stop()
         
-    repository = SearchRepository(settings.CSV_PATH)
+    repository = get_repository(settings.CSV_PATH, settings.TRENDS_PATH)
+    job_runner = get_job_runner(settings)
 
     # 3. 세션 상태 초기화
     if "current_mode" not in st.session_state:
@@ -43,16 +59,25 @@ def main():
         st.session_state.selected_key = None
     if "last_result" not in st.session_state:
         st.session_state.last_result = None
+    if "session_id" not in st.session_state:
+        st.session_state.session_id = uuid.uuid4().hex
+    if "job_id" not in st.session_state:
+        st.session_state.job_id = None
 
     # 4. 사이드바 영역
     render_sidebar_header()
-    num_results = render_settings()
-    render_info()
+    num_results = render_settings(settings.MAX_NUM_RESULTS)
+    incremental = render_search_mode()
+    render_info(get_quota_status(settings), get_retry_metrics(), get_pipeline_metrics(), job_runner.get_metrics())
+    render_prompt_stats(get_prompt_stats())
+    render_model_stats(get_model_stats())
+    render_cache_stats(get_cache_stats(), get_summary_cache_stats(), get_search_cache_stats(), get_warmup_status())
+    render_timing_stats(get_timing_stats())
     
     st.sidebar.divider()
     
-    search_keys = repository.get_all_keys()
-    selected_stored_key = render_history_list(search_keys)
+    history_index = get_history_index(repository)
+    selected_stored_key = render_history_list(history_index)
     
     # 사이드바에서 과거 기록 선택 시 모드 변경
     if selected_stored_key:
@@ -63,8 +88,8 @@ def main():
 
     st.sidebar.divider()
     
-    csv_data = repository.get_all_as_csv()
-    render_download_button(csv_data, len(search_keys) == 0)
+    csv_data = get_all_as_csv(repository)
+    render_download_button(csv_data, len(history_index) == 0)
 
     # 5. 메인 영역
     st.title("🚀 TrendTracker")
@@ -73,63 +98,88 @@ def main():
     # 5-1. 검색 폼 렌더링
     keyword = render_search_form()
 
-    # 5-2. 새로운 검색 처리
+    # 5-2. 새로운 검색 처리 (검색+요약은 백그라운드 작업으로 실행하고 화면은 진행 상황만 확인)
     if keyword:
         st.session_state.current_mode = "new_search"
         st.session_state.selected_key = None
-        
-        try:
-            # 뉴스 검색
-            with show_loading(f"🔍 '{keyword}' 관련 최신 뉴스를 검색하고 있습니다..."):
-                articles = search_news(keyword, num_results)
-            
-            if not articles:
-                st.info(f"'{keyword}'에 대한 검색 결과가 없습니다. 다른 키워드로 시도해보세요.")
-                return
-
-            # AI 요약
-            with show_loading("🤖 AI가 뉴스를 읽고 핵심 내용을 요약하고 있습니다..."):
-                summary = summarize_news(articles)
-            
-            # 결과 객체 생성
-            search_key = generate_search_key(keyword)
-            result = SearchResult(
-                search_key=search_key,
-                search_time=datetime.now(),
-                keyword=keyword,
-                articles=articles,
-                ai_summary=summary
+        st.session_state.last_result = None
+        if incremental:
+            mode = "incremental"
+        elif settings.STREAM_SUMMARY:
+            mode = "stream"
+        else:
+            mode = "normal"
+        job = job_runner.submit(st.session_state.session_id, keyword, num_results, repository, mode)
+        st.session_state.job_id = job.job_id
+
+    job = job_runner.get(st.session_state.job_id) if st.session_state.job_id else None
+
+    if job and not job.finished and st.session_state.current_mode == "new_search":
+        stage_messages = {
+            None: f"⏳ '{job.keyword}' 작업을 준비하고 있습니다...",
+            "search": f"🔍 '{job.keyword}' 관련 최신 뉴스를 검색하고 있습니다...",
+            "summarize": "🤖 AI가 뉴스를 읽고 핵심 내용을 요약하고 있습니다...",
+            "save": "💾 검색 결과를 저장하고 있습니다..."
+        }
+
+        if job.mode == "stream":
+            # 요약 조각을 받는 즉시 표시 (폴링 주기를 기다리지 않음)
+            # 도중에 다른 위젯을 조작해도 작업은 계속 진행되고, 다시 실행되면 지금까지의 요약부터 이어서 표시
+            stage_placeholder = st.empty()
+            render_summary_stream(
+                job.keyword,
+                job_runner.stream_summary(
+                    job.job_id,
+                    on_stage=lambda stage: stage_placeholder.caption(stage_messages.get(stage, stage_messages[None]))
+                )
             )
-            
-            # 저장
-            with show_loading("💾 검색 결과를 저장하고 있습니다..."):
-                repository.save(result)
-            
-            st.success(f"'{keyword}' 검색 및 요약 완료! {len(articles)}건의 뉴스를 분석했습니다.")
-            st.session_state.last_result = result
-            
-        except AppError as e:
-            handle_error(e.error_type)
-        except Exception as e:
-            st.error(f"알 수 없는 오류가 발생했습니다: {e}")
+            st.rerun()
+
+        # 작업이 끝날 때까지 이 영역만 주기적으로 다시 그림 (다른 위젯 조작과 무관하게 작업은 계속 진행)
+        @st.fragment(run_every=settings.JOB_POLL_SECONDS)
+        def render_job_progress():
+            current = job_runner.get(job.job_id)
+            if current is None or current.finished:
+                st.rerun()
+            st.caption(stage_messages.get(current.stage, stage_messages[None]))
+
+        render_job_progress()
+
+    elif job and job.finished:
+        # 완료된 작업 결과를 한 번만 반영
+        st.session_state.job_id = None
+        if job.error_type:
+            handle_error(job.error_type)
+        elif job.error_message:
+            st.error(f"알 수 없는 오류가 발생했습니다: {job.error_message}")
+        elif not job.result.articles:
+            st.info(f"'{job.keyword}'에 대한 검색 결과가 없습니다. 다른 키워드로 시도해보세요.")
+        else:
+            if job.mode == "incremental" and job.new_count == 0:
+                st.info(f"'{job.keyword}'의 마지막 검색 이후 새로운 기사가 없습니다. 이전 결과를 표시합니다.")
+            elif job.mode == "incremental":
+                st.success(f"'{job.keyword}' 새 기사 {job.new_count}건을 가져와 이전 결과와 합쳤습니다.")
+            else:
+                st.success(f"'{job.keyword}' 검색 및 요약 완료! {len(job.result.articles)}건의 뉴스를 분석했습니다.")
+            st.session_state.last_result = job.result
 
     # 6. 결과 표시 로직
     if st.session_state.current_mode == "new_search" and st.session_state.last_result:
         res = st.session_state.last_result
-        render_summary(res.keyword, res.ai_summary)
-        render_news_list(res.articles)
+        render_summary(res.keyword, res.ai_summary, res.summary_version)
+        render_news_list(res.articles, settings.NEWS_PAGE_SIZE, key=f"news_{res.search_key}")
         
     elif st.session_state.current_mode == "history" and st.session_state.selected_key:
         # 기록 조회 모드
-        history_result = repository.find_by_key(st.session_state.selected_key)
+        history_result = find_by_key(repository, st.session_state.selected_key)
         if history_result:
-            render_summary(history_result.keyword, history_result.ai_summary)
-            render_news_list(history_result.articles)
+            render_summary(history_result.keyword, history_result.ai_summary, history_result.summary_version)
+            render_news_list(history_result.articles, settings.NEWS_PAGE_SIZE, key=f"news_{history_result.search_key}")
         else:
             st.error("선택한 기록을 불러올 수 없습니다.")
     
     # 첫 실행 및 빈 상태 안내
-    elif not keyword and not search_keys:
+    elif not keyword and not len(history_index):
         st.markdown("---")
         st.info("💡 아직 검색 기록이 없습니다. 상단의 입력창에 관심 있는 키워드를 입력하여 첫 검색을 시작해보세요!")
         st.markdown("""
@@ -139,5 +189,11 @@ def main():
         - **데이터 백업**: 하단의 'CSV 다운로드'를 통해 전체 검색 기록을 보관할 수 있습니다.
         """)
 
+    # 7. 화면을 모두 그린 뒤 첫 검색에 필요한 SDK를 불러오고, 자주 찾는 키워드의 캐시를 백그라운드에서 미리 채우기
+    start_sdk_preload()
+    start_cache_warmup(settings.CSV_PATH, settings.TRENDS_PATH)
+
 if __name__ == "__main__":
-    main()
+    # 스크립트 1회 실행(rerun) 전체 소요 시간 측정 (사이드바에는 이전 실행까지의 기록이 표시됩니다)
+    with span("app.rerun"):
+        main()
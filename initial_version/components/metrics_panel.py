@@ -0,0 +1,79 @@
+import streamlit as st
+from typing import Dict, List, Optional
+
+def render_prompt_stats(prompt_stats: List[Dict]):
+    """최근 요약 요청의 입력 토큰 통계를 사이드바에 렌더링합니다."""
+    if not prompt_stats:
+        return
+
+    with st.sidebar.expander("🧮 요약 프롬프트 통계", expanded=False):
+        latest = prompt_stats[-1]
+        tokens = [s["actual_tokens"] or s["estimated_tokens"] for s in prompt_stats]
+        st.caption(f"최근 {len(prompt_stats)}건 평균 입력 토큰: {sum(tokens) // len(tokens):,}")
+        st.caption(
+            f"마지막 요청: {tokens[-1]:,} 토큰 (예산 {latest['budget']:,}) · "
+            f"기사 {latest['included']}건 포함, {latest['truncated']}건 축약, {latest['dropped']}건 제외"
+        )
+
+def render_model_stats(model_stats: List[Dict]):
+    """요약 모델별 지연 시간, 성공률, 비용을 사이드바에 렌더링합니다."""
+    if not any(s["requests"] for s in model_stats):
+        return
+
+    with st.sidebar.expander("🤖 요약 모델 통계", expanded=False):
+        for s in model_stats:
+            if not s["requests"]:
+                st.caption(f"**{s['model']}**: 요청 없음")
+                continue
+            st.caption(
+                f"**{s['model']}**: {s['requests']}건 · 성공률 {s['success_rate']:.0%} · "
+                f"p50 {s['p50_ms']:,.0f}ms / p95 {s['p95_ms']:,.0f}ms · "
+                f"저품질 {s['low_quality']}건 · 헤지 {s['hedged']}건 · 약 ${s['cost_usd']:.4f}"
+            )
+
+def render_cache_stats(
+    cache_stats: Dict[str, Dict[str, int]],
+    summary_cache_stats: Dict[str, int],
+    search_cache_stats: Optional[Dict[str, int]] = None,
+    warmup_status: Optional[Dict] = None
+):
+    """화면 조회 캐시, 검색/요약 캐시의 적중률과 캐시 예열 상태를 사이드바에 렌더링합니다. (디버그용)"""
+    with st.sidebar.expander("🗄️ 캐시 적중률", expanded=False):
+        for name, s in cache_stats.items():
+            rate = f"{s['hits'] / s['calls']:.0%}" if s["calls"] else "-"
+            st.caption(f"{name}: {s['hits']:,}/{s['calls']:,} 적중 ({rate})")
+
+        if summary_cache_stats:
+            hits = summary_cache_stats.get("memory_hits", 0) + summary_cache_stats.get("disk_hits", 0)
+            total = hits + summary_cache_stats.get("misses", 0)
+            rate = f"{hits / total:.0%}" if total else "-"
+            st.caption(
+                f"AI 요약: {hits:,}/{total:,} 적중 ({rate}) · "
+                f"메모리 {summary_cache_stats.get('memory_hits', 0):,} / 디스크 {summary_cache_stats.get('disk_hits', 0):,}"
+            )
+
+        if search_cache_stats:
+            hits = search_cache_stats.get("hits", 0)
+            total = hits + search_cache_stats.get("misses", 0) + search_cache_stats.get("expired", 0)
+            rate = f"{hits / total:.0%}" if total else "-"
+            st.caption(f"뉴스 검색: {hits:,}/{total:,} 적중 ({rate}) · 만료 {search_cache_stats.get('expired', 0):,}")
+            st.caption("예열된 검색 결과는 키워드별 첫 검색에 한 번만 쓰이며, 이후 검색은 항상 새로 가져옵니다.")
+
+        if warmup_status:
+            state = "진행 중" if warmup_status["state"] == "running" else f"완료 ({warmup_status['elapsed_seconds']}초)"
+            st.caption(
+                f"시작 시 예열: {state} · 예열 {warmup_status['warmed']} / 건너뜀 {warmup_status['skipped']} / "
+                f"실패 {warmup_status['failed']}"
+            )
+
+def render_timing_stats(timing_stats: Dict[str, Dict[str, float]]):
+    """단계별 소요 시간(p50/p95)을 사이드바에 렌더링합니다."""
+    if not timing_stats:
+        return
+
+    with st.sidebar.expander("⏱️ 단계별 소요 시간", expanded=False):
+        for name, s in sorted(timing_stats.items()):
+            st.caption(
+                f"**{name}**: p50 {s['p50_ms']:,.1f}ms · p95 {s['p95_ms']:,.1f}ms "
+                f"· 최근 {s['last_ms']:,.1f}ms ({s['count']}회)"
+            )
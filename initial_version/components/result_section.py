@@ -1,28 +1,73 @@
 import streamlit as st
-from typing import List
+from typing import Iterator, List
 from domain.news_article import NewsArticle
 
-def render_summary(keyword: str, summary: str):
+def render_summary(keyword: str, summary: str, summary_version: int = 1):
     """AI 요약 결과를 렌더링합니다."""
     st.markdown("---")
     st.subheader(f"🤖 '{keyword}' 핵심 요약")
+    if summary_version > 1:
+        st.caption(f"🔄 새 기사를 반영해 {summary_version - 1}회 갱신된 요약입니다 (버전 {summary_version}).")
     
     # 요약 내용을 박스 안에 표시
     st.info(summary)
 
-def render_news_list(articles: List[NewsArticle]):
-    """검색된 뉴스 기사 목록을 렌더링합니다."""
+def render_summary_stream(keyword: str, chunks: Iterator[str]) -> str:
+    """
+    AI 요약을 생성되는 대로 화면에 표시하고, 스트림이 끝나면 전체 요약 텍스트를 반환합니다.
+    """
+    st.markdown("---")
+    st.subheader(f"🤖 '{keyword}' 핵심 요약")
+
+    with st.container(border=True):
+        summary = st.write_stream(chunks)
+
+    # write_stream은 문자열 조각만 받으면 전체 문자열을 반환합니다
+    return summary if isinstance(summary, str) else "".join(str(part) for part in summary)
+
+def _render_article(article: NewsArticle):
+    """기사 1건을 펼침 상자로 렌더링합니다."""
+    # 날짜 정보가 있으면 제목이나 본문에 표시
+    date_str = f" ({article.pub_date})" if article.pub_date else ""
+    with st.expander(f"📌 {article.title}{date_str}", expanded=False):
+        if article.pub_date:
+            st.caption(f"📅 발행일: {article.pub_date}")
+        st.markdown(f"**기사 스니펫:**\n{article.snippet}")
+        st.markdown(f"[🔗 기사 보기]({article.url})")
+        if article.alternate_urls:
+            links = " · ".join(f"[출처 {i}]({url})" for i, url in enumerate(article.alternate_urls, 1))
+            st.caption(f"🔁 같은 기사의 다른 출처: {links}")
+
+def render_news_list(articles: List[NewsArticle], page_size: int = 10, key: str = "news"):
+    """
+    검색된 뉴스 기사 목록을 페이지 단위로 렌더링합니다.
+    현재 페이지의 기사만 화면에 전달하므로 기사 수가 늘어나도 렌더링 시간이 일정합니다.
+
+    Args:
+        articles: 기사 리스트
+        page_size: 한 페이지에 표시할 기사 수
+        key: 페이지 선택 위젯 키 (검색 결과마다 다르게 지정하면 결과별로 페이지가 유지됩니다)
+    """
     st.subheader("📰 관련 뉴스 목록")
     
     if not articles:
         st.write("관련 뉴스가 없습니다.")
         return
 
-    for article in articles:
-        # 날짜 정보가 있으면 제목이나 본문에 표시
-        date_str = f" ({article.pub_date})" if article.pub_date else ""
-        with st.expander(f"📌 {article.title}{date_str}", expanded=False):
-            if article.pub_date:
-                st.caption(f"📅 발행일: {article.pub_date}")
-            st.markdown(f"**기사 스니펫:**\n{article.snippet}")
-            st.markdown(f"[🔗 기사 보기]({article.url})")
+    page_size = max(1, page_size)
+    total_pages = (len(articles) - 1) // page_size + 1
+    page = st.session_state.get(f"{key}_page", 1) if total_pages > 1 else 1
+    page = min(max(page, 1), total_pages)
+
+    start = (page - 1) * page_size
+    for article in articles[start:start + page_size]:
+        _render_article(article)
+
+    if total_pages > 1:
+        st.number_input(
+            f"페이지 (총 {total_pages}쪽, {len(articles)}건 중 {start + 1}~{min(start + page_size, len(articles))}번째)",
+            min_value=1,
+            max_value=total_pages,
+            step=1,
+            key=f"{key}_page"
+        )
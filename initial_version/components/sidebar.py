@@ -1,6 +1,7 @@
 import streamlit as st
-from typing import List, Optional
+from typing import Dict, Optional
 from datetime import datetime
+from utils.history_index import HistoryIndex
 
 def render_sidebar_header():
     """사이드바 헤더를 렌더링합니다."""
@@ -8,19 +9,44 @@ def render_sidebar_header():
     st.sidebar.markdown("키워드로 뉴스를 검색하고 AI가 핵심 내용을 요약해드립니다.")
     st.sidebar.divider()
 
-def render_settings() -> int:
+def render_settings(max_results: int = 10) -> int:
     """검색 건수 설정을 위한 슬라이더를 렌더링하고 선택된 값을 반환합니다."""
     st.sidebar.subheader("⚙️ 설정")
     num_results = st.sidebar.slider(
         "검색 결과 수",
         min_value=1,
-        max_value=10,
+        max_value=max(max_results, 5),
         value=5,
         help="한 번에 검색할 뉴스 기사의 개수를 설정합니다."
     )
     return num_results
 
-def render_info():
+def render_search_mode() -> bool:
+    """증분 검색 여부를 선택하는 토글을 렌더링하고 선택 값을 반환합니다."""
+    return st.sidebar.toggle(
+        "새 기사만 가져오기",
+        value=False,
+        help="이미 검색한 키워드라면 마지막 검색 이후에 나온 기사만 가져와 이전 결과에 합칩니다. "
+             "API 사용량과 저장 공간을 줄일 수 있습니다."
+    )
+
+def _format_quota(status: Dict) -> str:
+    """요청 제한기 상태를 '남은 횟수' 문자열로 변환합니다."""
+    parts = []
+    if status.get("month_remaining") is not None:
+        parts.append(f"이번 달 {status['month_remaining']:,}/{status['per_month']:,}건 남음")
+    else:
+        parts.append(f"이번 달 {status['month_used']:,}건 사용")
+    if status.get("minute_remaining") is not None:
+        parts.append(f"분당 {status['minute_remaining']}/{status['per_minute']}회 가능")
+    return ", ".join(parts)
+
+def render_info(
+    quota_status: Optional[Dict[str, Dict]] = None,
+    service_metrics: Optional[Dict[str, Dict]] = None,
+    pipeline_metrics: Optional[Dict[str, int]] = None,
+    job_metrics: Optional[Dict[str, int]] = None
+):
     """사용법 및 서비스 정보를 렌더링합니다."""
     st.sidebar.subheader("ℹ️ 정보")
     
@@ -37,6 +63,26 @@ def render_info():
         - **Tavily**: 무료 플랜 기준 월 1,000건 검색 가능
         - **Gemini**: 무료 플랜 기준 분당 요청 횟수 제한이 있을 수 있습니다.
         """)
+        if quota_status:
+            st.markdown("**남은 한도**")
+            for label, key in (("Tavily", "tavily"), ("Gemini", "gemini")):
+                if key in quota_status:
+                    st.caption(f"{label}: {_format_quota(quota_status[key])}")
+        if service_metrics:
+            st.markdown("**서버 상태**")
+            state_labels = {"closed": "🟢 정상", "half_open": "🟡 복구 확인 중", "open": "🔴 일시 차단"}
+            for name, m in service_metrics.items():
+                st.caption(
+                    f"{name}: {state_labels.get(m['state'], m['state'])} "
+                    f"(호출 {m['calls']}회, 재시도 {m['retries']}회, 실패 {m['failures']}회, 차단 {m['rejected']}회)"
+                )
+        if pipeline_metrics and pipeline_metrics.get("coalesced"):
+            st.caption(
+                f"동시 검색 합치기: {pipeline_metrics['coalesced']}건 "
+                f"(실제 실행 {pipeline_metrics['executed']}건)"
+            )
+        if job_metrics and (job_metrics.get("pending") or job_metrics.get("running")):
+            st.caption(f"백그라운드 작업: 실행 중 {job_metrics['running']}건, 대기 {job_metrics['pending']}건")
         
     with st.sidebar.expander("💾 데이터 저장 안내", expanded=False):
         st.markdown("""
@@ -45,45 +91,48 @@ def render_info():
         - 중요한 기록은 **CSV 다운로드** 기능을 통해 백업하세요.
         """)
 
-def render_history_list(search_keys: List[str]) -> Optional[str]:
-    """과거 검색 기록 목록을 selectbox로 렌더링하고 선택된 키를 반환합니다."""
+def render_history_list(history_index: HistoryIndex, page_size: int = 20) -> Optional[str]:
+    """
+    과거 검색 기록을 키워드 검색과 페이지로 나누어 렌더링하고, 새로 선택된 키를 반환합니다.
+    기록이 아무리 많아도 선택 목록에는 한 페이지 분량만 전달합니다.
+    선택이 바뀐 실행에서만 키를 반환하므로, 이후 새 검색 결과를 가리지 않습니다.
+    """
     st.sidebar.subheader("📜 검색 기록")
     
-    if not search_keys:
+    if not len(history_index):
         st.sidebar.info("저장된 검색 기록이 없습니다.")
         return None
-    
-    # "키워드 (yyyy-mm-dd HH:MM)" 형식으로 표시하기 위해 가공
-    # search_key 형식: "키워드-yyyyMMddHHmm"
-    display_options = []
-    key_map = {}
-    
-    for key in search_keys:
-        try:
-            parts = key.rsplit("-", 1)
-            if len(parts) == 2:
-                keyword, ts = parts
-                dt = datetime.strptime(ts, "%Y%m%d%H%M")
-                display_str = f"{keyword} ({dt.strftime('%Y-%m-%d %H:%M')})"
-                display_options.append(display_str)
-                key_map[display_str] = key
-            else:
-                display_options.append(key)
-                key_map[key] = key
-        except:
-            display_options.append(key)
-            key_map[key] = key
+
+    query = st.sidebar.text_input("키워드로 찾기", key="history_query", placeholder="키워드 앞부분 입력")
+    matched = history_index.search(query)
+    if not matched:
+        st.sidebar.caption("일치하는 기록이 없습니다.")
+        return None
+
+    total_pages = (len(matched) - 1) // page_size + 1
+    page = 1
+    if total_pages > 1:
+        page = st.sidebar.number_input(
+            f"페이지 (총 {total_pages}쪽, {len(matched):,}건)",
+            min_value=1,
+            max_value=total_pages,
+            value=1,
+            step=1
+        )
             
-    selected_display = st.sidebar.selectbox(
+    selected = st.sidebar.selectbox(
         "과거 기록 불러오기",
-        options=["선택하세요"] + display_options,
+        options=[None] + HistoryIndex.page(matched, page, page_size),
+        format_func=lambda key: "선택하세요" if key is None else history_index.label(key),
         index=0
     )
-    
-    if selected_display == "선택하세요":
+
+    previous = st.session_state.get("history_last_selected")
+    st.session_state.history_last_selected = selected
+    if selected is None or selected == previous:
         return None
         
-    return key_map.get(selected_display)
+    return selected
 
 def render_download_button(csv_data: str, is_empty: bool):
     """전체 데이터를 CSV로 다운로드할 수 있는 버튼을 렌더링합니다."""
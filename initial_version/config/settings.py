@@ -46,10 +46,105 @@ API 키 발급 안내:
         
         # 선택적 설정 (기본값 제공)
         self.GEMINI_MODEL = os.getenv("GEMINI_MODEL", "gemini-2.5-flash")
+
+        # 요약 모델 cascade (쉼표 구분, 앞 모델부터 시도하고 실패/저품질이면 다음 모델 사용, 비워두면 GEMINI_MODEL만 사용)
+        cascade_raw = os.getenv("GEMINI_MODEL_CASCADE", "")
+        self.GEMINI_MODEL_CASCADE = [m.strip() for m in cascade_raw.split(",") if m.strip()]
+        # 헤지 요청 (첫 요청이 p95 지연 시간 또는 HEDGE_AFTER_MS를 넘으면 같은 모델로 한 번 더 요청)
+        self.GEMINI_HEDGE = os.getenv("GEMINI_HEDGE", "false").lower() == "true"
+        self.GEMINI_HEDGE_AFTER_MS = float(os.getenv("GEMINI_HEDGE_AFTER_MS", "0"))
+
+        # API 서버 주소 (비워두면 실제 서비스 사용, 부하 테스트 시 tools/fake_servers.py 주소 지정)
+        self.TAVILY_BASE_URL = os.getenv("TAVILY_BASE_URL", "")
+        self.GEMINI_BASE_URL = os.getenv("GEMINI_BASE_URL", "")
         
         # SEARCH_DOMAINS 처리 (쉼표 구분 리스트로 변환)
         domains_raw = os.getenv("SEARCH_DOMAINS", "")
         self.SEARCH_DOMAINS = [d.strip() for d in domains_raw.split(",") if d.strip()]
 
+        # 중복 기사 판정 기준 (MinHash 추정 유사도, 0이면 중복 제거 비활성화)
+        self.DEDUP_SIMILARITY = float(os.getenv("DEDUP_SIMILARITY", "0.7"))
+
+        # API 요청 제한 (분당 요청 수 / 월간 할당량, 0이면 제한 없음)
+        # 기본값은 무료 플랜 기준 (Tavily 월 1,000건, Gemini 분당 10회)
+        self.TAVILY_RATE_PER_MINUTE = int(os.getenv("TAVILY_RATE_PER_MINUTE", "60"))
+        self.TAVILY_MONTHLY_QUOTA = int(os.getenv("TAVILY_MONTHLY_QUOTA", "1000"))
+        self.GEMINI_RATE_PER_MINUTE = int(os.getenv("GEMINI_RATE_PER_MINUTE", "10"))
+        self.GEMINI_MONTHLY_QUOTA = int(os.getenv("GEMINI_MONTHLY_QUOTA", "0"))
+        # 한도 초과 시 대기할 최대 시간(초)
+        self.RATE_LIMIT_MAX_WAIT = float(os.getenv("RATE_LIMIT_MAX_WAIT", "10"))
+        # 사용량을 파일에 기록하여 재시작 후에도 월간 한도를 이어 세고, 여러 프로세스가 한도를 공유합니다
+        # (비워두면 프로세스 메모리에만 저장)
+        self.RATE_LIMIT_STATE_PATH = os.getenv("RATE_LIMIT_STATE_PATH", "data/rate_limit_state.json")
+
+        # 재시도 및 서킷 브레이커 (429/5xx 발생 시)
+        self.SEARCH_MAX_ATTEMPTS = int(os.getenv("SEARCH_MAX_ATTEMPTS", "3"))
+        self.RETRY_BASE_DELAY = float(os.getenv("RETRY_BASE_DELAY", "0.5"))
+        self.RETRY_MAX_DELAY = float(os.getenv("RETRY_MAX_DELAY", "8"))
+        self.BREAKER_FAILURE_THRESHOLD = int(os.getenv("BREAKER_FAILURE_THRESHOLD", "5"))
+        self.BREAKER_RECOVERY_SECONDS = float(os.getenv("BREAKER_RECOVERY_SECONDS", "30"))
+
+        # AI 요약을 생성되는 대로 화면에 표시할지 여부
+        self.STREAM_SUMMARY = os.getenv("STREAM_SUMMARY", "true").lower() == "true"
+
+        # 요약 프롬프트 입력 토큰 예산 (0이면 제한 없음)과 토큰 수 측정 방식 ("local" 추정 / "api" count_tokens)
+        self.SUMMARY_INPUT_TOKEN_BUDGET = int(os.getenv("SUMMARY_INPUT_TOKEN_BUDGET", "4000"))
+        self.PROMPT_TOKEN_COUNTER = os.getenv("PROMPT_TOKEN_COUNTER", "local")
+
+        # map-reduce 요약 (기사 수가 THRESHOLD를 넘으면 CHUNK_SIZE씩 나누어 WORKERS개 병렬 요약 후 합침, 0이면 사용 안 함)
+        self.MAP_REDUCE_THRESHOLD = int(os.getenv("MAP_REDUCE_THRESHOLD", "12"))
+        self.MAP_REDUCE_CHUNK_SIZE = int(os.getenv("MAP_REDUCE_CHUNK_SIZE", "8"))
+        self.MAP_REDUCE_WORKERS = int(os.getenv("MAP_REDUCE_WORKERS", "4"))
+        # 일괄 요약 시 한 요청에 묶을 최대 키워드 수
+        self.SUMMARY_BATCH_SIZE = int(os.getenv("SUMMARY_BATCH_SIZE", "5"))
+        # 사이드바 '검색 결과 수' 슬라이더 최대값 (Tavily는 요청당 최대 20건을 반환하므로 20을 넘지 않음)
+        # MAP_REDUCE_THRESHOLD보다 커야 map-reduce 요약이 실제로 사용됩니다
+        self.MAX_NUM_RESULTS = min(int(os.getenv("MAX_NUM_RESULTS", "20")), 20)
+        # 뉴스 목록 한 페이지에 표시할 기사 수
+        self.NEWS_PAGE_SIZE = int(os.getenv("NEWS_PAGE_SIZE", "10"))
+
+        # AI 요약 캐시 (메모리 LRU 항목 수 / 디스크 저장 폴더, 비워두면 메모리만 사용)
+        self.SUMMARY_CACHE_SIZE = int(os.getenv("SUMMARY_CACHE_SIZE", "256"))
+        self.SUMMARY_CACHE_DIR = os.getenv("SUMMARY_CACHE_DIR", "data/summary_cache")
+
+        # 예열한 뉴스 검색 결과 보관 (TTL(초) 안의 첫 대화형 검색에 한 번 사용, 0이면 사용 안 함)
+        self.SEARCH_CACHE_TTL_SECONDS = float(os.getenv("SEARCH_CACHE_TTL_SECONDS", "900"))
+        self.SEARCH_CACHE_SIZE = int(os.getenv("SEARCH_CACHE_SIZE", "128"))
+
+        # 시작 시 캐시 예열 (최근 WARMUP_DAYS일 동안 많이 검색된 키워드 상위 WARMUP_KEYWORDS개, 0이면 사용 안 함)
+        self.WARMUP_KEYWORDS = int(os.getenv("WARMUP_KEYWORDS", "5"))
+        self.WARMUP_DAYS = int(os.getenv("WARMUP_DAYS", "7"))
+        self.WARMUP_NUM_RESULTS = int(os.getenv("WARMUP_NUM_RESULTS", "5"))
+        self.WARMUP_CONCURRENCY = int(os.getenv("WARMUP_CONCURRENCY", "2"))
+        # 예열 한 번에 사용할 최대 API 호출 수 / 월간 한도가 이만큼 남아 있어야 예열
+        self.WARMUP_MAX_CALLS = int(os.getenv("WARMUP_MAX_CALLS", "10"))
+        self.WARMUP_MIN_QUOTA_REMAINING = int(os.getenv("WARMUP_MIN_QUOTA_REMAINING", "100"))
+
+        # 백그라운드 작업 (검색+요약을 스크립트 실행과 분리된 스레드 풀에서 실행)
+        self.JOB_WORKERS = int(os.getenv("JOB_WORKERS", "4"))
+        self.JOB_RETENTION_SECONDS = float(os.getenv("JOB_RETENTION_SECONDS", "3600"))
+        # 화면이 작업 진행 상황을 확인하는 주기(초)
+        self.JOB_POLL_SECONDS = float(os.getenv("JOB_POLL_SECONDS", "1"))
+
+        # 트렌드 집계 파일 (저장할 때마다 갱신, 없으면 기존 기록으로 한 번 생성)
+        self.TRENDS_PATH = os.getenv("TRENDS_PATH", "data/trends.json")
+
+        # 단계별 소요 시간 측정 (메모리 보관 개수 / JSONL 로그 경로, 비워두면 파일 기록 안 함)
+        self.TIMING_BUFFER_SIZE = int(os.getenv("TIMING_BUFFER_SIZE", "2000"))
+        self.TIMING_LOG_PATH = os.getenv("TIMING_LOG_PATH", "")
+
+        # HTTP API 서버 (api_server.py)
+        self.API_HOST = os.getenv("API_HOST", "127.0.0.1")
+        self.API_PORT = int(os.getenv("API_PORT", "8080"))
+        # 검색/요약/CSV 조회를 실행할 스레드 수
+        self.API_WORKERS = int(os.getenv("API_WORKERS", "8"))
+
+        # 워치리스트 스케줄러 (scheduler.py)
+        self.WATCHLIST_PATH = os.getenv("WATCHLIST_PATH", "data/watchlist.json")
+        self.SCHEDULER_STATE_PATH = os.getenv("SCHEDULER_STATE_PATH", "data/scheduler_state.json")
+        self.SCHEDULER_WORKERS = int(os.getenv("SCHEDULER_WORKERS", "2"))
+        self.SCHEDULER_JITTER_SECONDS = float(os.getenv("SCHEDULER_JITTER_SECONDS", "60"))
+        self.SCHEDULER_TICK_SECONDS = float(os.getenv("SCHEDULER_TICK_SECONDS", "10"))
+
     def __repr__(self):
         return f"<Settings(model={self.GEMINI_MODEL}, domains={len(self.SEARCH_DOMAINS)})>"
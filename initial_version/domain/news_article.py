@@ -1,5 +1,5 @@
-from dataclasses import dataclass
-from typing import Optional
+from dataclasses import dataclass, field
+from typing import List, Optional
 
 @dataclass
 class NewsArticle:
@@ -8,3 +8,4 @@ class NewsArticle:
     url: str
     snippet: str
     pub_date: Optional[str] = None
+    alternate_urls: List[str] = field(default_factory=list)  # 같은 기사의 다른 출처 URL
@@ -1,9 +1,11 @@
 from dataclasses import dataclass
 from datetime import datetime
-from typing import List
-import pandas as pd
+from typing import TYPE_CHECKING, List, Optional
 from .news_article import NewsArticle
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 @dataclass
 class SearchResult:
     """검색 결과 및 AI 요약 정보를 담는 데이터 클래스"""
@@ -12,12 +14,16 @@ class SearchResult:
     keyword: str             # 검색 키워드
     articles: List[NewsArticle] # 뉴스 기사 리스트
     ai_summary: str          # AI 요약 결과
+    summary_version: int = 1                # 요약 버전 (증분 요약할 때마다 1씩 증가)
+    summary_base_key: Optional[str] = None  # 이 요약이 이어받은 이전 요약의 search_key
 
-    def to_dataframe(self) -> pd.DataFrame:
+    def to_dataframe(self) -> "pd.DataFrame":
         """
         검색 결과를 Pandas DataFrame으로 변환합니다.
         기사 1건이 1행이 되는 Long format으로 변환합니다.
         """
+        import pandas as pd  # 저장할 때만 필요하므로 사용 시점에 불러옴
+
         data = []
         for i, article in enumerate(self.articles, 1):
             data.append({
@@ -29,14 +35,18 @@ class SearchResult:
                 "url": article.url,
                 "snippet": article.snippet,
                 "pub_date": article.pub_date,
-                "ai_summary": self.ai_summary
+                "alternate_urls": " ".join(article.alternate_urls),
+                "ai_summary": self.ai_summary,
+                "summary_version": self.summary_version,
+                "summary_base_key": self.summary_base_key
             })
         
         # 기사가 없는 경우에 대비하여 빈 리스트 처리
         if not data:
             return pd.DataFrame(columns=[
                 "search_key", "search_time", "keyword", "article_index",
-                "title", "url", "snippet", "pub_date", "ai_summary"
+                "title", "url", "snippet", "pub_date", "alternate_urls", "ai_summary",
+                "summary_version", "summary_base_key"
             ])
             
         return pd.DataFrame(data)
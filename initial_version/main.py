@@ -1,5 +1,199 @@
+import argparse
+import json
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import asdict
+from typing import Dict, Iterable, List, Optional, TextIO
+from config.settings import Settings
+from domain.search_result import SearchResult
+from repositories.search_repository import SearchRepository
+from services.pipeline_service import run_batch_pipeline, run_incremental_pipeline, run_search_pipeline
+from services.trend_service import attach_trend_tracking
+from utils.exceptions import AppError
+from utils.input_handler import preprocess_keyword
+from utils.timing import configure_timing
+
+
+def read_keywords(lines: Iterable[str]) -> List[str]:
+    """키워드 목록을 읽습니다. 빈 줄과 '#' 주석은 건너뛰고, 중복은 처음 한 번만 남깁니다."""
+    keywords = []
+    seen = set()
+    for line in lines:
+        if line.lstrip().startswith("#"):
+            continue
+        keyword = preprocess_keyword(line)
+        if keyword and keyword not in seen:
+            seen.add(keyword)
+            keywords.append(keyword)
+    return keywords
+
+
+class BatchReporter:
+    """키워드별 처리 결과를 출력(JSONL)하고 처리량 통계를 모읍니다. 여러 스레드에서 호출됩니다."""
+
+    def __init__(self, total: int, jsonl_out: Optional[TextIO]):
+        self.total = total
+        self.jsonl_out = jsonl_out
+        self.ok = 0
+        self.empty = 0
+        self.failed = 0
+        self.articles = 0
+        self.started = time.monotonic()
+        self._lock = threading.Lock()
+
+    def report(self, keyword: str, result: Optional[SearchResult] = None, error: Optional[str] = None, elapsed: float = 0.0):
+        with self._lock:
+            if error:
+                self.failed += 1
+            elif not result.articles:
+                self.empty += 1
+            else:
+                self.ok += 1
+                self.articles += len(result.articles)
+
+            done = self.ok + self.empty + self.failed
+            status = f"실패({error})" if error else f"기사 {len(result.articles)}건"
+            print(f"[{done}/{self.total}] {keyword}: {status} ({elapsed:.1f}초)", file=sys.stderr)
+
+            if self.jsonl_out:
+                entry = {"keyword": keyword, "error": error, "elapsed_ms": round(elapsed * 1000)}
+                if result is not None:
+                    entry.update(asdict(result))
+                self.jsonl_out.write(json.dumps(entry, ensure_ascii=False, default=str) + "\n")
+                self.jsonl_out.flush()
+
+    def summary(self) -> Dict[str, float]:
+        elapsed = time.monotonic() - self.started
+        return {
+            "keywords": self.total,
+            "ok": self.ok,
+            "empty": self.empty,
+            "failed": self.failed,
+            "articles": self.articles,
+            "elapsed_seconds": round(elapsed, 2),
+            "keywords_per_minute": round((self.ok + self.empty + self.failed) / elapsed * 60, 1) if elapsed else 0.0,
+        }
+
+
+def run_each(keywords: List[str], args, repository: Optional[SearchRepository], reporter: BatchReporter):
+    """키워드마다 검색 → 요약 → 저장을 concurrency 개씩 동시에 실행합니다."""
+    def run(keyword: str):
+        started = time.monotonic()
+        try:
+            if args.incremental:
+                result, _ = run_incremental_pipeline(keyword, args.num_results, repository)
+            else:
+                result = run_search_pipeline(keyword, args.num_results, repository)
+            reporter.report(keyword, result, elapsed=time.monotonic() - started)
+        except AppError as e:
+            reporter.report(keyword, error=e.error_type, elapsed=time.monotonic() - started)
+        except Exception as e:
+            reporter.report(keyword, error=str(e), elapsed=time.monotonic() - started)
+
+    with ThreadPoolExecutor(max_workers=max(1, args.concurrency)) as executor:
+        for future in as_completed([executor.submit(run, k) for k in keywords]):
+            future.result()
+
+
+def run_batched(keywords: List[str], args, repository: Optional[SearchRepository], reporter: BatchReporter):
+    """키워드를 batch_size 개씩 묶어 검색은 병렬로, 요약은 한 요청으로 처리합니다. (Gemini 호출 수 절감)"""
+    for start in range(0, len(keywords), args.batch_size):
+        group = keywords[start:start + args.batch_size]
+        started = time.monotonic()
+        try:
+            results = run_batch_pipeline([(k, args.num_results) for k in group], repository, args.concurrency)
+            error = None
+        except AppError as e:
+            # 일괄 요약이 실패해 키워드별 요약으로 대체하다 한도 초과 등이 난 경우 - 이 묶음만 실패로 기록하고 계속
+            results, error = {}, e.error_type
+        except Exception as e:
+            results, error = {}, str(e)
+        elapsed = time.monotonic() - started
+        for keyword in group:
+            if keyword in results:
+                reporter.report(keyword, results[keyword], elapsed=elapsed)
+            else:
+                reporter.report(keyword, error=error or "search_failed", elapsed=elapsed)
+
+
 def main():
-    print("Hello from initial-version!")
+    """
+    키워드 목록을 브라우저 없이 한꺼번에 검색 → 요약 → 저장합니다. (cron 대량 갱신/백필용)
+
+    사용 예시:
+        uv run python main.py AI 반도체 전기차
+        uv run python main.py --file keywords.txt --concurrency 4
+        cat keywords.txt | uv run python main.py --jsonl results.jsonl --no-save
+        uv run python main.py --file keywords.txt --incremental
+        uv run python main.py --file keywords.txt --batch-size 5
+    """
+    parser = argparse.ArgumentParser(
+        description="TrendTracker 일괄 검색 CLI",
+        epilog="Gemini 분당 한도에 걸리면 RATE_LIMIT_MAX_WAIT(초)를 늘리거나 --batch-size로 요약 요청을 묶으세요."
+    )
+    parser.add_argument("keywords", nargs="*", help="검색할 키워드 (없으면 --file 또는 표준 입력에서 한 줄에 하나씩 읽음)")
+    parser.add_argument("--file", "-f", help="키워드 파일 경로 (한 줄에 하나, '#'으로 시작하면 주석, '-'는 표준 입력)")
+    parser.add_argument("--num-results", "-n", type=int, default=5, help="키워드별 기사 수 (기본값: 5)")
+    parser.add_argument("--concurrency", "-c", type=int, default=2, help="동시에 처리할 키워드 수 (기본값: 2)")
+    parser.add_argument("--incremental", action="store_true", help="이미 검색한 키워드는 새 기사만 가져와 이전 결과에 합침")
+    parser.add_argument("--batch-size", type=int, default=0, help="지정하면 키워드를 이 개수씩 묶어 한 요청으로 요약")
+    parser.add_argument("--jsonl", metavar="PATH", help="결과를 JSONL로 기록 ('-'는 표준 출력)")
+    parser.add_argument("--no-save", action="store_true", help="리포지토리(CSV)에 저장하지 않음 (--jsonl과 함께 사용)")
+    args = parser.parse_args()
+
+    if args.incremental and (args.batch_size or args.no_save):
+        parser.error("--incremental은 이전 결과를 저장소에서 읽고 저장하므로 --batch-size, --no-save와 함께 쓸 수 없습니다.")
+    if args.no_save and not args.jsonl:
+        parser.error("--no-save를 쓰면 결과가 남지 않습니다. --jsonl로 출력 위치를 지정하세요.")
+
+    if args.file and args.file != "-":
+        with open(args.file, encoding="utf-8") as f:
+            keywords = read_keywords(f)
+    elif args.file == "-" or not args.keywords:
+        keywords = read_keywords(sys.stdin)
+    else:
+        keywords = read_keywords(args.keywords)
+    if not keywords:
+        parser.error("처리할 키워드가 없습니다.")
+
+    try:
+        settings = Settings()
+    except ValueError as e:
+        print(e, file=sys.stderr)
+        sys.exit(2)
+    configure_timing(settings)
+    repository = None
+    if not args.no_save:
+        repository = SearchRepository(settings.CSV_PATH)
+        attach_trend_tracking(repository, settings.TRENDS_PATH)
+
+    jsonl_out = None
+    if args.jsonl == "-":
+        jsonl_out = sys.stdout
+    elif args.jsonl:
+        jsonl_out = open(args.jsonl, "a", encoding="utf-8")
+
+    reporter = BatchReporter(len(keywords), jsonl_out)
+    try:
+        if args.batch_size > 0:
+            run_batched(keywords, args, repository, reporter)
+        else:
+            run_each(keywords, args, repository, reporter)
+    except KeyboardInterrupt:
+        print("중단되었습니다.", file=sys.stderr)
+    finally:
+        if jsonl_out and jsonl_out is not sys.stdout:
+            jsonl_out.close()
+
+    stats = reporter.summary()
+    print(
+        f"완료: 키워드 {stats['keywords']}개 중 성공 {stats['ok']}, 결과 없음 {stats['empty']}, 실패 {stats['failed']} · "
+        f"기사 {stats['articles']}건 · {stats['elapsed_seconds']}초 ({stats['keywords_per_minute']}개/분)",
+        file=sys.stderr
+    )
+    sys.exit(1 if stats["failed"] else 0)
 
 
 if __name__ == "__main__":
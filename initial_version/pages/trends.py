@@ -0,0 +1,73 @@
+import streamlit as st
+from services.trend_service import get_trend_store
+from utils.app_cache import get_settings, get_repository
+
+
+def main():
+    st.set_page_config(
+        page_title="TrendTracker - 트렌드",
+        page_icon="📈",
+        layout="wide"
+    )
+
+    try:
+        settings = get_settings()
+    except ValueError as e:
+        st.error(str(e))
+        st.stop()
+
+    # 저장 리스너(집계 갱신)가 등록된 리포지토리를 준비하고, 집계 파일이 없으면 기존 기록으로 생성
+    repository = get_repository(settings.CSV_PATH, settings.TRENDS_PATH)
+    store = get_trend_store(settings.TRENDS_PATH)
+    with st.spinner("검색 기록을 집계하는 중..."):
+        store.ensure_built(repository)
+
+    st.title("📈 키워드 트렌드")
+    st.markdown("저장된 검색 기록을 바탕으로 키워드별 검색량, 언론사별 기사 수, 반복해서 등장한 기사를 보여줍니다.")
+
+    totals = store.totals()
+    if not totals["searches"]:
+        st.info("💡 아직 집계할 검색 기록이 없습니다. 메인 화면에서 검색을 먼저 실행해보세요.")
+        return
+
+    col1, col2, col3, col4 = st.columns(4)
+    col1.metric("전체 검색", f"{totals['searches']:,}회")
+    col2.metric("수집 기사", f"{totals['articles']:,}건")
+    col3.metric("키워드", f"{totals['keywords']:,}개")
+    col4.metric("언론사", f"{totals['domains']:,}곳")
+
+    days = st.radio("기간", options=[7, 30, 90], index=1, format_func=lambda d: f"최근 {d}일", horizontal=True)
+    top = st.slider("표시할 키워드 수", min_value=1, max_value=10, value=5)
+
+    # 1. 키워드별 일별 검색 수
+    st.subheader("🔍 키워드별 검색 추이")
+    day_list, series = store.keyword_series(days=days, top=top)
+    if series:
+        st.line_chart({keyword: dict(zip(day_list, counts)) for keyword, counts in series.items()})
+    else:
+        st.caption("선택한 기간에 검색 기록이 없습니다.")
+
+    left, right = st.columns(2)
+
+    # 2. 언론사(도메인)별 기사 수
+    with left:
+        st.subheader("📰 언론사별 기사 수")
+        domains = store.domain_counts(days=days, top=10)
+        if domains:
+            st.bar_chart({"기사 수": dict(domains)}, horizontal=True)
+        else:
+            st.caption("선택한 기간에 수집한 기사가 없습니다.")
+
+    # 3. 여러 번 검색 결과에 등장한 기사
+    with right:
+        st.subheader("🔁 반복 등장 기사")
+        urls = store.top_urls(days=days, top=10)
+        if urls:
+            for item in urls:
+                st.markdown(f"**{item['count']}회** · [{item['title']}]({item['url']})")
+                st.caption(f"마지막 등장: {item['last_seen']}")
+        else:
+            st.caption("선택한 기간에 두 번 이상 등장한 기사가 없습니다.")
+
+
+main()
@@ -1,24 +1,60 @@
+import csv
 import os
-import pandas as pd
-from typing import List, Optional
+import threading
+from contextlib import contextmanager
+from collections import Counter
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Callable, Dict, Iterator, List, Optional, Set, Tuple
 from domain.search_result import SearchResult
 from domain.news_article import NewsArticle
+from utils.date_parser import parse_pub_date
+from utils.key_generator import generate_search_key, is_search_key
+from utils.timing import timed
+
+# pandas는 무거우므로(수백 ms) DataFrame이 필요한 메서드에서만 불러옵니다.
+if TYPE_CHECKING:
+    import pandas as pd
+
+try:
+    import fcntl  # 여러 프로세스(앱, 스케줄러)가 같은 CSV에 쓸 때 사용 (Windows에는 없음)
+except ImportError:  # pragma: no cover
+    fcntl = None
+
+# 같은 프로세스 안의 여러 스레드가 동시에 저장할 때 데이터가 덮어써지지 않도록 보호
+_save_lock = threading.Lock()
 
 class SearchRepository:
     """CSV 파일을 사용하여 검색 기록을 관리하는 리포지토리 클래스"""
     
     CSV_COLUMNS = [
         "search_key", "search_time", "keyword", "article_index", 
-        "title", "url", "snippet", "pub_date", "ai_summary"
+        "title", "url", "snippet", "pub_date", "alternate_urls", "ai_summary",
+        "summary_version", "summary_base_key"
     ]
 
     def __init__(self, csv_path: str):
         self.csv_path = csv_path
         # 데이터 폴더가 없으면 생성
         os.makedirs(os.path.dirname(self.csv_path), exist_ok=True)
+        # 저장 성공 후 호출할 함수 목록 (캐시 무효화 등)
+        self._save_listeners: List[Callable[[SearchResult], None]] = []
+
+    def add_save_listener(self, listener: Callable[[SearchResult], None]):
+        """저장이 성공할 때마다 저장된 SearchResult로 호출될 함수를 등록합니다."""
+        self._save_listeners.append(listener)
 
-    def load(self) -> pd.DataFrame:
+    def get_version(self) -> int:
+        """CSV 파일의 수정 시각(ns)을 반환합니다. 다른 프로세스의 저장도 감지할 수 있는 캐시 키로 사용합니다."""
+        try:
+            return os.stat(self.csv_path).st_mtime_ns
+        except OSError:
+            return 0
+
+    @timed("repo.load")
+    def load(self) -> "pd.DataFrame":
         """CSV 파일에서 데이터를 로드합니다. 파일이 없으면 빈 DataFrame을 반환합니다."""
+        import pandas as pd
+
         if not os.path.exists(self.csv_path):
             return pd.DataFrame(columns=self.CSV_COLUMNS)
         
@@ -32,8 +68,37 @@ class SearchRepository:
             print(f"파일 로드 중 오류 발생: {e}")
             return pd.DataFrame(columns=self.CSV_COLUMNS)
 
+    @contextmanager
+    def _write_lock(self):
+        """읽기-수정-쓰기 구간을 스레드/프로세스 간에 직렬화합니다."""
+        with _save_lock:
+            if not fcntl:
+                yield
+                return
+            with open(f"{self.csv_path}.lock", "w") as lock_file:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    @timed("repo.save")
     def save(self, search_result: SearchResult) -> bool:
         """검색 결과를 CSV 파일에 추가 저장합니다."""
+        with self._write_lock():
+            saved = self._save(search_result)
+
+        if saved:
+            for listener in self._save_listeners:
+                try:
+                    listener(search_result)
+                except Exception as e:
+                    print(f"저장 후 처리 중 오류 발생: {e}")
+        return saved
+
+    def _save(self, search_result: SearchResult) -> bool:
+        import pandas as pd
+
         try:
             # 새로운 데이터를 DataFrame으로 변환
             new_df = search_result.to_dataframe()
@@ -47,13 +112,59 @@ class SearchRepository:
             else:
                 final_df = pd.concat([existing_df, new_df], ignore_index=True)
             
-            # CSV로 저장
-            final_df.to_csv(self.csv_path, index=False, encoding='utf-8-sig')
+            self._write_csv(final_df)
             return True
         except Exception as e:
             print(f"파일 저장 중 오류 발생: {e}")
             return False
 
+    def _write_csv(self, df: "pd.DataFrame"):
+        # CSV로 저장 (임시 파일에 쓴 뒤 교체하여, 저장 중에 읽는 쪽이 빈/잘린 파일을 보지 않도록 함)
+        tmp_path = f"{self.csv_path}.tmp"
+        df.to_csv(tmp_path, index=False, encoding='utf-8-sig')
+        os.replace(tmp_path, self.csv_path)
+
+    def migrate_search_keys(self, dry_run: bool = False) -> Dict[str, List[str]]:
+        """
+        이전 형식("키워드-yyyymmddhhmm")의 search_key와 summary_base_key를 ULID 키로 바꿉니다.
+
+        - 같은 분에 저장되어 키가 겹쳤던 기록은 search_time별로 나누어 각각 새 키를 줍니다.
+        - 새 키는 원래 search_time으로 만들므로 키 순서가 저장 시각 순서와 같습니다.
+        - summary_base_key는 같은 이전 키 중 해당 기록보다 앞선 가장 최근 기록의 새 키로 바꿉니다.
+
+        Returns:
+            {이전 키: [새 키, ...] (search_time 순)} - 바꿀 키가 없으면 빈 dict
+        """
+        with self._write_lock():
+            df = self.load()
+            if df.empty:
+                return {}
+
+            legacy = ~df["search_key"].map(is_search_key)
+            mapping: Dict[str, List[Tuple[datetime, str]]] = {}
+            new_keys = df["search_key"].copy()
+            for (old_key, search_time), rows in df[legacy].groupby(["search_key", "search_time"], sort=True):
+                new_key = generate_search_key(search_time.to_pydatetime())
+                mapping.setdefault(old_key, []).append((search_time, new_key))
+                new_keys[rows.index] = new_key
+
+            base_keys = df["summary_base_key"].copy() if "summary_base_key" in df.columns else None
+            if base_keys is not None:
+                for index, base_key in base_keys.items():
+                    if not isinstance(base_key, str) or base_key not in mapping:
+                        continue
+                    candidates = mapping[base_key]
+                    earlier = [key for search_time, key in candidates if search_time <= df.at[index, "search_time"]]
+                    base_keys[index] = earlier[-1] if earlier else candidates[-1][1]
+
+            if mapping and not dry_run:
+                df["search_key"] = new_keys
+                if base_keys is not None:
+                    df["summary_base_key"] = base_keys
+                self._write_csv(df)
+
+        return {old_key: [key for _, key in keys] for old_key, keys in mapping.items()}
+
     def get_all_keys(self) -> List[str]:
         """모든 유니크한 search_key 리스트를 최신순으로 정렬하여 반환합니다."""
         df = self.load()
@@ -66,8 +177,49 @@ class SearchRepository:
         keys = df_sorted["search_key"].drop_duplicates().tolist()
         return keys
 
-    def find_by_key(self, search_key: str) -> Optional[SearchResult]:
-        """search_key에 해당하는 검색 결과를 SearchResult 객체로 복원하여 반환합니다."""
+    def get_key_summaries(self) -> List[Tuple[str, str, datetime]]:
+        """
+        모든 검색 기록의 (search_key, keyword, search_time)을 최신순으로 반환합니다. (기록 목록 표시용)
+        앱 첫 화면에서 호출되므로 pandas 없이 필요한 열만 읽습니다.
+        """
+        if not os.path.exists(self.csv_path):
+            return []
+
+        latest = {}
+        try:
+            with open(self.csv_path, newline="", encoding="utf-8-sig") as f:
+                for row in csv.DictReader(f):
+                    key, search_time = row.get("search_key"), row.get("search_time")
+                    if not key or not search_time:
+                        continue
+                    try:
+                        search_time = datetime.fromisoformat(search_time)
+                    except ValueError:
+                        # 시각이 깨진 행 하나 때문에 기록 목록 전체가 비지 않도록 해당 행만 건너뜀
+                        continue
+                    if key not in latest or search_time > latest[key][1]:
+                        latest[key] = (row.get("keyword") or "", search_time)
+        except (OSError, ValueError, csv.Error) as e:
+            print(f"파일 로드 중 오류 발생: {e}")
+            return []
+
+        summaries = [(key, keyword, search_time) for key, (keyword, search_time) in latest.items()]
+        summaries.sort(key=lambda item: item[2], reverse=True)
+        return summaries
+
+    def get_top_keywords(self, days: int = 7, limit: int = 5) -> List[str]:
+        """최근 days일 동안 가장 많이 검색된 키워드를 검색 횟수 순으로 최대 limit개 반환합니다. (캐시 예열용)"""
+        since = datetime.now() - timedelta(days=days)
+        counts = Counter(keyword for _, keyword, search_time in self.get_key_summaries() if keyword and search_time >= since)
+        return [keyword for keyword, _ in counts.most_common(limit)]
+
+    @timed("repo.find_by_key")
+    def find_by_key(self, search_key: str, follow_base: bool = False) -> Optional[SearchResult]:
+        """
+        search_key에 해당하는 검색 결과를 SearchResult 객체로 복원하여 반환합니다.
+
+        follow_base=True면 증분 검색 기록의 이전 버전 기사까지 합쳐 반환합니다. (요약과 기사 목록이 맞도록, 기록 화면용)
+        """
         df = self.load()
         if df.empty:
             return None
@@ -77,17 +229,39 @@ class SearchRepository:
         if result_df.empty:
             return None
         
+        result = self._to_search_result(search_key, result_df)
+        if follow_base and result.summary_base_key:
+            keyword_df = df[df["keyword"] == result.keyword]
+            self._merge_base_articles(result, dict(list(keyword_df.groupby("search_key", sort=False))))
+        return result
+
+    def iter_all(self) -> Iterator[SearchResult]:
+        """저장된 모든 검색 결과를 저장 순서대로 반환합니다. (CSV를 한 번만 읽음, 집계 재구성용)"""
+        df = self.load()
+        if df.empty:
+            return
+        for search_key, result_df in df.groupby("search_key", sort=False):
+            yield self._to_search_result(search_key, result_df)
+
+    @staticmethod
+    def _to_search_result(search_key: str, result_df: "pd.DataFrame") -> SearchResult:
+        """한 search_key의 행들을 SearchResult 객체로 복원합니다."""
+        import pandas as pd
+
         # 첫 번째 행에서 공통 정보 추출
         first_row = result_df.iloc[0]
         
         # 기사 리스트 복원
         articles = []
         for _, row in result_df.iterrows():
+            # alternate_urls 컬럼이 없던 이전 기록은 NaN으로 읽히므로 문자열일 때만 분리
+            alternate_urls = row.get("alternate_urls")
             articles.append(NewsArticle(
                 title=row["title"],
                 url=row["url"],
                 snippet=row["snippet"],
-                pub_date=row.get("pub_date")
+                pub_date=row.get("pub_date"),
+                alternate_urls=alternate_urls.split() if isinstance(alternate_urls, str) else []
             ))
             
         return SearchResult(
@@ -95,10 +269,99 @@ class SearchRepository:
             search_time=first_row["search_time"],
             keyword=first_row["keyword"],
             articles=articles,
-            ai_summary=first_row["ai_summary"]
+            ai_summary=first_row["ai_summary"],
+            # 이전 기록에는 요약 버전 정보가 없으므로 기본값 사용
+            summary_version=int(first_row["summary_version"]) if pd.notna(first_row.get("summary_version")) else 1,
+            summary_base_key=first_row["summary_base_key"] if isinstance(first_row.get("summary_base_key"), str) else None
         )
 
+    def find_article_by_url(self, url: str) -> Optional[Tuple[str, NewsArticle]]:
+        """
+        URL(다른 출처 URL 포함)로 가장 최근에 저장된 기사를 찾아 (search_key, NewsArticle)로 반환합니다.
+        """
+        df = self.load()
+        if df.empty:
+            return None
+
+        matched = df["url"] == url
+        if "alternate_urls" in df.columns:
+            matched |= df["alternate_urls"].fillna("").astype(str).str.split().apply(lambda urls: url in urls)
+        rows = df[matched]
+        if rows.empty:
+            return None
+
+        row = rows.sort_values(by="search_time", ascending=False).iloc[0]
+        alternate_urls = row.get("alternate_urls")
+        return row["search_key"], NewsArticle(
+            title=row["title"],
+            url=row["url"],
+            snippet=row["snippet"],
+            pub_date=row.get("pub_date") if isinstance(row.get("pub_date"), str) else None,
+            alternate_urls=alternate_urls.split() if isinstance(alternate_urls, str) else []
+        )
+
+    def find_latest_by_keyword(self, keyword: str, follow_base: bool = False) -> Optional[SearchResult]:
+        """
+        해당 키워드로 가장 최근에 저장된 검색 결과를 반환합니다.
+
+        증분 검색은 새 기사(delta)만 저장하므로, follow_base=True면 summary_base_key를 따라가며
+        이전 버전들의 기사까지 합친(최신 기사 우선, URL 중복 제거) 결과를 반환합니다.
+        """
+        df = self.load()
+        if df.empty:
+            return None
+
+        keyword_df = df[df["keyword"] == keyword]
+        if keyword_df.empty:
+            return None
+
+        latest_key = keyword_df.sort_values(by="search_time", ascending=False).iloc[0]["search_key"]
+        groups = dict(list(keyword_df.groupby("search_key", sort=False)))
+        result = self._to_search_result(latest_key, groups[latest_key])
+        if follow_base:
+            self._merge_base_articles(result, groups)
+        return result
+
+    def _merge_base_articles(self, result: SearchResult, groups: Dict[str, "pd.DataFrame"]):
+        """summary_base_key를 따라가며 이전 버전들의 기사를 result 뒤에 합칩니다. (최신 기사 우선, URL 중복 제거)"""
+        seen_urls = {a.url for a in result.articles}
+        visited = {result.search_key}
+        base_key = result.summary_base_key
+        while base_key and base_key not in visited and base_key in groups:
+            visited.add(base_key)
+            base = self._to_search_result(base_key, groups[base_key])
+            for article in base.articles:
+                if article.url not in seen_urls:
+                    seen_urls.add(article.url)
+                    result.articles.append(article)
+            base_key = base.summary_base_key
+
+    def get_seen_articles(self, keyword: str) -> Tuple[Set[str], Optional[datetime]]:
+        """
+        해당 키워드로 저장된 모든 기사의 URL 집합(다른 출처 URL 포함)과
+        가장 최근 발행일(UTC)을 반환합니다. 증분 검색에서 이미 본 기사를 거르는 데 사용합니다.
+        """
+        df = self.load()
+        if df.empty:
+            return set(), None
+
+        keyword_df = df[df["keyword"] == keyword]
+        urls = set(keyword_df["url"].dropna())
+        if "alternate_urls" in keyword_df.columns:
+            for alternates in keyword_df["alternate_urls"].dropna():
+                urls.update(str(alternates).split())
+
+        pub_dates = [d for d in (parse_pub_date(v) for v in keyword_df["pub_date"]) if d]
+        return urls, max(pub_dates) if pub_dates else None
+
     def get_all_as_csv(self) -> str:
         """전체 데이터를 CSV 형식의 문자열로 반환합니다. (다운로드용)"""
-        df = self.load()
-        return df.to_csv(index=False, encoding='utf-8-sig')
+        # 저장 형식 그대로이므로 DataFrame으로 읽지 않고 파일 내용을 반환
+        if not os.path.exists(self.csv_path):
+            return ",".join(self.CSV_COLUMNS) + "\n"
+        try:
+            with open(self.csv_path, encoding="utf-8-sig") as f:
+                return f.read()
+        except OSError as e:
+            print(f"파일 로드 중 오류 발생: {e}")
+            return ",".join(self.CSV_COLUMNS) + "\n"
@@ -0,0 +1,46 @@
+import argparse
+import signal
+from config.settings import Settings
+from repositories.search_repository import SearchRepository
+from services.scheduler_service import WatchlistScheduler
+from services.trend_service import attach_trend_tracking
+from utils.timing import configure_timing
+
+
+def main():
+    """
+    워치리스트 키워드를 주기적으로 갱신하는 헤드리스 스케줄러를 실행합니다.
+
+    사용 예시:
+        uv run python scheduler.py          # 계속 실행
+        uv run python scheduler.py --once   # 모든 키워드를 한 번만 갱신
+    """
+    parser = argparse.ArgumentParser(description="TrendTracker 워치리스트 스케줄러")
+    parser.add_argument("--once", action="store_true", help="모든 키워드를 한 번만 갱신하고 종료합니다.")
+    args = parser.parse_args()
+
+    settings = Settings()
+    configure_timing(settings)
+    repository = SearchRepository(settings.CSV_PATH)
+    attach_trend_tracking(repository, settings.TRENDS_PATH)
+    scheduler = WatchlistScheduler(
+        repository=repository,
+        watchlist_path=settings.WATCHLIST_PATH,
+        state_path=settings.SCHEDULER_STATE_PATH,
+        max_workers=settings.SCHEDULER_WORKERS,
+        jitter_seconds=settings.SCHEDULER_JITTER_SECONDS
+    )
+
+    if args.once:
+        scheduler.run_once()
+        return
+
+    signal.signal(signal.SIGTERM, lambda *_: scheduler.stop())
+    try:
+        scheduler.run_forever(settings.SCHEDULER_TICK_SECONDS)
+    except KeyboardInterrupt:
+        scheduler.stop()
+
+
+if __name__ == "__main__":
+    main()
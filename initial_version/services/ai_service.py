@@ -1,12 +1,201 @@
-from typing import List
-from google import genai
+import hashlib
+import json
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Generator, Iterator, List, Optional, Tuple, TypedDict
 from config.settings import Settings
+from services.clients import get_gemini_client
+from services.model_router import get_model_router, looks_like_summary
 from domain.news_article import NewsArticle
 from utils.exceptions import AppError
+from utils.rate_limiter import get_limiter
+from utils.summary_cache import get_summary_cache, make_summary_key
+from utils.timing import record, span, timed
+from services.prompt_builder import (
+    BuiltPrompt,
+    build_summary_prompt,
+    build_reduce_prompt,
+    build_update_prompt,
+    build_batch_prompt
+)
 
+# 요약 프롬프트 템플릿 버전 (프롬프트를 바꾸면 올려서 이전 캐시를 무효화합니다)
+PROMPT_VERSION = "v1"
+
+EMPTY_SUMMARY = "요약 결과를 생성하지 못했습니다."
+
+
+class KeywordSummary(TypedDict):
+    """일괄 요약 응답 스키마 (키워드별 요약 1건)"""
+
+    keyword: str
+    summary: str
+
+# 최근 요약 요청의 입력 토큰 기록
+_prompt_stats = deque(maxlen=100)
+_stats_lock = threading.Lock()
+
+def _build_prompt(articles: List[NewsArticle], settings: Settings) -> BuiltPrompt:
+    """
+    입력 토큰 예산에 맞춰 요약 요청 프롬프트를 구성합니다.
+    예산이 안내문보다도 작아 기사를 하나도 넣지 못하면, 기사 없는 요약이 캐시/저장되지 않도록 AppError를 발생시킵니다.
+    """
+    prompt = build_summary_prompt(articles, settings.SUMMARY_INPUT_TOKEN_BUDGET)
+    if articles and prompt.included == 0:
+        print(f"SUMMARY_INPUT_TOKEN_BUDGET({settings.SUMMARY_INPUT_TOKEN_BUDGET})이 너무 작아 기사를 프롬프트에 넣을 수 없습니다.")
+        raise AppError("token_budget_too_small")
+    return prompt
+
+def _primary_model(settings: Settings) -> str:
+    """cascade의 첫 모델 (캐시 조회는 이 모델이 만든 요약만 대상으로 함)"""
+    return get_model_router(settings).models[0]
+
+def _cache_key(articles: List[NewsArticle], settings: Settings) -> str:
+    """요약 캐시 키를 만듭니다. (첫 모델 기준)"""
+    # 토큰 예산이 바뀌면 프롬프트(잘린 스니펫)도 달라지므로 키에 포함
+    prompt_version = f"{PROMPT_VERSION}:{settings.SUMMARY_INPUT_TOKEN_BUDGET}"
+    return make_summary_key(_primary_model(settings), prompt_version, articles)
+
+def _cache_summary(cache, key: str, summary: str, model: str, settings: Settings):
+    """
+    첫 모델이 만든 요약만 캐시합니다.
+    조회는 첫 모델 키로만 하므로, 대체 모델의 요약을 넣으면 다시 읽히지 않고 LRU와 디스크만 차지합니다.
+    (대체 모델의 요약이 첫 모델의 요약으로 재사용되지도 않음)
+    """
+    if model == _primary_model(settings):
+        cache.set(key, summary, model)
+
+def _record_prompt(prompt: BuiltPrompt, client, settings: Settings, model: str, response=None):
+    """요청별 입력 토큰 수를 기록합니다. (실제 값은 응답의 usage_metadata 또는 count_tokens API)"""
+    actual = None
+    usage = getattr(response, "usage_metadata", None)
+    if usage is not None:
+        actual = getattr(usage, "prompt_token_count", None)
+    if actual is None and settings.PROMPT_TOKEN_COUNTER == "api":
+        try:
+            actual = client.models.count_tokens(model=model, contents=prompt.text).total_tokens
+        except Exception as e:
+            print(f"토큰 수 확인 중 오류 발생: {e}")
+
+    with _stats_lock:
+        _prompt_stats.append({
+            "estimated_tokens": prompt.token_count,
+            "actual_tokens": actual,
+            "budget": settings.SUMMARY_INPUT_TOKEN_BUDGET,
+            "included": prompt.included,
+            "truncated": prompt.truncated,
+            "dropped": prompt.dropped,
+        })
+
+def get_prompt_stats() -> List[Dict]:
+    """최근 요약 요청들의 입력 토큰 기록을 오래된 순으로 반환합니다."""
+    with _stats_lock:
+        return list(_prompt_stats)
+
+def _to_app_error(e: Exception) -> AppError:
+    """Gemini 호출 중 발생한 예외를 AppError로 변환합니다."""
+    error_str = str(e).lower()
+    if "401" in error_str or "api key" in error_str:
+        return AppError("api_key_invalid")
+    elif "429" in error_str:
+        # Gemini 무료 티어는 분당 요청 제한이 엄격함
+        return AppError("rate_limit_exceeded")
+    elif "400" in error_str:
+        return AppError("bad_request")
+    else:
+        return AppError("ai_error")
+
+def _generate(
+    prompt: BuiltPrompt,
+    settings: Settings,
+    config=None,
+    quality_check=looks_like_summary,
+    start: int = 0
+) -> Tuple[str, str]:
+    """
+    요청 제한을 지키며 모델 cascade로 Gemini를 호출하고 (요약 텍스트, 응답한 모델)을 반환합니다.
+    (빈 응답이면 빈 문자열) 앞 모델이 실패하거나 응답이 quality_check를 통과하지 못하면 다음 모델로 다시 요청합니다.
+    """
+    client = get_gemini_client(settings)
+
+    def call(model: str):
+        # 분당/월간 한도 확인 (한도 초과 시 잠시 대기 후 AppError)
+        get_limiter("gemini", settings).acquire(settings.RATE_LIMIT_MAX_WAIT)
+        with span("gemini", model=model):
+            response = client.models.generate_content(model=model, contents=prompt.text, config=config)
+        _record_prompt(prompt, client, settings, model, response)
+        return response
+
+    try:
+        return get_model_router(settings).generate(call, quality_check, start)
+    except AppError:
+        raise
+    except Exception as e:
+        raise _to_app_error(e)
+
+def _generate_stream(prompt: BuiltPrompt, settings: Settings) -> Generator[str, None, str]:
+    """
+    _generate의 스트리밍 버전입니다. 텍스트 조각을 생성되는 대로 반환하고, 끝나면 응답한 모델을 반환합니다.
+    (model = yield from _generate_stream(...))
+    cascade의 첫 모델로 스트리밍하며, 첫 조각을 받기 전에 실패하면 다음 모델부터 일반 요청으로 대체합니다.
+    """
+    router = get_model_router(settings)
+    model = router.models[0]
+    get_limiter("gemini", settings).acquire(settings.RATE_LIMIT_MAX_WAIT)
+
+    started = time.monotonic()
+    received = []
+    try:
+        client = get_gemini_client(settings)
+        stream = client.models.generate_content_stream(model=model, contents=prompt.text)
+        last_chunk = None
+        for chunk in stream:
+            last_chunk = chunk
+            if chunk.text:
+                if not received:
+                    # 첫 글자가 화면에 나타나기까지의 시간 (TTFT)
+                    record("gemini.first_chunk", (time.monotonic() - started) * 1000, model=model)
+                received.append(chunk.text)
+                yield chunk.text
+        # 스트리밍 응답은 마지막 조각에 사용량 정보가 담깁니다
+        _record_prompt(prompt, client, settings, model, last_chunk)
+    except AppError:
+        raise
+    except Exception as e:
+        router.record(model, time.monotonic() - started, "failure")
+        if received or len(router.models) == 1:
+            raise _to_app_error(e)
+        text, fallback_model = _generate(prompt, settings, start=1)
+        if text:
+            yield text
+        return fallback_model
+
+    record("gemini.stream", (time.monotonic() - started) * 1000, model=model)
+    outcome = "success" if looks_like_summary("".join(received)) else "low_quality"
+    router.record(model, time.monotonic() - started, outcome, last_chunk)
+    return model
+
+def _use_map_reduce(articles: List[NewsArticle], settings: Settings) -> bool:
+    return 0 < settings.MAP_REDUCE_THRESHOLD < len(articles)
+
+def _map_partial_summaries(articles: List[NewsArticle], settings: Settings) -> List[str]:
+    """
+    map 단계: 기사를 MAP_REDUCE_CHUNK_SIZE 개씩 나누어 병렬로 요약합니다.
+    각 묶음은 summarize_news로 요약되므로 묶음 단위 캐시와 요청 제한이 그대로 적용됩니다.
+    """
+    chunk_size = max(1, min(settings.MAP_REDUCE_CHUNK_SIZE, settings.MAP_REDUCE_THRESHOLD))
+    chunks = [articles[i:i + chunk_size] for i in range(0, len(articles), chunk_size)]
+    with ThreadPoolExecutor(max_workers=settings.MAP_REDUCE_WORKERS) as executor:
+        partials = list(executor.map(summarize_news, chunks))
+    return [p for p in partials if p and p != EMPTY_SUMMARY]
+
+@timed("summarize_news")
 def summarize_news(articles: List[NewsArticle]) -> str:
     """
     Google Gemini API를 사용하여 뉴스 기사들을 요약합니다.
+    기사 수가 MAP_REDUCE_THRESHOLD 를 넘으면 map-reduce 방식으로 요약합니다.
     
     Args:
         articles (List[NewsArticle]): 요약할 뉴스 기사 리스트
@@ -21,42 +210,243 @@ def summarize_news(articles: List[NewsArticle]) -> str:
         return "요약할 기사가 없습니다."
 
     settings = Settings()
-    
+
+    # 같은 기사 묶음을 이미 요약했다면 API를 호출하지 않고 캐시에서 반환
+    cache = get_summary_cache(settings)
+    cached = cache.get(_cache_key(articles, settings))
+    if cached is not None:
+        return cached
+
+    if _use_map_reduce(articles, settings):
+        return summarize_news_map_reduce(articles)
+
+    summary, model = _generate(_build_prompt(articles, settings), settings)
+    if not summary:
+        return EMPTY_SUMMARY
+
+    _cache_summary(cache, _cache_key(articles, settings), summary, model, settings)
+    return summary
+
+def summarize_news_map_reduce(articles: List[NewsArticle]) -> str:
+    """
+    많은 기사를 map-reduce 방식으로 요약합니다.
+
+    1. map: 기사를 작은 묶음으로 나누어 병렬로 부분 요약 (호출당 입력 크기가 일정하므로 지연 시간도 일정)
+    2. reduce: 부분 요약들을 한 번 더 요약하여 5개 항목 형식으로 합침
+
+    Raises:
+        AppError: API 키 오류, 할당량 초과 등 발생 시
+    """
+    if not articles:
+        return "요약할 기사가 없습니다."
+
+    settings = Settings()
+    cache = get_summary_cache(settings)
+    cached = cache.get(_cache_key(articles, settings))
+    if cached is not None:
+        return cached
+
+    partials = _map_partial_summaries(articles, settings)
+    if not partials:
+        return EMPTY_SUMMARY
+
+    summary, model = _generate(build_reduce_prompt(partials, settings.SUMMARY_INPUT_TOKEN_BUDGET), settings)
+    if not summary:
+        return EMPTY_SUMMARY
+
+    _cache_summary(cache, _cache_key(articles, settings), summary, model, settings)
+    return summary
+
+def update_summary(
+    previous_summary: str,
+    new_articles: List[NewsArticle],
+    previous_articles: Optional[List[NewsArticle]] = None
+) -> str:
+    """
+    이전 요약에 새 기사만 더해 요약을 갱신합니다. (증분 요약)
+    전체 기사를 다시 요약하는 것보다 입력 토큰과 지연 시간이 새 기사 수에 비례해 줄어듭니다.
+
+    이전 요약이 길어 입력 토큰 예산 안에 새 기사를 모두 넣을 수 없으면, 빠진 기사가 요약에
+    반영된 것으로 기록되지 않도록 새 기사 + previous_articles 전체를 다시 요약(summarize_news)합니다.
+
+    Args:
+        previous_summary (str): 이전 버전의 AI 요약
+        new_articles (List[NewsArticle]): 이전 요약 이후 새로 확인된 기사
+        previous_articles (List[NewsArticle]): 이전 요약에 반영된 기사 (전체 다시 요약할 때 사용)
+
+    Returns:
+        str: 갱신된 요약 (새 기사가 없으면 이전 요약 그대로)
+
+    Raises:
+        AppError: API 키 오류, 할당량 초과 등 발생 시
+    """
+    if not new_articles:
+        return previous_summary
+    if not previous_summary:
+        return summarize_news(new_articles)
+
+    settings = Settings()
+
+    # 같은 (이전 요약, 새 기사) 조합은 캐시에서 반환
+    cache = get_summary_cache(settings)
+    previous_hash = hashlib.sha256(previous_summary.encode("utf-8")).hexdigest()[:16]
+    prompt_version = f"update-{PROMPT_VERSION}:{settings.SUMMARY_INPUT_TOKEN_BUDGET}:{previous_hash}"
+    cached = cache.get(make_summary_key(_primary_model(settings), prompt_version, new_articles))
+    if cached is not None:
+        return cached
+
+    prompt = build_update_prompt(previous_summary, new_articles, settings.SUMMARY_INPUT_TOKEN_BUDGET)
+    if prompt.dropped:
+        new_urls = {a.url for a in new_articles}
+        return summarize_news(new_articles + [a for a in previous_articles or [] if a.url not in new_urls])
+
+    summary, model = _generate(prompt, settings)
+    if not summary:
+        return previous_summary
+
+    _cache_summary(cache, make_summary_key(model, prompt_version, new_articles), summary, model, settings)
+    return summary
+
+def _parse_batch_response(text: str, keywords: List[str]) -> Dict[str, str]:
+    """일괄 요약 JSON 응답을 {키워드: 요약}으로 변환합니다. 형식이 맞지 않는 항목은 무시합니다."""
     try:
-        client = genai.Client(api_key=settings.GEMINI_API_KEY)
-        
-        # 뉴스 목록 구성
-        news_context = ""
-        for i, article in enumerate(articles, 1):
-            news_context += f"{i}. 제목: {article.title}\n   내용: {article.snippet}\n\n"
-            
-        prompt = f"""
-다음 뉴스 기사들의 핵심 내용을 한국어로 요약해주세요:
-- 불릿 포인트 형식으로 최대 5개 항목
-- 각 항목은 1~2문장
-
-[뉴스 목록]
-{news_context}
-"""
-        
-        response = client.models.generate_content(
-            model=settings.GEMINI_MODEL,
-            contents=prompt
-        )
-        
-        if not response or not response.text:
-            return "요약 결과를 생성하지 못했습니다."
-            
-        return response.text
+        data = json.loads(text)
+    except (json.JSONDecodeError, TypeError):
+        return {}
 
-    except Exception as e:
-        error_str = str(e).lower()
-        if "401" in error_str or "api key" in error_str:
-            raise AppError("api_key_invalid")
-        elif "429" in error_str:
-            # Gemini 무료 티어는 분당 요청 제한이 엄격함
-            raise AppError("rate_limit_exceeded")
-        elif "400" in error_str:
-            raise AppError("bad_request")
+    if isinstance(data, dict):
+        # 스키마를 따르지 않고 {키워드: 요약} 형태로 답한 경우도 허용
+        items = [{"keyword": k, "summary": v} for k, v in data.items()]
+    elif isinstance(data, list):
+        items = data
+    else:
+        return {}
+
+    wanted = set(keywords)
+    summaries = {}
+    for item in items:
+        if not isinstance(item, dict):
+            continue
+        keyword, summary = item.get("keyword"), item.get("summary")
+        if keyword in wanted and isinstance(summary, str) and summary.strip():
+            summaries[keyword] = summary
+    return summaries
+
+def summarize_news_batch(article_sets: Dict[str, List[NewsArticle]]) -> Dict[str, str]:
+    """
+    여러 키워드의 기사 목록을 한 번의 요청으로 요약합니다. (대량 갱신용)
+
+    - 공통 안내문을 한 번만 보내고, 응답은 JSON 스키마(키워드별 요약 배열)로 받습니다.
+    - 요청당 최대 SUMMARY_BATCH_SIZE 개 키워드를 묶습니다.
+    - 캐시에 있는 키워드는 요청에서 제외하고, 결과는 키워드별로 summarize_news와 같은 캐시 키에 저장합니다.
+    - 응답 파싱에 실패하거나 빠진 키워드는 summarize_news로 하나씩 다시 요약합니다.
+
+    Args:
+        article_sets (Dict[str, List[NewsArticle]]): {키워드: 기사 리스트}
+
+    Returns:
+        Dict[str, str]: {키워드: 요약}
+
+    Raises:
+        AppError: 개별 요약으로 대체한 요청에서 오류가 발생한 경우
+    """
+    settings = Settings()
+    cache = get_summary_cache(settings)
+    summaries: Dict[str, str] = {}
+    pending: Dict[str, List[NewsArticle]] = {}
+
+    for keyword, articles in article_sets.items():
+        if not articles:
+            summaries[keyword] = "요약할 기사가 없습니다."
+            continue
+        cached = cache.get(_cache_key(articles, settings))
+        if cached is not None:
+            summaries[keyword] = cached
+        elif _use_map_reduce(articles, settings):
+            # 기사가 많은 키워드는 묶지 않고 map-reduce로 요약
+            summaries[keyword] = summarize_news(articles)
         else:
-            raise AppError("ai_error")
+            pending[keyword] = articles
+
+    from google.genai import types  # SDK는 첫 사용 시점에 불러옴
+
+    config = types.GenerateContentConfig(
+        response_mime_type="application/json",
+        response_schema=list[KeywordSummary],
+    )
+    keywords = list(pending)
+    batch_size = max(1, settings.SUMMARY_BATCH_SIZE)
+    for start in range(0, len(keywords), batch_size):
+        batch = {k: pending[k] for k in keywords[start:start + batch_size]}
+        try:
+            text, model = _generate(
+                build_batch_prompt(batch, settings.SUMMARY_INPUT_TOKEN_BUDGET),
+                settings,
+                config,
+                quality_check=lambda t: bool(_parse_batch_response(t, list(batch)))
+            )
+            parsed = _parse_batch_response(text, list(batch))
+        except AppError as e:
+            print(f"일괄 요약 실패, 키워드별 요약으로 대체합니다: {e.error_type}")
+            parsed = {}
+
+        for keyword, articles in batch.items():
+            if keyword in parsed:
+                summaries[keyword] = parsed[keyword]
+                _cache_summary(cache, _cache_key(articles, settings), parsed[keyword], model, settings)
+            else:
+                summaries[keyword] = summarize_news(articles)
+
+    return summaries
+
+def summarize_news_stream(articles: List[NewsArticle]) -> Iterator[str]:
+    """
+    summarize_news의 스트리밍 버전입니다. 요약 텍스트를 생성되는 대로 조각(chunk) 단위로 반환합니다.
+    스트림이 끝나면 전체 요약을 캐시에 저장하며, 캐시에 있으면 전체 요약을 한 번에 반환합니다.
+    map-reduce 대상이면 부분 요약을 먼저 만든 뒤 reduce 단계를 스트리밍합니다.
+
+    Yields:
+        str: 요약 텍스트 조각
+
+    Raises:
+        AppError: API 키 오류, 할당량 초과 등 발생 시
+    """
+    if not articles:
+        yield "요약할 기사가 없습니다."
+        return
+
+    settings = Settings()
+
+    cache = get_summary_cache(settings)
+    cached = cache.get(_cache_key(articles, settings))
+    if cached is not None:
+        yield cached
+        return
+
+    if _use_map_reduce(articles, settings):
+        partials = _map_partial_summaries(articles, settings)
+        if not partials:
+            yield EMPTY_SUMMARY
+            return
+        prompt = build_reduce_prompt(partials, settings.SUMMARY_INPUT_TOKEN_BUDGET)
+    else:
+        prompt = _build_prompt(articles, settings)
+
+    chunks = []
+    stream = _generate_stream(prompt, settings)
+    while True:
+        try:
+            chunk = next(stream)
+        except StopIteration as stop:
+            model = stop.value
+            break
+        chunks.append(chunk)
+        yield chunk
+
+    summary = "".join(chunks)
+    if not summary.strip():
+        # 빈 조각만 받은 경우 빈 요약을 캐시/저장하지 않음
+        yield EMPTY_SUMMARY
+        return
+
+    _cache_summary(cache, _cache_key(articles, settings), summary, model, settings)
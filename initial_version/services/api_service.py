@@ -0,0 +1,344 @@
+import asyncio
+import functools
+import json
+import math
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+from typing import Dict, Optional, Tuple
+from urllib.parse import parse_qs, unquote, urlsplit
+from domain.news_article import NewsArticle
+from domain.search_result import SearchResult
+from repositories.search_repository import SearchRepository
+from services.model_router import get_model_stats
+from services.pipeline_service import get_pipeline_metrics, run_incremental_pipeline, run_search_pipeline
+from services.warmup_service import get_warmup_status
+from utils.exceptions import AppError
+from utils.history_index import HistoryIndex
+from utils.input_handler import preprocess_keyword
+from utils.rate_limiter import get_quota_status
+from utils.retry import get_retry_metrics
+from utils.search_cache import get_search_cache_stats
+from utils.summary_cache import get_summary_cache_stats
+from utils.timing import get_timing_stats, span
+
+# AppError 종류별 HTTP 상태 코드 (목록에 없으면 502)
+ERROR_STATUS = {
+    "empty_input": 400,
+    "bad_request": 400,
+    "rate_limit_exceeded": 429,
+    "monthly_quota_exceeded": 429,
+    "service_unavailable": 503,
+    "token_budget_too_small": 500,
+}
+
+MAX_BODY_BYTES = 64 * 1024
+# 헤더 개수와 전체 크기 상한 (넘으면 431)
+MAX_HEADERS = 100
+MAX_HEADER_BYTES = 16 * 1024
+# 연결 유지(keep-alive) 중 다음 요청을 기다리는 최대 시간(초)
+IDLE_TIMEOUT = 15
+
+
+class HttpError(Exception):
+    """잘못된 요청 등 바로 응답할 오류"""
+
+    def __init__(self, status: int, error: str):
+        super().__init__(error)
+        self.status = status
+        self.error = error
+
+
+def _article_to_dict(article: NewsArticle) -> Dict:
+    return {
+        "title": article.title,
+        "url": article.url,
+        "snippet": article.snippet,
+        # CSV에서 읽은 빈 값은 NaN이므로 문자열일 때만 사용
+        "pub_date": article.pub_date if isinstance(article.pub_date, str) else None,
+        "alternate_urls": article.alternate_urls,
+    }
+
+
+def _json_safe(value):
+    """
+    JSON으로 보낼 수 없는 NaN/Infinity(pandas 빈 값)를 None으로 바꿉니다.
+    (json.dumps는 기본적으로 NaN을 그대로 써서 표준 JSON이 아닌 응답을 만듦)
+    """
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if isinstance(value, dict):
+        return {k: _json_safe(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_json_safe(v) for v in value]
+    return value
+
+
+def _result_to_dict(result: SearchResult) -> Dict:
+    return {
+        "search_key": result.search_key,
+        "search_time": result.search_time.isoformat(),
+        "keyword": result.keyword,
+        "ai_summary": result.ai_summary,
+        "summary_version": result.summary_version,
+        "summary_base_key": result.summary_base_key,
+        "articles": [_article_to_dict(a) for a in result.articles],
+    }
+
+
+class ApiServer:
+    """
+    검색/요약/기록 조회를 제공하는 비동기 HTTP API 서버입니다. (표준 라이브러리 asyncio 기반)
+
+    - 연결 처리는 이벤트 루프 하나가 담당하고, 검색·요약·CSV 조회처럼 블로킹되는 작업은 스레드 풀에서 실행합니다.
+    - 앱과 같은 서비스 함수를 사용하므로 요청 제한, 서킷 브레이커, 요약 캐시, 동시 요청 합치기가 그대로 적용됩니다.
+    - 기록 조회 결과는 CSV 버전(수정 시각)별로 캐시하여, 저장이 없는 동안에는 CSV를 다시 읽지 않습니다.
+
+    엔드포인트:
+        GET  /health                       상태 확인
+        GET  /metrics                      한도/재시도/캐시/단계별 소요 시간 통계
+        POST /search                       {"keyword", "num_results", "incremental"} 검색 → 요약 → 저장
+        GET  /search?keyword=...           위와 같음
+        GET  /history?prefix=&page=&page_size=   검색 기록 목록 (최신순)
+        GET  /history/{search_key}         검색 결과 1건
+        GET  /articles?url=...             URL로 저장된 기사 조회
+    """
+
+    def __init__(self, repository: SearchRepository, settings, max_workers: int = 8, read_cache_size: int = 512):
+        self.repository = repository
+        self.settings = settings
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="api")
+        # (CSV 버전, 종류, 인자) → 조회 결과 (이벤트 루프 스레드에서만 접근)
+        self._read_cache: OrderedDict = OrderedDict()
+        self._read_cache_size = read_cache_size
+        self.stats = {"requests": 0, "errors": 0, "in_flight": 0, "read_cache_hits": 0, "read_cache_misses": 0}
+
+    async def _run_blocking(self, fn, *args):
+        return await asyncio.get_running_loop().run_in_executor(self._executor, fn, *args)
+
+    async def _cached_read(self, kind: str, arg, fn):
+        """CSV 버전별로 조회 결과를 캐시합니다. 버전이 바뀌면(저장 발생) 자연히 새로 읽습니다."""
+        key = (self.repository.get_version(), kind, arg)
+        if key in self._read_cache:
+            self._read_cache.move_to_end(key)
+            self.stats["read_cache_hits"] += 1
+            return self._read_cache[key]
+
+        self.stats["read_cache_misses"] += 1
+        value = await self._run_blocking(fn)
+        self._read_cache[key] = value
+        if len(self._read_cache) > self._read_cache_size:
+            self._read_cache.popitem(last=False)
+        return value
+
+    # ---------- 엔드포인트 ----------
+
+    async def _search(self, params: Dict) -> Dict:
+        keyword = preprocess_keyword(str(params.get("keyword") or ""))
+        if not keyword:
+            raise AppError("empty_input")
+        try:
+            num_results = int(params.get("num_results", 5))
+        except (TypeError, ValueError):
+            raise AppError("bad_request")
+        if not 1 <= num_results <= self.settings.MAX_NUM_RESULTS:
+            raise AppError("bad_request")
+        incremental = str(params.get("incremental", "false")).lower() in ("1", "true", "yes")
+
+        if incremental:
+            result, new_count = await self._run_blocking(run_incremental_pipeline, keyword, num_results, self.repository)
+        else:
+            # 대화형 검색이므로 예열된 결과가 있으면 한 번 사용
+            result = await self._run_blocking(
+                functools.partial(run_search_pipeline, keyword, num_results, self.repository, use_cache=True)
+            )
+            new_count = len(result.articles)
+        return {**_result_to_dict(result), "new_count": new_count}
+
+    async def _history_list(self, params: Dict) -> Dict:
+        index = await self._cached_read(
+            "history_index", None,
+            lambda: HistoryIndex(self.repository.get_key_summaries())
+        )
+        try:
+            page = max(1, int(params.get("page", 1)))
+            page_size = min(100, max(1, int(params.get("page_size", 20))))
+        except ValueError:
+            raise AppError("bad_request")
+
+        matched = index.search(params.get("prefix", ""))
+        return {
+            "total": len(matched),
+            "page": page,
+            "page_size": page_size,
+            "items": [
+                {"search_key": key, "label": index.label(key)}
+                for key in HistoryIndex.page(matched, page, page_size)
+            ],
+        }
+
+    async def _history_item(self, search_key: str) -> Dict:
+        result = await self._cached_read("result", search_key, lambda: self.repository.find_by_key(search_key, follow_base=True))
+        if result is None:
+            raise HttpError(404, "not_found")
+        return _result_to_dict(result)
+
+    async def _article(self, params: Dict) -> Dict:
+        url = params.get("url")
+        if not url:
+            raise AppError("bad_request")
+        found = await self._cached_read("article", url, lambda: self.repository.find_article_by_url(url))
+        if found is None:
+            raise HttpError(404, "not_found")
+        search_key, article = found
+        return {"search_key": search_key, "article": _article_to_dict(article)}
+
+    def _metrics(self) -> Dict:
+        return {
+            "server": dict(self.stats),
+            "quota": get_quota_status(self.settings),
+            "retry": get_retry_metrics(),
+            "pipeline": get_pipeline_metrics(),
+            "summary_cache": get_summary_cache_stats(),
+            "search_cache": get_search_cache_stats(),
+            "warmup": get_warmup_status(),
+            "models": get_model_stats(),
+            "timing": get_timing_stats(),
+        }
+
+    async def _dispatch(self, method: str, target: str, body: bytes) -> Tuple[int, Dict]:
+        parts = urlsplit(target)
+        path = parts.path.rstrip("/") or "/"
+        params = {k: v[-1] for k, v in parse_qs(parts.query).items()}
+
+        if path == "/health":
+            return 200, {"status": "ok"}
+        if path == "/metrics":
+            return 200, self._metrics()
+        if path == "/search":
+            if method == "POST":
+                try:
+                    payload = json.loads(body or b"{}")
+                except json.JSONDecodeError:
+                    raise HttpError(400, "invalid_json")
+                if not isinstance(payload, dict):
+                    raise HttpError(400, "invalid_json")
+                params.update(payload)
+            elif method != "GET":
+                raise HttpError(405, "method_not_allowed")
+            return 200, await self._search(params)
+
+        if method != "GET":
+            raise HttpError(405, "method_not_allowed")
+        if path == "/history":
+            return 200, await self._history_list(params)
+        if path.startswith("/history/"):
+            return 200, await self._history_item(unquote(path[len("/history/"):]))
+        if path == "/articles":
+            return 200, await self._article(params)
+        raise HttpError(404, "not_found")
+
+    async def _respond(self, method: str, target: str, body: bytes) -> Tuple[int, Dict]:
+        self.stats["requests"] += 1
+        self.stats["in_flight"] += 1
+        try:
+            with span("api.request", method=method, path=urlsplit(target).path):
+                return await self._dispatch(method, target, body)
+        except HttpError as e:
+            self.stats["errors"] += 1
+            return e.status, {"error": e.error}
+        except AppError as e:
+            self.stats["errors"] += 1
+            return ERROR_STATUS.get(e.error_type, 502), {"error": e.error_type}
+        except Exception as e:
+            self.stats["errors"] += 1
+            print(f"API 요청 처리 중 오류 발생 ({method} {target}): {e}")
+            return 500, {"error": "internal_error"}
+        finally:
+            self.stats["in_flight"] -= 1
+
+    # ---------- HTTP/1.1 처리 ----------
+
+    @staticmethod
+    def _encode_response(status: int, payload: Dict, keep_alive: bool) -> bytes:
+        body = json.dumps(_json_safe(payload), ensure_ascii=False, default=str, allow_nan=False).encode("utf-8")
+        head = (
+            f"HTTP/1.1 {status} {HTTPStatus(status).phrase}\r\n"
+            "Content-Type: application/json; charset=utf-8\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n"
+            "\r\n"
+        )
+        return head.encode("latin-1") + body
+
+    async def _read_request(self, reader: asyncio.StreamReader) -> Optional[Tuple[str, str, str, Dict[str, str], bytes]]:
+        """요청 1건을 읽습니다. 연결이 닫혔으면 None을 반환합니다."""
+        try:
+            request_line = await asyncio.wait_for(reader.readline(), IDLE_TIMEOUT)
+        except ValueError:
+            # 줄이 StreamReader 버퍼 한도보다 길면 readline이 ValueError(LimitOverrunError)를 발생시킴
+            raise HttpError(414, "request_line_too_long")
+        if not request_line:
+            return None
+        try:
+            method, target, version = request_line.decode("latin-1").split()
+        except ValueError:
+            raise HttpError(400, "bad_request_line")
+
+        headers = {}
+        header_bytes = 0
+        while True:
+            try:
+                line = await reader.readline()
+            except ValueError:
+                raise HttpError(431, "header_too_large")
+            if line in (b"\r\n", b"\n", b""):
+                break
+            header_bytes += len(line)
+            if len(headers) >= MAX_HEADERS or header_bytes > MAX_HEADER_BYTES:
+                raise HttpError(431, "header_too_large")
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        try:
+            length = int(headers.get("content-length") or 0)
+        except ValueError:
+            raise HttpError(400, "bad_content_length")
+        if length < 0:
+            raise HttpError(400, "bad_content_length")
+        if length > MAX_BODY_BYTES:
+            raise HttpError(413, "body_too_large")
+        body = await reader.readexactly(length) if length else b""
+        return method.upper(), target, version, headers, body
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while True:
+                try:
+                    request = await self._read_request(reader)
+                except HttpError as e:
+                    writer.write(self._encode_response(e.status, {"error": e.error}, keep_alive=False))
+                    await writer.drain()
+                    break
+                if request is None:
+                    break
+
+                method, target, version, headers, body = request
+                connection = headers.get("connection", "").lower()
+                keep_alive = connection != "close" if version == "HTTP/1.1" else connection == "keep-alive"
+
+                status, payload = await self._respond(method, target, body)
+                writer.write(self._encode_response(status, payload, keep_alive))
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (asyncio.TimeoutError, asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    async def start(self, host: str, port: int) -> asyncio.AbstractServer:
+        return await asyncio.start_server(self.handle_connection, host, port)
+
+    def close(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
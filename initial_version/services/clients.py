@@ -0,0 +1,71 @@
+import threading
+from typing import TYPE_CHECKING
+
+# SDK는 무거우므로(수백 ms) 모듈 로드 시점이 아니라 클라이언트를 처음 만들 때 import 합니다.
+if TYPE_CHECKING:
+    from tavily import TavilyClient
+    from google import genai
+
+
+def create_tavily_client(settings) -> "TavilyClient":
+    """
+    Tavily 클라이언트를 생성합니다.
+    TAVILY_BASE_URL 이 설정되어 있으면 해당 주소(예: 로컬 부하 테스트용 가짜 서버)로 요청합니다.
+    """
+    from tavily import TavilyClient
+
+    if settings.TAVILY_BASE_URL:
+        return TavilyClient(api_key=settings.TAVILY_API_KEY, api_base_url=settings.TAVILY_BASE_URL)
+    return TavilyClient(api_key=settings.TAVILY_API_KEY)
+
+
+def create_gemini_client(settings) -> "genai.Client":
+    """
+    Gemini 클라이언트를 생성합니다.
+    GEMINI_BASE_URL 이 설정되어 있으면 해당 주소(예: 로컬 부하 테스트용 가짜 서버)로 요청합니다.
+    """
+    from google import genai
+    from google.genai import types
+
+    if settings.GEMINI_BASE_URL:
+        return genai.Client(
+            api_key=settings.GEMINI_API_KEY,
+            http_options=types.HttpOptions(base_url=settings.GEMINI_BASE_URL)
+        )
+    return genai.Client(api_key=settings.GEMINI_API_KEY)
+
+
+# 설정(API 키, 서버 주소)별로 한 번만 만든 클라이언트를 재사용 (연결 재사용으로 요청마다 생기는 핸드셰이크 비용 제거)
+_clients = {}
+_clients_lock = threading.Lock()
+
+
+def _get_or_create(key, factory):
+    with _clients_lock:
+        if key not in _clients:
+            _clients[key] = factory()
+        return _clients[key]
+
+
+def get_tavily_client(settings) -> "TavilyClient":
+    """같은 설정의 Tavily 클라이언트를 재사용합니다."""
+    key = ("tavily", settings.TAVILY_API_KEY, settings.TAVILY_BASE_URL)
+    return _get_or_create(key, lambda: create_tavily_client(settings))
+
+
+def get_gemini_client(settings) -> "genai.Client":
+    """같은 설정의 Gemini 클라이언트를 재사용합니다."""
+    key = ("gemini", settings.GEMINI_API_KEY, settings.GEMINI_BASE_URL)
+    return _get_or_create(key, lambda: create_gemini_client(settings))
+
+
+def preload_sdks():
+    """
+    SDK 모듈을 미리 import 합니다. 화면을 먼저 그린 뒤 백그라운드 스레드에서 호출하면
+    첫 검색에서 import 시간을 기다리지 않아도 됩니다.
+    """
+    try:
+        import tavily  # noqa: F401
+        from google import genai  # noqa: F401
+    except ImportError as e:
+        print(f"SDK 미리 불러오기 실패: {e}")
@@ -0,0 +1,212 @@
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterator, Optional
+from domain.search_result import SearchResult
+from repositories.search_repository import SearchRepository
+from services.pipeline_service import (
+    run_search_pipeline,
+    run_incremental_pipeline,
+    run_streaming_pipeline
+)
+from utils.exceptions import AppError
+
+# 작업 상태
+PENDING = "pending"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+
+
+@dataclass
+class Job:
+    """백그라운드에서 실행되는 검색+요약 작업 1건의 상태"""
+
+    job_id: str
+    session_id: str
+    keyword: str
+    num_results: int
+    mode: str  # "normal" / "stream" / "incremental"
+    status: str = PENDING
+    stage: Optional[str] = None
+    partial_summary: str = ""
+    result: Optional[SearchResult] = None
+    new_count: int = 0
+    error_type: Optional[str] = None
+    error_message: Optional[str] = None
+    created_at: float = field(default_factory=time.time)
+    finished_at: Optional[float] = None
+
+    @property
+    def finished(self) -> bool:
+        return self.status in (DONE, FAILED)
+
+
+class JobRunner:
+    """
+    검색 → 요약 → 저장 파이프라인을 스크립트 실행과 분리된 스레드 풀에서 실행합니다.
+
+    Streamlit은 위젯을 조작할 때마다 스크립트를 다시 실행하므로, 파이프라인을 스크립트 안에서
+    실행하면 작업이 중단될 수 있습니다. 작업은 프로세스 전체에서 공유되는 이 러너가 소유하고,
+    화면은 세션별 작업 상태(단계, 스트리밍 중인 요약)를 주기적으로 읽어 표시만 합니다.
+    """
+
+    def __init__(self, max_workers: int = 4, retention_seconds: float = 3600):
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="job")
+        self._jobs: Dict[str, Job] = {}
+        self._lock = threading.Lock()
+        # 작업 상태(단계, 요약 조각, 완료)가 바뀔 때마다 알림 (stream_summary가 대기)
+        self._changed = threading.Condition(self._lock)
+        self.retention_seconds = retention_seconds
+
+    def submit(
+        self,
+        session_id: str,
+        keyword: str,
+        num_results: int,
+        repository: SearchRepository,
+        mode: str = "normal"
+    ) -> Job:
+        """작업을 등록하고 바로 반환합니다. 실행은 스레드 풀에서 진행됩니다."""
+        job = Job(
+            job_id=uuid.uuid4().hex,
+            session_id=session_id,
+            keyword=keyword,
+            num_results=num_results,
+            mode=mode
+        )
+        with self._lock:
+            self._cleanup()
+            self._jobs[job.job_id] = job
+        self._executor.submit(self._run, job, repository)
+        return job
+
+    def _set_stage(self, job: Job, stage: str):
+        with self._lock:
+            job.stage = stage
+            self._changed.notify_all()
+
+    def _consume_stream(self, job: Job, chunks: Iterator[str]) -> str:
+        """요약 스트림을 읽으며 지금까지의 요약을 작업 상태에 반영합니다."""
+        parts = []
+        for chunk in chunks:
+            parts.append(chunk)
+            with self._lock:
+                job.partial_summary = "".join(parts)
+                self._changed.notify_all()
+        return "".join(parts)
+
+    def _run(self, job: Job, repository: SearchRepository):
+        with self._lock:
+            job.status = RUNNING
+        on_stage = lambda stage: self._set_stage(job, stage)
+
+        try:
+            if job.mode == "incremental":
+                result, new_count = run_incremental_pipeline(
+                    job.keyword, job.num_results, repository, on_stage=on_stage
+                )
+            elif job.mode == "stream":
+                result = run_streaming_pipeline(
+                    job.keyword,
+                    job.num_results,
+                    repository,
+                    render_stream=lambda chunks: self._consume_stream(job, chunks),
+                    on_stage=on_stage,
+                    use_cache=True
+                )
+                new_count = len(result.articles)
+            else:
+                result = run_search_pipeline(job.keyword, job.num_results, repository, on_stage=on_stage, use_cache=True)
+                new_count = len(result.articles)
+        except AppError as e:
+            self._finish(job, error_type=e.error_type)
+        except Exception as e:
+            print(f"백그라운드 작업 오류 ({job.keyword}): {e}")
+            self._finish(job, error_message=str(e))
+        else:
+            self._finish(job, result=result, new_count=new_count)
+
+    def _finish(
+        self,
+        job: Job,
+        result: Optional[SearchResult] = None,
+        new_count: int = 0,
+        error_type: Optional[str] = None,
+        error_message: Optional[str] = None
+    ):
+        with self._lock:
+            job.result = result
+            job.new_count = new_count
+            job.error_type = error_type
+            job.error_message = error_message
+            job.status = FAILED if (error_type or error_message) else DONE
+            job.finished_at = time.time()
+            self._changed.notify_all()
+
+    def _cleanup(self):
+        """보관 기간이 지난 완료 작업을 정리합니다. (_lock 안에서 호출)"""
+        cutoff = time.time() - self.retention_seconds
+        expired = [jid for jid, j in self._jobs.items() if j.finished and j.finished_at < cutoff]
+        for jid in expired:
+            del self._jobs[jid]
+
+    def get(self, job_id: str) -> Optional[Job]:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def stream_summary(self, job_id: str, on_stage: Optional[Callable[[Optional[str]], None]] = None) -> Iterator[str]:
+        """
+        스트리밍 작업의 요약을 생성되는 대로 조각 단위로 반환합니다. 작업이 끝나면 종료합니다.
+        화면이 다시 실행되어 중간에 다시 연결하면 지금까지의 요약부터 이어서 받습니다.
+
+        Args:
+            on_stage: 작업 단계가 바뀔 때 호출되는 콜백 (진행 문구 표시용)
+        """
+        sent = 0
+        stage = object()  # 처음에는 현재 단계를 한 번 알리도록 어떤 단계와도 다른 값으로 시작
+        while True:
+            with self._changed:
+                job = self._jobs.get(job_id)
+                if job is None:
+                    return
+                while len(job.partial_summary) == sent and job.stage == stage and not job.finished:
+                    self._changed.wait()
+                text, current_stage, finished = job.partial_summary, job.stage, job.finished
+
+            if len(text) < sent:
+                # 합류했던 스트림의 리더가 중단되어 요약을 처음부터 다시 받는 경우
+                sent = 0
+
+            if current_stage != stage:
+                stage = current_stage
+                if on_stage:
+                    on_stage(stage)
+            if len(text) > sent:
+                yield text[sent:]
+                sent = len(text)
+            if finished:
+                return
+
+    def get_metrics(self) -> Dict[str, int]:
+        """상태별 작업 수를 반환합니다. (보관 중인 작업 기준)"""
+        with self._lock:
+            counts = {PENDING: 0, RUNNING: 0, DONE: 0, FAILED: 0}
+            for job in self._jobs.values():
+                counts[job.status] += 1
+            return counts
+
+
+_runner: Optional[JobRunner] = None
+_runner_lock = threading.Lock()
+
+
+def get_job_runner(settings) -> JobRunner:
+    """프로세스 공유 작업 러너를 반환합니다. (스크립트가 다시 실행되어도 유지됩니다)"""
+    global _runner
+    with _runner_lock:
+        if _runner is None:
+            _runner = JobRunner(settings.JOB_WORKERS, settings.JOB_RETENTION_SECONDS)
+        return _runner
@@ -0,0 +1,213 @@
+import re
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Callable, Dict, List, Optional, Tuple
+from utils.exceptions import AppError
+
+# 모델별 100만 토큰당 예상 비용 (USD, 입력/출력) - 라우팅 비교용 추정치
+MODEL_PRICES = {
+    "gemini-2.5-flash-lite": (0.10, 0.40),
+    "gemini-2.0-flash-lite": (0.075, 0.30),
+    "gemini-2.0-flash": (0.10, 0.40),
+    "gemini-2.5-flash": (0.30, 2.50),
+    "gemini-2.5-pro": (1.25, 10.00),
+}
+
+# 요약이 아닌 거절/오류성 응답에 자주 나오는 표현
+_REFUSAL_PATTERN = re.compile(r"(요약할 수 없|제공된 기사가 없|I can(?:'|no)t|as an AI)", re.IGNORECASE)
+_BULLET_PATTERN = re.compile(r"^\s*(?:[-*•]|\d+[.)])\s+", re.MULTILINE)
+
+# 헤지 요청용 스레드 풀 (프로세스 전체에서 하나만 사용, 모델 목록이 바뀌어 라우터를 새로 만들어도 스레드가 늘지 않음)
+_hedge_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="hedge")
+
+
+def looks_like_summary(text: str) -> bool:
+    """요약 응답의 최소 품질을 확인합니다. (불릿 항목 1개 이상, 너무 짧지 않음, 거절 문구 없음)"""
+    if not text or len(text.strip()) < 40:
+        return False
+    if _REFUSAL_PATTERN.search(text):
+        return False
+    return bool(_BULLET_PATTERN.search(text))
+
+
+class ModelStats:
+    """모델별 지연 시간, 성공률, 비용 기록"""
+
+    def __init__(self, model: str, window: int = 200):
+        self.model = model
+        self.latencies = deque(maxlen=window)
+        self.successes = 0
+        self.failures = 0
+        self.low_quality = 0
+        self.hedged = 0
+        self.input_tokens = 0
+        self.output_tokens = 0
+
+    def percentile(self, q: float) -> Optional[float]:
+        if not self.latencies:
+            return None
+        ordered = sorted(self.latencies)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+    @property
+    def cost(self) -> float:
+        price_in, price_out = MODEL_PRICES.get(self.model, (0.0, 0.0))
+        return (self.input_tokens * price_in + self.output_tokens * price_out) / 1_000_000
+
+    def to_dict(self) -> Dict:
+        total = self.successes + self.failures + self.low_quality
+        return {
+            "model": self.model,
+            "requests": total,
+            "success_rate": self.successes / total if total else None,
+            "p50_ms": None if self.percentile(0.5) is None else self.percentile(0.5) * 1000,
+            "p95_ms": None if self.percentile(0.95) is None else self.percentile(0.95) * 1000,
+            "failures": self.failures,
+            "low_quality": self.low_quality,
+            "hedged": self.hedged,
+            "cost_usd": self.cost,
+        }
+
+
+class ModelRouter:
+    """
+    싼/빠른 모델부터 시도하고 실패하면 더 강한 모델로 올라가는(cascade) 요약 라우터입니다.
+
+    - 오류, 빈 응답, 품질 검사(quality_check) 불합격이면 다음 모델로 넘어갑니다.
+    - hedge가 켜져 있으면 첫 요청이 p95 지연 시간(또는 hedge_after_ms)을 넘을 때
+      같은 모델로 두 번째 요청을 보내 먼저 끝난 응답을 사용합니다.
+    - 모델별 지연 시간, 성공률, 토큰 비용을 기록합니다.
+    """
+
+    # p95를 신뢰하기 위한 최소 표본 수
+    MIN_SAMPLES_FOR_HEDGE = 20
+
+    def __init__(self, models: List[str], hedge: bool = False, hedge_after_ms: float = 0.0):
+        self.models = models
+        self.hedge = hedge
+        self.hedge_after_ms = hedge_after_ms
+        self.stats: Dict[str, ModelStats] = {m: ModelStats(m) for m in models}
+        self._lock = threading.Lock()
+
+    def _hedge_delay(self, model: str) -> Optional[float]:
+        if not self.hedge:
+            return None
+        if self.hedge_after_ms > 0:
+            return self.hedge_after_ms / 1000.0
+        stats = self.stats[model]
+        if len(stats.latencies) < self.MIN_SAMPLES_FOR_HEDGE:
+            return None
+        return stats.percentile(0.95)
+
+    def _call_with_hedge(self, model: str, call: Callable[[str], object]):
+        """필요하면 헤지 요청을 보내며 모델을 호출하고, 먼저 성공한 응답을 반환합니다."""
+        delay = self._hedge_delay(model)
+        if delay is None:
+            return call(model)
+
+        futures = [_hedge_executor.submit(call, model)]
+        done, _ = wait(futures, timeout=delay)
+        if not done:
+            with self._lock:
+                self.stats[model].hedged += 1
+            futures.append(_hedge_executor.submit(call, model))
+
+        error = None
+        pending = set(futures)
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    return future.result()
+                error = future.exception()
+        raise error
+
+    def record(self, model: str, elapsed: float, outcome: str, response=None):
+        """호출 결과를 기록합니다. (outcome: success, low_quality, failure)"""
+        with self._lock:
+            stats = self.stats[model]
+            stats.latencies.append(elapsed)
+            if outcome == "success":
+                stats.successes += 1
+            elif outcome == "low_quality":
+                stats.low_quality += 1
+            else:
+                stats.failures += 1
+            usage = getattr(response, "usage_metadata", None)
+            if usage is not None:
+                stats.input_tokens += getattr(usage, "prompt_token_count", None) or 0
+                stats.output_tokens += getattr(usage, "candidates_token_count", None) or 0
+
+    def generate(
+        self,
+        call: Callable[[str], object],
+        quality_check: Callable[[str], bool] = looks_like_summary,
+        start: int = 0
+    ) -> Tuple[str, str]:
+        """
+        cascade 순서대로 모델을 호출합니다.
+
+        Args:
+            call: 모델 이름을 받아 generate_content 응답을 반환하는 함수
+            quality_check: 응답 텍스트가 쓸 만한지 판단하는 함수
+            start: cascade에서 처음 시도할 모델 위치 (앞 모델이 이미 실패한 경우)
+
+        Returns:
+            Tuple[str, str]: (응답 텍스트, 응답한 모델). 모든 모델이 품질 검사에 불합격하면
+            마지막으로 받은 비어 있지 않은 응답을 반환합니다.
+
+        Raises:
+            AppError: 요청 제한 초과 등 (모델을 바꿔도 해결되지 않는 오류)
+            Exception: 모든 모델 호출이 실패한 경우 마지막 예외
+        """
+        last_error = None
+        fallback: Tuple[str, str] = ("", self.models[-1])
+
+        for model in self.models[start:]:
+            started = time.monotonic()
+            try:
+                response = self._call_with_hedge(model, call)
+            except AppError:
+                raise
+            except Exception as e:
+                self.record(model, time.monotonic() - started, "failure")
+                last_error = e
+                continue
+
+            text = getattr(response, "text", None) or ""
+            if quality_check(text):
+                self.record(model, time.monotonic() - started, "success", response)
+                return text, model
+
+            self.record(model, time.monotonic() - started, "low_quality", response)
+            if text:
+                fallback = (text, model)
+
+        if fallback[0] or last_error is None:
+            return fallback
+        raise last_error
+
+    def get_stats(self) -> List[Dict]:
+        with self._lock:
+            return [self.stats[m].to_dict() for m in self.models]
+
+
+_router: Optional[ModelRouter] = None
+_router_lock = threading.Lock()
+
+
+def get_model_router(settings) -> ModelRouter:
+    """설정(GEMINI_MODEL_CASCADE)에 따라 프로세스 공유 라우터를 반환합니다."""
+    global _router
+    models = settings.GEMINI_MODEL_CASCADE or [settings.GEMINI_MODEL]
+    with _router_lock:
+        if _router is None or _router.models != models:
+            _router = ModelRouter(models, settings.GEMINI_HEDGE, settings.GEMINI_HEDGE_AFTER_MS)
+        return _router
+
+
+def get_model_stats() -> List[Dict]:
+    """모델별 라우팅 통계를 반환합니다. (라우터를 아직 사용하지 않았다면 빈 리스트)"""
+    return _router.get_stats() if _router else []
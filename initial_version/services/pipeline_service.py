@@ -0,0 +1,456 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+from config.settings import Settings
+from domain.news_article import NewsArticle
+from domain.search_result import SearchResult
+from repositories.search_repository import SearchRepository
+from services.search_service import search_news
+from services.ai_service import (
+    summarize_news,
+    summarize_news_batch,
+    summarize_news_stream,
+    update_summary
+)
+from utils.exceptions import AppError
+from utils.key_generator import generate_search_key
+from utils.search_cache import get_search_cache
+from utils.single_flight import SingleFlight
+
+# 프로세스 전체에서 공유 (Streamlit 세션들은 같은 프로세스의 스레드로 동작합니다)
+_search_flight = SingleFlight()
+
+
+def _notify(on_stage: Optional[Callable[[str], None]], stage: str):
+    if on_stage:
+        on_stage(stage)
+
+
+def _search(keyword: str, num_results: int, use_cache: bool = False) -> List[NewsArticle]:
+    """
+    뉴스 검색 단계입니다. 같은 (keyword, num_results) 검색은 캐시 예열, 일괄 검색과 같은 키로 합쳐집니다.
+
+    use_cache면 예열된 결과를 한 번 사용합니다. 진행 중인 예열 검색에 합류한 경우에는
+    예열이 캐시에 넣은 같은 결과를 지워, 다음 검색이 이미 본 결과를 다시 받지 않도록 합니다.
+    """
+    articles = _search_flight.do(
+        ("search", keyword, num_results),
+        lambda: search_news(keyword, num_results, use_cache=use_cache)
+    )
+    if use_cache:
+        cache = get_search_cache(Settings())
+        if cache is not None:
+            cache.discard(keyword, num_results)
+    return articles
+
+
+def run_search_pipeline(
+    keyword: str,
+    num_results: int,
+    repository: Optional[SearchRepository],
+    on_stage: Optional[Callable[[str], None]] = None,
+    use_cache: bool = False
+) -> SearchResult:
+    """
+    뉴스 검색 → AI 요약 → 저장을 한 번에 수행합니다.
+
+    같은 (keyword, num_results) 요청이 동시에 여러 세션에서 들어오면
+    Tavily/Gemini 호출과 저장은 한 번만 수행하고 모든 요청이 같은 결과를 받습니다.
+
+    Args:
+        keyword (str): 검색 키워드
+        num_results (int): 가져올 기사 수
+        repository (SearchRepository): 결과를 저장할 리포지토리 (None이면 저장하지 않음)
+        on_stage (Callable): 단계가 바뀔 때 호출되는 콜백 ("search", "summarize", "save")
+            실제로 실행하는 요청에서만 호출됩니다.
+        use_cache (bool): 예열된 검색 결과를 한 번 사용합니다. (대화형 검색용, 스케줄러/CLI는 항상 새로 검색)
+
+    Returns:
+        SearchResult: 검색 결과 (기사가 없으면 articles가 빈 리스트이며 저장하지 않습니다)
+
+    Raises:
+        AppError: 검색/요약 중 오류 발생 시
+    """
+    def pipeline() -> SearchResult:
+        _notify(on_stage, "search")
+        articles = _search(keyword, num_results, use_cache)
+
+        if not articles:
+            return SearchResult(
+                search_key=generate_search_key(),
+                search_time=datetime.now(),
+                keyword=keyword,
+                articles=[],
+                ai_summary=""
+            )
+
+        _notify(on_stage, "summarize")
+        summary = summarize_news(articles)
+
+        result = SearchResult(
+            search_key=generate_search_key(),
+            search_time=datetime.now(),
+            keyword=keyword,
+            articles=articles,
+            ai_summary=summary
+        )
+
+        if repository is not None:
+            _notify(on_stage, "save")
+            repository.save(result)
+        return result
+
+    # 저장 여부가 다른 요청끼리는 합치지 않음
+    return _search_flight.do((keyword, num_results, repository is not None), pipeline)
+
+
+class _StreamBroadcast:
+    """
+    같은 스트리밍 검색에 동시에 들어온 요청들이 리더의 요약 조각을 함께 받도록 전달합니다.
+    리더는 publish로 스트림을 소비하며 조각을 기록하고, 나머지 요청은 tail로 같은 조각을 순서대로 받습니다.
+    """
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._chunks: List[str] = []
+        self._done = False
+        self.result: Optional[SearchResult] = None
+        self.error: Optional[Exception] = None
+        self.aborted = False
+
+    def publish(self, chunks: Iterator[str]) -> Iterator[str]:
+        for chunk in chunks:
+            with self._cond:
+                self._chunks.append(chunk)
+                self._cond.notify_all()
+            yield chunk
+
+    def finish(self, result: Optional[SearchResult] = None, error: Optional[Exception] = None, aborted: bool = False):
+        with self._cond:
+            self.result, self.error, self.aborted, self._done = result, error, aborted, True
+            self._cond.notify_all()
+
+    def tail(self) -> Iterator[str]:
+        position = 0
+        while True:
+            with self._cond:
+                while position >= len(self._chunks) and not self._done:
+                    self._cond.wait()
+                chunks = self._chunks[position:]
+                position = len(self._chunks)
+                done = self._done
+            yield from chunks
+            if done:
+                # 리더가 스트리밍 없이 끝난 경우(일반 검색에 합류) 전체 요약을 한 번에 전달
+                if position == 0 and self.result is not None and self.result.ai_summary:
+                    yield self.result.ai_summary
+                return
+
+    def wait(self) -> Optional[SearchResult]:
+        """리더의 결과를 반환합니다. 리더가 Exception이 아닌 이유로 멈췄으면 None을 반환합니다."""
+        with self._cond:
+            while not self._done:
+                self._cond.wait()
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+
+# 진행 중인 스트리밍 검색 {single-flight 키: _StreamBroadcast}
+_streams: Dict[Tuple, _StreamBroadcast] = {}
+_streams_lock = threading.Lock()
+
+
+def run_streaming_pipeline(
+    keyword: str,
+    num_results: int,
+    repository: SearchRepository,
+    render_stream: Callable[[Iterator[str]], str],
+    on_stage: Optional[Callable[[str], None]] = None,
+    use_cache: bool = False
+) -> SearchResult:
+    """
+    run_search_pipeline과 같지만 요약을 스트리밍으로 받아 화면에 바로 표시합니다.
+
+    요약 스트림은 render_stream에 전달되며, render_stream은 스트림을 모두 소비한 뒤
+    전체 요약 텍스트를 반환해야 합니다. (예: st.write_stream)
+    스트림이 끝난 뒤 전체 요약과 함께 결과를 저장합니다.
+
+    같은 (keyword, num_results) 검색이 동시에 들어오면 run_search_pipeline과 같은 키로 합쳐,
+    검색/요약/저장은 리더 요청만 수행합니다. 나머지 요청은 리더의 요약 조각을 그대로 받아 표시하고
+    리더의 결과를 돌려받습니다.
+    """
+    key = (keyword, num_results, True)
+    with _streams_lock:
+        broadcast = _streams.get(key)
+        is_leader = broadcast is None
+        if is_leader:
+            broadcast = _streams[key] = _StreamBroadcast()
+
+    if not is_leader:
+        render_stream(broadcast.tail())
+        result = broadcast.wait()
+        if broadcast.aborted:
+            # 리더 세션이 중단되었으면(재실행, KeyboardInterrupt 등) 이 요청이 직접 다시 실행
+            return run_streaming_pipeline(keyword, num_results, repository, render_stream, on_stage, use_cache)
+        return result
+
+    streamed = False
+
+    def pipeline() -> SearchResult:
+        nonlocal streamed
+        streamed = True
+        _notify(on_stage, "search")
+        articles = _search(keyword, num_results, use_cache)
+
+        if not articles:
+            return SearchResult(
+                search_key=generate_search_key(),
+                search_time=datetime.now(),
+                keyword=keyword,
+                articles=[],
+                ai_summary=""
+            )
+
+        _notify(on_stage, "summarize")
+        summary = render_stream(broadcast.publish(summarize_news_stream(articles)))
+
+        result = SearchResult(
+            search_key=generate_search_key(),
+            search_time=datetime.now(),
+            keyword=keyword,
+            articles=articles,
+            ai_summary=summary
+        )
+
+        _notify(on_stage, "save")
+        repository.save(result)
+        return result
+
+    try:
+        # 같은 키의 일반 검색(run_search_pipeline)이 이미 실행 중이면 pipeline은 실행되지 않고 그 결과를 받음
+        result = _search_flight.do(key, pipeline)
+    except Exception as e:
+        with _streams_lock:
+            _streams.pop(key, None)
+        broadcast.finish(error=e)
+        raise
+    except BaseException:
+        # 제어 흐름 예외는 리더에게만 전달하고 기다리던 요청은 다시 실행하게 함
+        with _streams_lock:
+            _streams.pop(key, None)
+        broadcast.finish(aborted=True)
+        raise
+
+    with _streams_lock:
+        _streams.pop(key, None)
+    broadcast.finish(result=result)
+    if not streamed and result.ai_summary:
+        render_stream(iter([result.ai_summary]))
+    return result
+
+
+def run_incremental_pipeline(
+    keyword: str,
+    num_results: int,
+    repository: SearchRepository,
+    merge: bool = True,
+    on_stage: Optional[Callable[[str], None]] = None
+) -> Tuple[SearchResult, int]:
+    """
+    이미 추적 중인 키워드에 대해 마지막 검색 이후의 새 기사만 가져옵니다.
+
+    - 리포지토리에 저장된 해당 키워드의 URL과 최신 발행일을 기준으로 새 기사(delta)만 남깁니다.
+    - 저장은 새 기사만 새 search_key로 추가하므로 저장 공간도 변경분만큼만 늘어납니다.
+    - 요약은 이전 요약 + 새 기사만으로 갱신(증분 요약)하고, 이전 요약을 summary_base_key로 기록합니다.
+    - 새 기사가 없으면 Gemini를 호출하지 않고 저장도 하지 않습니다.
+    - 저장된 기록이 없는 키워드는 일반 검색(run_search_pipeline)으로 처리합니다.
+
+    Args:
+        merge (bool): True면 새 기사 + 이전 버전들(summary_base_key 체인)의 기사를 합친 결과를 반환하고,
+            False면 새 기사만 담긴 결과를 반환합니다.
+
+    Returns:
+        Tuple[SearchResult, int]: (표시할 검색 결과, 새 기사 수)
+    """
+    def pipeline() -> Optional[Tuple[SearchResult, int]]:
+        # 직전 결과는 합류한 요청들이 같은 상태를 보도록 single-flight 안에서 읽음
+        # (저장된 새 기사만으로는 전체 기사를 알 수 없으므로 이전 버전들의 기사까지 합쳐서 읽음)
+        previous = repository.find_latest_by_keyword(keyword, follow_base=True)
+        if previous is None:
+            return None
+
+        _notify(on_stage, "search")
+        seen_urls, latest_pub_date = repository.get_seen_articles(keyword)
+        delta = search_news(keyword, num_results, since=latest_pub_date, exclude_urls=seen_urls)
+
+        if not delta:
+            return (previous if merge else SearchResult(
+                search_key=previous.search_key,
+                search_time=previous.search_time,
+                keyword=keyword,
+                articles=[],
+                ai_summary=previous.ai_summary,
+                summary_version=previous.summary_version,
+                summary_base_key=previous.summary_base_key
+            )), 0
+
+        merged_articles = delta + [a for a in previous.articles if a.url not in {d.url for d in delta}]
+
+        _notify(on_stage, "summarize")
+        summary = update_summary(previous.ai_summary, delta, previous.articles)
+
+        search_key = generate_search_key()
+        search_time = datetime.now()
+        summary_version = previous.summary_version + 1
+        delta_result = SearchResult(
+            search_key=search_key,
+            search_time=search_time,
+            keyword=keyword,
+            articles=delta,
+            ai_summary=summary,
+            summary_version=summary_version,
+            summary_base_key=previous.search_key
+        )
+
+        _notify(on_stage, "save")
+        repository.save(delta_result)
+
+        if not merge:
+            return delta_result, len(delta)
+        return SearchResult(
+            search_key=search_key,
+            search_time=search_time,
+            keyword=keyword,
+            articles=merged_articles,
+            ai_summary=summary,
+            summary_version=summary_version,
+            summary_base_key=previous.search_key
+        ), len(delta)
+
+    outcome = _search_flight.do(("incremental", keyword, num_results, merge), pipeline)
+    if outcome is None:
+        result = run_search_pipeline(keyword, num_results, repository, on_stage)
+        return result, len(result.articles)
+    return outcome
+
+
+# 다른 키워드로 다시 요청해도 실패할 오류 (키워드별 요약으로 대체하다 이 오류가 나면 남은 키워드는 요약 없이 둠)
+_STOP_SUMMARY_ERRORS = {"api_key_invalid", "rate_limit_exceeded", "monthly_quota_exceeded", "service_unavailable"}
+
+
+def _summarize_each(article_sets: Dict[str, List[NewsArticle]]) -> Dict[str, str]:
+    """일괄 요약이 실패했을 때 키워드별로 요약합니다. 요약하지 못한 키워드는 결과에서 빠집니다."""
+    summaries = {}
+    for keyword, articles in article_sets.items():
+        try:
+            summaries[keyword] = summarize_news(articles)
+        except AppError as e:
+            print(f"'{keyword}' 요약 실패: {e.error_type}")
+            if e.error_type in _STOP_SUMMARY_ERRORS:
+                break
+    return summaries
+
+
+def run_batch_pipeline(
+    requests: List[Tuple[str, int]],
+    repository: Optional[SearchRepository],
+    max_workers: int = 4
+) -> Dict[str, SearchResult]:
+    """
+    여러 키워드를 한꺼번에 검색 → 일괄 요약 → 저장합니다. (스케줄러/대량 갱신용)
+
+    검색은 키워드별로 병렬 실행하고, 요약은 summarize_news_batch로 여러 키워드를 한 요청에 묶어
+    Gemini 호출 횟수를 줄입니다. 검색에 실패한 키워드는 결과에서 빠지고 나머지는 계속 처리합니다.
+    일괄 요약이 실패하면 키워드별로 다시 요약하고, 그래도 요약하지 못한 키워드는
+    검색한 기사를 잃지 않도록 요약 없이(ai_summary="") 저장합니다.
+
+    Args:
+        requests (List[Tuple[str, int]]): (키워드, 기사 수) 리스트
+        repository (SearchRepository): 결과를 저장할 리포지토리 (None이면 저장하지 않음)
+        max_workers (int): 동시 검색 수
+
+    Returns:
+        Dict[str, SearchResult]: {키워드: 검색 결과} (기사가 없는 키워드는 저장하지 않음)
+    """
+    def search(request: Tuple[str, int]):
+        keyword, num_results = request
+        try:
+            return keyword, _search(keyword, num_results)
+        except AppError as e:
+            print(f"'{keyword}' 검색 실패: {e.error_type}")
+            return keyword, None
+
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        searched = dict(executor.map(search, requests))
+
+    article_sets = {k: articles for k, articles in searched.items() if articles}
+    try:
+        summaries = summarize_news_batch(article_sets) if article_sets else {}
+    except AppError as e:
+        print(f"일괄 요약 실패, 키워드별로 다시 요약합니다: {e.error_type}")
+        summaries = _summarize_each(article_sets)
+
+    results = {}
+    for keyword, articles in searched.items():
+        if articles is None:
+            continue
+        result = SearchResult(
+            search_key=generate_search_key(),
+            search_time=datetime.now(),
+            keyword=keyword,
+            articles=articles,
+            ai_summary=summaries.get(keyword, "")
+        )
+        if articles and repository is not None:
+            repository.save(result)
+        results[keyword] = result
+    return results
+
+
+def run_warmup_pipeline(keyword: str, num_results: int) -> bool:
+    """
+    캐시 예열용으로 검색 → 요약을 수행합니다. 결과는 저장하지 않고 검색 캐시와 요약 캐시만 채웁니다.
+
+    검색 단계와 같은 키로 요약까지 실행하므로, 예열 중에 들어온 사용자 검색은 예열에 합류한 뒤
+    요약 캐시에서 바로 요약을 받습니다. 반대로 사용자 검색이 이미 진행 중이면 그 결과를 캐시에 넣지 않고
+    요약도 하지 않습니다. (사용자 요청이 요약함)
+
+    Returns:
+        bool: 예열했으면 True, 진행 중인 다른 검색에 합류해 건너뛰었으면 False
+
+    Raises:
+        AppError: 검색/요약 중 오류 발생 시 (요약 오류는 합류한 사용자 검색에는 전달하지 않음)
+    """
+    cache = get_search_cache(Settings())
+    led = False
+    summary_error: Optional[BaseException] = None
+
+    def search() -> List[NewsArticle]:
+        nonlocal led, summary_error
+        led = True
+        articles = search_news(keyword, num_results)
+        if not articles:
+            return articles
+        try:
+            summarize_news(articles)
+        except Exception as e:
+            summary_error = e
+            return articles
+        if cache is not None:
+            cache.set(keyword, num_results, articles)
+        return articles
+
+    _search_flight.do(("search", keyword, num_results), search)
+    if summary_error is not None:
+        raise summary_error
+    return led
+
+
+def get_pipeline_metrics() -> Dict[str, int]:
+    """실제로 실행된 파이프라인 수와 다른 요청에 합류한(coalesced) 요청 수를 반환합니다."""
+    return {
+        "executed": _search_flight.leader_count,
+        "coalesced": _search_flight.coalesced_count,
+    }
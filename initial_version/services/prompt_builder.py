@@ -0,0 +1,225 @@
+from dataclasses import dataclass
+from typing import Callable, Dict, List
+from domain.news_article import NewsArticle
+
+SUMMARY_INSTRUCTION = """
+다음 뉴스 기사들의 핵심 내용을 한국어로 요약해주세요:
+- 불릿 포인트 형식으로 최대 5개 항목
+- 각 항목은 1~2문장
+
+[뉴스 목록]
+"""
+
+# 스니펫을 잘랐을 때 붙이는 표시
+ELLIPSIS = "…"
+# 잘린 스니펫이 이보다 짧아지면 의미가 없으므로 기사 자체를 제외합니다
+MIN_SNIPPET_TOKENS = 20
+
+
+@dataclass
+class BuiltPrompt:
+    """토큰 예산에 맞춰 구성된 프롬프트와 구성 정보"""
+    text: str            # 완성된 프롬프트
+    token_count: int     # 추정 입력 토큰 수
+    included: int        # 포함된 기사 수
+    truncated: int       # 스니펫이 잘린 기사 수
+    dropped: int         # 예산 부족으로 제외된 기사 수
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    API 호출 없이 토큰 수를 추정합니다.
+    영문/숫자는 약 4글자당 1토큰, 한글 등 비ASCII 문자는 글자당 약 1토큰으로 계산합니다. (보수적 추정)
+    """
+    if not text:
+        return 0
+    ascii_chars = sum(1 for ch in text if ord(ch) < 128)
+    return (ascii_chars + 3) // 4 + (len(text) - ascii_chars)
+
+
+def _truncate(text: str, tokens: int, max_tokens: int) -> str:
+    """토큰 수 비율만큼 글자를 잘라냅니다."""
+    if tokens <= max_tokens:
+        return text
+    keep_chars = max(0, int(len(text) * max_tokens / tokens) - len(ELLIPSIS))
+    return text[:keep_chars].rstrip() + ELLIPSIS
+
+
+def _format_article(index: int, title: str, snippet: str) -> str:
+    return f"{index}. 제목: {title}\n   내용: {snippet}\n\n"
+
+
+def build_summary_prompt(
+    articles: List[NewsArticle],
+    token_budget: int,
+    count_tokens: Callable[[str], int] = estimate_tokens
+) -> BuiltPrompt:
+    """
+    입력 토큰 예산(token_budget) 안에서 요약 프롬프트를 구성합니다.
+
+    - 기사 순서(최신순)를 중요도 순서로 보고, 예산이 모자라면 뒤쪽 기사부터 제외합니다.
+    - 스니펫은 기사별 공평한 몫만큼 자르고, 짧은 스니펫이 남긴 몫은 긴 스니펫에 다시 나눠줍니다.
+    - token_budget이 0 이하이면 자르지 않고 모든 기사를 그대로 사용합니다.
+    """
+    def render(parts: List[str]) -> str:
+        return SUMMARY_INSTRUCTION + "".join(parts)
+
+    if token_budget <= 0:
+        text = render([_format_article(i, a.title, a.snippet) for i, a in enumerate(articles, 1)])
+        return BuiltPrompt(text, count_tokens(text), len(articles), 0, 0)
+
+    available = token_budget - count_tokens(SUMMARY_INSTRUCTION)
+
+    # 1. 제목(및 형식)만으로 예산에 들어가는 기사 수 결정
+    overhead = [count_tokens(_format_article(i, a.title, "")) for i, a in enumerate(articles, 1)]
+    selected = 0
+    used = 0
+    for cost in overhead:
+        if used + cost + MIN_SNIPPET_TOKENS > available:
+            break
+        used += cost + MIN_SNIPPET_TOKENS
+        selected += 1
+
+    chosen = articles[:selected]
+    snippet_tokens = [count_tokens(a.snippet or "") for a in chosen]
+
+    # 2. 남은 예산을 스니펫에 공평하게 배분 (water-filling)
+    remaining = available - sum(overhead[:selected])
+    allowance = [0] * selected
+    pending = sorted(range(selected), key=lambda i: snippet_tokens[i])
+    while pending:
+        share = remaining // len(pending)
+        idx = pending[0]
+        if snippet_tokens[idx] <= share:
+            allowance[idx] = snippet_tokens[idx]
+            remaining -= snippet_tokens[idx]
+            pending.pop(0)
+        else:
+            for idx in pending:
+                allowance[idx] = share
+            break
+
+    parts = []
+    truncated = 0
+    for i, article in enumerate(chosen):
+        snippet = _truncate(article.snippet or "", snippet_tokens[i], allowance[i])
+        if snippet != (article.snippet or ""):
+            truncated += 1
+        parts.append(_format_article(i + 1, article.title, snippet))
+
+    text = render(parts)
+    return BuiltPrompt(text, count_tokens(text), selected, truncated, len(articles) - selected)
+
+
+REDUCE_INSTRUCTION = """
+아래는 같은 주제의 뉴스 기사들을 여러 묶음으로 나누어 각각 요약한 결과입니다.
+중복되는 내용은 합치고 중요한 내용 위주로 전체를 다시 한국어로 요약해주세요:
+- 불릿 포인트 형식으로 최대 5개 항목
+- 각 항목은 1~2문장
+
+[부분 요약 목록]
+"""
+
+
+def build_reduce_prompt(
+    partial_summaries: List[str],
+    token_budget: int,
+    count_tokens: Callable[[str], int] = estimate_tokens
+) -> BuiltPrompt:
+    """
+    map-reduce 요약의 reduce 단계 프롬프트를 구성합니다.
+    부분 요약마다 같은 몫의 토큰을 배정하고, 넘치는 부분 요약은 자릅니다.
+    """
+    def render(parts: List[str]) -> str:
+        return REDUCE_INSTRUCTION + "".join(
+            f"[묶음 {i}]\n{part}\n\n" for i, part in enumerate(parts, 1)
+        )
+
+    if token_budget <= 0 or not partial_summaries:
+        text = render(partial_summaries)
+        return BuiltPrompt(text, count_tokens(text), len(partial_summaries), 0, 0)
+
+    share = max(MIN_SNIPPET_TOKENS, (token_budget - count_tokens(render([]))) // len(partial_summaries))
+    parts = []
+    truncated = 0
+    for part in partial_summaries:
+        tokens = count_tokens(part)
+        if tokens > share:
+            truncated += 1
+        parts.append(_truncate(part, tokens, share))
+
+    text = render(parts)
+    return BuiltPrompt(text, count_tokens(text), len(parts), truncated, 0)
+
+
+UPDATE_INSTRUCTION = """
+아래는 지금까지의 뉴스 요약과 그 이후 새로 나온 뉴스 기사들입니다.
+새 기사의 내용을 반영하여 기존 요약을 한국어로 갱신해주세요:
+- 새 기사에서 중요한 내용은 추가하고, 더 이상 중요하지 않은 내용은 줄이거나 빼주세요.
+- 불릿 포인트 형식으로 최대 5개 항목
+- 각 항목은 1~2문장
+
+[기존 요약]
+{previous_summary}
+
+[새 뉴스 목록]
+"""
+
+
+def build_update_prompt(
+    previous_summary: str,
+    new_articles: List[NewsArticle],
+    token_budget: int,
+    count_tokens: Callable[[str], int] = estimate_tokens
+) -> BuiltPrompt:
+    """
+    증분 요약 프롬프트를 구성합니다. 기존 요약 + 새 기사만 보내므로 입력 토큰이 변경분 크기에 비례합니다.
+    기존 요약은 그대로 두고 남은 예산 안에서 새 기사 목록을 build_summary_prompt와 같은 방식으로 채웁니다.
+    """
+    header = UPDATE_INSTRUCTION.format(previous_summary=previous_summary.strip())
+    budget = 0
+    if token_budget > 0:
+        # build_summary_prompt는 자체 안내문 토큰을 예산에서 빼므로 그만큼 돌려줍니다
+        budget = max(1, token_budget - count_tokens(header) + count_tokens(SUMMARY_INSTRUCTION))
+    articles_prompt = build_summary_prompt(new_articles, budget, count_tokens)
+    text = header + articles_prompt.text[len(SUMMARY_INSTRUCTION):]
+    return BuiltPrompt(
+        text,
+        count_tokens(text),
+        articles_prompt.included,
+        articles_prompt.truncated,
+        articles_prompt.dropped
+    )
+
+
+BATCH_INSTRUCTION = """
+아래에는 여러 키워드별 뉴스 기사 목록이 있습니다.
+키워드마다 해당 기사들의 핵심 내용을 한국어로 요약해주세요:
+- 불릿 포인트 형식으로 최대 5개 항목
+- 각 항목은 1~2문장
+- 응답은 키워드마다 {"keyword": 키워드, "summary": 요약} 객체 하나씩 담은 JSON 배열로 작성
+- keyword 값은 아래 [키워드: ...]에 적힌 문자열을 그대로 사용
+
+"""
+
+
+def build_batch_prompt(
+    article_sets: Dict[str, List[NewsArticle]],
+    token_budget_per_keyword: int,
+    count_tokens: Callable[[str], int] = estimate_tokens
+) -> BuiltPrompt:
+    """
+    여러 키워드의 기사 목록을 하나의 요청으로 묶는 프롬프트를 구성합니다.
+    공통 안내문은 한 번만 넣고, 키워드별 기사 목록은 각각 token_budget_per_keyword 안에 맞춥니다.
+    """
+    sections = []
+    included = truncated = dropped = 0
+    for keyword, articles in article_sets.items():
+        section = build_summary_prompt(articles, token_budget_per_keyword, count_tokens)
+        sections.append(f"[키워드: {keyword}]\n{section.text[len(SUMMARY_INSTRUCTION):]}")
+        included += section.included
+        truncated += section.truncated
+        dropped += section.dropped
+
+    text = BATCH_INSTRUCTION + "".join(sections)
+    return BuiltPrompt(text, count_tokens(text), included, truncated, dropped)
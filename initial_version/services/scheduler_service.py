@@ -0,0 +1,252 @@
+import json
+import os
+import random
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, fields
+from datetime import datetime
+from typing import Dict, List
+from repositories.search_repository import SearchRepository
+from services.pipeline_service import run_batch_pipeline, run_incremental_pipeline
+from utils.exceptions import AppError
+
+
+@dataclass
+class WatchlistEntry:
+    """주기적으로 갱신할 키워드 설정"""
+    keyword: str
+    interval_minutes: int = 60   # 갱신 주기(분)
+    num_results: int = 5         # 가져올 기사 수
+    incremental: bool = True     # True면 새 기사만 가져오기
+
+
+def _parse_entry(item) -> WatchlistEntry:
+    """워치리스트 항목 1개를 검사하여 WatchlistEntry로 만듭니다. 잘못된 항목이면 ValueError"""
+    if not isinstance(item, dict):
+        raise ValueError("객체({...}) 형식이 아닙니다")
+    unknown = set(item) - {f.name for f in fields(WatchlistEntry)}
+    if unknown:
+        raise ValueError(f"알 수 없는 항목 {sorted(unknown)}")
+    keyword = item.get("keyword")
+    if not isinstance(keyword, str) or not keyword.strip():
+        raise ValueError("keyword가 없습니다")
+
+    entry = WatchlistEntry(**item)
+    for name in ("interval_minutes", "num_results"):
+        value = getattr(entry, name)
+        if isinstance(value, bool) or not isinstance(value, int) or value <= 0:
+            raise ValueError(f"{name}은(는) 1 이상의 정수여야 합니다")
+    if not isinstance(entry.incremental, bool):
+        raise ValueError("incremental은 true/false여야 합니다")
+    return entry
+
+
+def load_watchlist(path: str) -> List[WatchlistEntry]:
+    """
+    워치리스트 JSON 파일을 읽습니다.
+    잘못된 항목은 로그를 남기고 건너뛰며, 파일 자체를 읽을 수 없으면(작성 중인 파일 등) ValueError/OSError를 냅니다.
+
+    파일 형식:
+    [
+        {"keyword": "인공지능", "interval_minutes": 30, "num_results": 5},
+        {"keyword": "반도체", "interval_minutes": 120}
+    ]
+    """
+    if not os.path.exists(path):
+        return []
+    with open(path, encoding="utf-8") as f:
+        raw = json.load(f)
+    if not isinstance(raw, list):
+        raise ValueError("워치리스트는 목록([...]) 형식이어야 합니다")
+
+    entries = []
+    for position, item in enumerate(raw, start=1):
+        try:
+            entries.append(_parse_entry(item))
+        except (TypeError, ValueError) as e:
+            print(f"[scheduler] 워치리스트 {position}번째 항목을 건너뜁니다: {e}")
+    return entries
+
+
+class WatchlistScheduler:
+    """
+    워치리스트의 키워드를 각자의 주기에 맞춰 백그라운드에서 검색 → 요약 → 저장하는 스케줄러입니다.
+
+    - 작업은 스레드 풀에서 실행되며, 같은 키워드는 동시에 두 번 실행하지 않습니다.
+    - 다음 실행 시각에 무작위 지연(jitter)을 더해 여러 키워드가 한꺼번에 몰리지 않게 합니다.
+    - API 요청 제한은 search_news/summarize_news의 요청 제한기가 그대로 적용됩니다.
+    - 같은 시점에 실행할 전체 검색(incremental=False) 키워드들은 하나의 작업으로 묶어
+      요약을 한 번의 Gemini 요청으로 처리합니다.
+    - 다음 실행 시각, 마지막 결과 등 일정 상태는 JSON 파일에 저장되어 재시작 후에도 이어집니다.
+    """
+
+    def __init__(
+        self,
+        repository: SearchRepository,
+        watchlist_path: str,
+        state_path: str,
+        max_workers: int = 2,
+        jitter_seconds: float = 60.0
+    ):
+        self.repository = repository
+        self.watchlist_path = watchlist_path
+        self.state_path = state_path
+        self.jitter_seconds = jitter_seconds
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="watchlist")
+        self.state: Dict[str, Dict] = self._load_state()
+        self._running: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        # 마지막으로 정상적으로 읽은 워치리스트 (파일이 잘못 수정되면 이 목록으로 계속 실행)
+        self._entries: List[WatchlistEntry] = []
+        self._watchlist_mtime_ns = -1
+
+    # ---- 상태 저장 ----
+
+    def _load_state(self) -> Dict[str, Dict]:
+        if not os.path.exists(self.state_path):
+            return {}
+        try:
+            with open(self.state_path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"스케줄 상태 로드 중 오류 발생: {e}")
+            return {}
+
+    def _save_state(self):
+        os.makedirs(os.path.dirname(self.state_path) or ".", exist_ok=True)
+        tmp_path = f"{self.state_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.state, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.state_path)
+
+    def _reload_watchlist(self) -> List[WatchlistEntry]:
+        """
+        워치리스트가 바뀌었으면 다시 읽습니다. (같은 경고가 확인 주기마다 반복되지 않도록 수정 시각으로 판단)
+        파일을 읽을 수 없으면 이전 목록을 그대로 사용합니다.
+        """
+        try:
+            mtime_ns = os.stat(self.watchlist_path).st_mtime_ns
+        except OSError:
+            mtime_ns = None
+        if mtime_ns == self._watchlist_mtime_ns:
+            return self._entries
+
+        self._watchlist_mtime_ns = mtime_ns
+        try:
+            self._entries = load_watchlist(self.watchlist_path)
+        except (OSError, ValueError) as e:
+            print(f"[scheduler] 워치리스트를 읽지 못해 이전 목록({len(self._entries)}개)을 사용합니다: {e}")
+        return self._entries
+
+    # ---- 스케줄링 ----
+
+    def _next_run(self, entry: WatchlistEntry, now: float) -> float:
+        jitter = random.uniform(-self.jitter_seconds, self.jitter_seconds)
+        return now + max(60.0, entry.interval_minutes * 60 + jitter)
+
+    def _due_entries(self, entries: List[WatchlistEntry], now: float) -> List[WatchlistEntry]:
+        due = []
+        for entry in entries:
+            if entry.keyword in self._running:
+                continue
+            next_run = self.state.get(entry.keyword, {}).get("next_run")
+            if next_run is None:
+                # 처음 등록된 키워드는 jitter 범위 안에서 분산 실행
+                next_run = now + random.uniform(0, self.jitter_seconds)
+                self.state.setdefault(entry.keyword, {})["next_run"] = next_run
+            if next_run <= now:
+                due.append(entry)
+        return due
+
+    def _finish(self, entry: WatchlistEntry, record: Dict):
+        with self._lock:
+            self.state.setdefault(entry.keyword, {}).update(record)
+            self.state[entry.keyword]["next_run"] = self._next_run(entry, time.time())
+            self._running.pop(entry.keyword, None)
+            self._save_state()
+
+    def _run_entry(self, entry: WatchlistEntry):
+        """증분 검색 키워드 1개를 갱신합니다."""
+        started = time.time()
+        record = {"last_run": datetime.now().isoformat(timespec="seconds")}
+        try:
+            result, new_count = run_incremental_pipeline(entry.keyword, entry.num_results, self.repository)
+            record.update({
+                "last_key": result.search_key,
+                "new_articles": new_count,
+                "last_error": None,
+            })
+            print(f"[scheduler] '{entry.keyword}' 갱신 완료: 새 기사 {new_count}건 ({time.time() - started:.1f}s)")
+        except AppError as e:
+            record["last_error"] = e.error_type
+            print(f"[scheduler] '{entry.keyword}' 갱신 실패: {e.error_type}")
+        except Exception as e:
+            record["last_error"] = str(e)
+            print(f"[scheduler] '{entry.keyword}' 갱신 중 알 수 없는 오류: {e}")
+        self._finish(entry, record)
+
+    def _run_batch(self, entries: List[WatchlistEntry]):
+        """전체 검색 키워드 여러 개를 한 번에 갱신합니다. (요약은 일괄 요청)"""
+        started = time.time()
+        now_str = datetime.now().isoformat(timespec="seconds")
+        try:
+            results = run_batch_pipeline(
+                [(e.keyword, e.num_results) for e in entries],
+                self.repository,
+                max_workers=len(entries)
+            )
+            error = None
+        except AppError as e:
+            results, error = {}, e.error_type
+        except Exception as e:
+            results, error = {}, str(e)
+
+        for entry in entries:
+            record = {"last_run": now_str}
+            result = results.get(entry.keyword)
+            if result is not None:
+                record.update({"last_key": result.search_key, "new_articles": len(result.articles), "last_error": None})
+            else:
+                record["last_error"] = error or "search_failed"
+            self._finish(entry, record)
+        print(f"[scheduler] 일괄 갱신 완료: {len(results)}/{len(entries)}개 키워드 ({time.time() - started:.1f}s)")
+
+    def tick(self) -> int:
+        """실행할 시각이 된 키워드를 작업 풀에 넣습니다. 새로 시작한 작업 수를 반환합니다."""
+        entries = self._reload_watchlist()
+        now = time.time()
+        with self._lock:
+            due = self._due_entries(entries, now)
+            batch = [e for e in due if not e.incremental]
+            for entry in due:
+                if entry.incremental:
+                    self._running[entry.keyword] = self.executor.submit(self._run_entry, entry)
+            if batch:
+                future = self.executor.submit(self._run_batch, batch)
+                for entry in batch:
+                    self._running[entry.keyword] = future
+            self._save_state()
+        return len(due)
+
+    def run_forever(self, tick_seconds: float = 10.0):
+        """stop()이 호출될 때까지 tick_seconds 마다 워치리스트를 확인합니다."""
+        print(f"[scheduler] 시작: {self.watchlist_path} (확인 주기 {tick_seconds:.0f}초)")
+        try:
+            while not self._stop.is_set():
+                self.tick()
+                self._stop.wait(tick_seconds)
+        finally:
+            self.executor.shutdown(wait=True)
+
+    def run_once(self):
+        """모든 워치리스트 키워드를 즉시 한 번 갱신하고 끝날 때까지 기다립니다."""
+        entries = self._reload_watchlist()
+        for entry in entries:
+            self.state.setdefault(entry.keyword, {})["next_run"] = 0
+        self.tick()
+        self.executor.shutdown(wait=True)
+
+    def stop(self):
+        self._stop.set()
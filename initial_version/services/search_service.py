@@ -1,16 +1,38 @@
-from typing import List
-from tavily import TavilyClient
+import math
+from datetime import datetime, timezone
+from typing import List, Optional, Set
 from config.settings import Settings
+from services.clients import get_tavily_client
 from domain.news_article import NewsArticle
 from utils.exceptions import AppError
+from utils.dedup import collapse_near_duplicates
+from utils.rate_limiter import get_limiter
+from utils.retry import call_with_retry, classify_error, get_breaker
+from utils.search_cache import get_search_cache
+from utils.date_parser import parse_pub_date
+from utils.timing import span, timed
 
-def search_news(keyword: str, num_results: int = 5) -> List[NewsArticle]:
+# Tavily가 요청 1건에 반환하는 최대 결과 수 (페이지 나누기를 지원하지 않으므로 검색 1건의 상한)
+TAVILY_MAX_RESULTS = 20
+
+@timed("search_news")
+def search_news(
+    keyword: str,
+    num_results: int = 5,
+    since: Optional[datetime] = None,
+    exclude_urls: Optional[Set[str]] = None,
+    use_cache: bool = False
+) -> List[NewsArticle]:
     """
     Tavily API를 사용하여 뉴스 기사를 검색합니다.
     
     Args:
         keyword (str): 검색할 키워드
         num_results (int): 가져올 결과 개수 (기본값: 5)
+        since (datetime): 지정하면 이 시각 이후에 발행된 기사만 반환합니다. (증분 검색)
+        exclude_urls (Set[str]): 이미 저장된 기사 URL (결과에서 제외)
+        use_cache (bool): 시작 시 예열한 결과가 있으면 API 호출 없이 반환합니다. (항목은 한 번만 사용)
+            결과를 캐시에 넣지는 않습니다. (예열만 캐시를 채움)
         
     Returns:
         List[NewsArticle]: 검색된 뉴스 기사 리스트
@@ -19,24 +41,64 @@ def search_news(keyword: str, num_results: int = 5) -> List[NewsArticle]:
         AppError: API 키 오설정, 한도 초과, 네트워크 오류 등 발생 시
     """
     settings = Settings()
+
+    # 대화형 검색은 예열된 결과가 있으면 한 번 사용 (증분 검색은 항상 새로 요청)
+    cache = get_search_cache(settings) if use_cache and since is None and not exclude_urls else None
+    if cache is not None:
+        cached = cache.take(keyword, num_results)
+        if cached is not None:
+            return cached
+
+    limiter = get_limiter("tavily", settings)
     
     try:
-        client = TavilyClient(api_key=settings.TAVILY_API_KEY)
+        client = get_tavily_client(settings)
         
         # Tavily 검색 수행 (뉴스 모드)
-        # 훨씬 더 많은 결과를 가져온 뒤 최신순으로 정렬하여 상위 n개를 반환합니다.
+        # 가능한 최대 개수를 가져온 뒤 최신순으로 정렬하여 상위 n개를 반환합니다.
         # 이렇게 함으로써 단순 '관련성' 위주가 아닌 '전체 중 최신' 기사를 더 잘 확보할 수 있습니다.
-        fetch_count = max(num_results * 3, 20)
+        # (num_results가 TAVILY_MAX_RESULTS에 가까우면 중복 제거 후 요청한 개수보다 적을 수 있음)
+        fetch_count = TAVILY_MAX_RESULTS
         
-        response = client.search(
-            query=keyword,
-            search_depth="advanced",
-            include_domains=settings.SEARCH_DOMAINS,
-            max_results=fetch_count,
-            topic="news"
+        search_params = {}
+        if since is not None:
+            # 증분 검색: 마지막 기사 발행일 이후 기간(일 단위)만 요청
+            elapsed_days = (datetime.now(timezone.utc) - since).total_seconds() / 86400
+            search_params["days"] = max(1, math.ceil(elapsed_days))
+
+        def request():
+            # 분당/월간 한도 확인 (재시도도 요청 1건으로 계산, 한도 초과 시 잠시 대기 후 AppError)
+            limiter.acquire(settings.RATE_LIMIT_MAX_WAIT)
+            with span("tavily", keyword=keyword):
+                return client.search(
+                    query=keyword,
+                    search_depth="advanced",
+                    include_domains=settings.SEARCH_DOMAINS,
+                    max_results=fetch_count,
+                    topic="news",
+                    **search_params
+                )
+
+        # 429/5xx/연결 오류는 지수 백오프로 재시도하고, 장애가 계속되면 서킷을 열어 즉시 실패시킵니다
+        response = call_with_retry(
+            request,
+            get_breaker("tavily", settings),
+            max_attempts=settings.SEARCH_MAX_ATTEMPTS,
+            base_delay=settings.RETRY_BASE_DELAY,
+            max_delay=settings.RETRY_MAX_DELAY,
         )
         
         results = response.get('results', [])
+
+        # 증분 검색: 이미 저장된 기사와 since 이전 기사 제외 (발행일을 알 수 없는 새 URL은 유지)
+        if exclude_urls:
+            results = [r for r in results if r.get('url') not in exclude_urls]
+        if since is not None:
+            results = [
+                r for r in results
+                if parse_pub_date(r.get('published_date')) is None
+                or parse_pub_date(r.get('published_date')) > since
+            ]
         
         # 1. 날짜 정보가 있는 것과 없는 것을 분리
         # 2. 날짜 정보가 있는 것들을 최신순 정렬
@@ -48,9 +110,6 @@ def search_news(keyword: str, num_results: int = 5) -> List[NewsArticle]:
             return str(d) if d else ""
 
         results.sort(key=get_date, reverse=True)
-        
-        # 요청된 개수만큼 자르기
-        results = results[:num_results]
             
         articles = []
         for res in results:
@@ -60,19 +119,13 @@ def search_news(keyword: str, num_results: int = 5) -> List[NewsArticle]:
                 snippet=res.get('content', ''),
                 pub_date=res.get('published_date')
             ))
-            
-        return articles
 
+        # 여러 언론사에 전재된 같은 기사를 하나로 합친 뒤 요청된 개수만큼 자르기
+        # (최신순 정렬 이후에 수행하므로 가장 최신 기사가 대표 기사로 남습니다)
+        return collapse_near_duplicates(articles, settings.DEDUP_SIMILARITY)[:num_results]
+
+    except AppError:
+        raise
     except Exception as e:
-        error_str = str(e).lower()
-        # 상태 코드 또는 메시지에 따른 분기 처리
-        if "401" in error_str or "api key" in error_str:
-            raise AppError("api_key_invalid")
-        elif "429" in error_str:
-            raise AppError("rate_limit_exceeded")
-        elif "400" in error_str:
-            raise AppError("bad_request")
-        elif "50" in error_str: # 500, 502, 503, 504
-            raise AppError("server_error")
-        else:
-            raise AppError("network_error")
+        # 예외 메시지 대신 HTTP 상태 코드로 분류
+        raise AppError(classify_error(e))
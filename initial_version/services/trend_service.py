@@ -0,0 +1,289 @@
+import heapq
+import json
+import os
+import threading
+from contextlib import contextmanager
+from datetime import date, timedelta
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+from domain.search_result import SearchResult
+from repositories.search_repository import SearchRepository
+
+try:
+    import fcntl  # 앱, 스케줄러, CLI, API 서버가 같은 집계 파일을 갱신할 때 사용 (Windows에는 없음)
+except ImportError:  # pragma: no cover
+    fcntl = None
+
+# 반복 등장 URL은 URL 수만큼 커지므로 최근 URL_RETENTION_DAYS일 버킷만 보관 (트렌드 화면의 최대 기간)
+URL_RETENTION_DAYS = 90
+# 이미 반영한 검색인지 확인하기 위해 보관하는 최근 search_key 수
+RECENT_KEYS_SIZE = 200
+
+
+def _empty_aggregates() -> Dict:
+    return {
+        # {키워드: {"yyyy-mm-dd": [검색 수, 기사 수]}}
+        "keyword_daily": {},
+        # {도메인: {"yyyy-mm-dd": 기사 수}}
+        "domain_daily": {},
+        # {"yyyy-mm-dd": {URL: 등장 횟수}} (최근 URL_RETENTION_DAYS일)
+        "url_daily": {},
+        # {URL: [제목, 마지막 등장 시각]} (url_daily에 남아 있는 URL만)
+        "url_titles": {},
+        # 최근 반영한 search_key (같은 검색을 두 번 집계하지 않도록 함)
+        "recent_keys": [],
+        "total_searches": 0,
+        "total_articles": 0,
+    }
+
+
+def _upgrade(data: Dict) -> Dict:
+    """이전 형식({URL: [등장 횟수, 제목, 마지막 등장 시각]})의 URL 집계를 마지막 등장일 버킷으로 옮깁니다."""
+    data = {**_empty_aggregates(), **data}
+    for url, (count, title, last_seen) in data.pop("urls", {}).items():
+        bucket = data["url_daily"].setdefault(last_seen[:10], {})
+        bucket[url] = bucket.get(url, 0) + count
+        data["url_titles"][url] = [title, last_seen]
+    return data
+
+
+def _domain_of(url: str) -> str:
+    netloc = urlparse(url).netloc.lower()
+    return netloc[4:] if netloc.startswith("www.") else netloc
+
+
+class TrendStore:
+    """
+    키워드별 검색량, 도메인별 기사 수, 반복 등장 URL 집계를 관리합니다.
+
+    - 저장(save)될 때마다 해당 검색 결과만 반영(apply)하므로 CSV 전체를 다시 읽지 않습니다.
+    - 집계는 일(day) 단위 버킷으로 보관하므로 조회 비용은 행 수가 아니라 버킷 수에 비례합니다.
+    - 집계 파일은 여러 프로세스가 함께 갱신하므로, 파일 잠금 안에서 디스크 내용을 다시 읽고 반영한 뒤 교체합니다.
+    - 반복 등장 URL은 최근 URL_RETENTION_DAYS일 버킷만 남기므로 파일 크기가 누적 URL 수에 따라 계속 커지지 않습니다.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._data = _empty_aggregates()
+        self._mtime_ns = None
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+
+    @contextmanager
+    def _file_lock(self):
+        with self._lock:
+            if not fcntl:
+                yield
+                return
+            with open(f"{self.path}.lock", "w") as lock_file:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _reload_if_changed(self):
+        """다른 프로세스가 파일을 갱신했으면 다시 읽습니다. (_lock 안에서 호출)"""
+        try:
+            mtime_ns = os.stat(self.path).st_mtime_ns
+        except OSError:
+            return
+        if mtime_ns == self._mtime_ns:
+            return
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                self._data = _upgrade(json.load(f))
+            self._mtime_ns = mtime_ns
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"트렌드 집계 파일 로드 중 오류 발생: {e}")
+
+    def _write(self):
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self._data, f, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
+        self._mtime_ns = os.stat(self.path).st_mtime_ns
+
+    def _prune_urls(self):
+        """보관 기간이 지난 URL 버킷과, 남은 버킷에 없는 URL의 제목을 지웁니다."""
+        cutoff = self._day_range(URL_RETENTION_DAYS)[0]
+        url_daily = self._data["url_daily"]
+        expired = [day for day in url_daily if day < cutoff]
+        if not expired:
+            return
+        for day in expired:
+            del url_daily[day]
+        remaining = set()
+        for bucket in url_daily.values():
+            remaining.update(bucket)
+        self._data["url_titles"] = {url: entry for url, entry in self._data["url_titles"].items() if url in remaining}
+
+    def _apply(self, result: SearchResult) -> bool:
+        """검색 결과 1건을 집계에 더합니다. 이미 반영한 search_key면 건너뛰고 False를 반환합니다."""
+        recent_keys = self._data["recent_keys"]
+        if result.search_key in recent_keys:
+            return False
+        recent_keys.append(result.search_key)
+        del recent_keys[:-RECENT_KEYS_SIZE]
+
+        day = result.search_time.strftime("%Y-%m-%d")
+        seen_at = result.search_time.isoformat(timespec="seconds")
+
+        keyword_bucket = self._data["keyword_daily"].setdefault(result.keyword, {}).setdefault(day, [0, 0])
+        keyword_bucket[0] += 1
+        keyword_bucket[1] += len(result.articles)
+        self._data["total_searches"] += 1
+        self._data["total_articles"] += len(result.articles)
+
+        for article in result.articles:
+            domain = _domain_of(article.url)
+            if domain:
+                daily = self._data["domain_daily"].setdefault(domain, {})
+                daily[day] = daily.get(day, 0) + 1
+
+            urls = self._data["url_daily"].setdefault(day, {})
+            urls[article.url] = urls.get(article.url, 0) + 1
+            entry = self._data["url_titles"].get(article.url)
+            if entry is None or seen_at >= entry[1]:
+                self._data["url_titles"][article.url] = [article.title, seen_at]
+        return True
+
+    def apply(self, result: SearchResult, repository: Optional[SearchRepository] = None):
+        """
+        저장된 검색 결과 1건을 집계에 반영합니다. (SearchRepository 저장 리스너)
+
+        리스너는 CSV 잠금이 풀린 뒤 호출되므로, 그 사이에 다른 프로세스의 rebuild가 같은 행을 이미 읽었을 수 있습니다.
+        rebuild도 recent_keys를 채우므로 그런 검색은 여기서 건너뛰어 두 번 집계되지 않습니다.
+        집계 파일이 아직 없고 repository가 있으면 이번 결과까지 저장된 전체 기록으로 만듭니다.
+        """
+        with self._file_lock():
+            if repository is not None and not os.path.exists(self.path):
+                self._rebuild(repository)
+                return
+            self._reload_if_changed()
+            if self._apply(result):
+                self._prune_urls()
+                self._write()
+
+    def rebuild(self, repository: SearchRepository):
+        """저장된 전체 기록으로 집계를 다시 만듭니다."""
+        with self._file_lock():
+            self._rebuild(repository)
+
+    def _rebuild(self, repository: SearchRepository):
+        self._data = _empty_aggregates()
+        for result in repository.iter_all():
+            self._apply(result)
+        self._prune_urls()
+        self._write()
+
+    def ensure_built(self, repository: SearchRepository):
+        """집계 파일이 없으면 기존 기록으로 한 번 만듭니다."""
+        if os.path.exists(self.path):
+            return
+        with self._file_lock():
+            # 잠금을 기다리는 동안 다른 프로세스가 이미 만들었으면 다시 만들지 않음
+            if not os.path.exists(self.path):
+                self._rebuild(repository)
+
+    @contextmanager
+    def _reading(self):
+        """최신 집계를 읽는 동안 다른 스레드의 반영을 막습니다."""
+        with self._lock:
+            self._reload_if_changed()
+            yield self._data
+
+    # ---------- 조회 (버킷 수에 비례) ----------
+
+    @staticmethod
+    def _day_range(days: int, today: Optional[date] = None) -> List[str]:
+        today = today or date.today()
+        return [(today - timedelta(days=offset)).strftime("%Y-%m-%d") for offset in range(days - 1, -1, -1)]
+
+    def keyword_series(self, days: int = 30, top: int = 5, keywords: Optional[List[str]] = None) -> Tuple[List[str], Dict[str, List[int]]]:
+        """
+        최근 days일 동안의 키워드별 일별 검색 수를 반환합니다.
+        keywords를 지정하지 않으면 기간 내 검색이 많은 상위 top개 키워드를 사용합니다.
+
+        Returns:
+            (날짜 목록, {키워드: 날짜별 검색 수})
+        """
+        day_list = self._day_range(days)
+        start = day_list[0]
+
+        with self._reading() as data:
+            keyword_daily = data["keyword_daily"]
+            if keywords is None:
+                totals = {
+                    keyword: sum(bucket[0] for day, bucket in buckets.items() if day >= start)
+                    for keyword, buckets in keyword_daily.items()
+                }
+                keywords = [k for k, n in heapq.nlargest(top, totals.items(), key=lambda item: item[1]) if n > 0]
+
+            series = {
+                keyword: [keyword_daily.get(keyword, {}).get(day, [0, 0])[0] for day in day_list]
+                for keyword in keywords
+            }
+        return day_list, series
+
+    def domain_counts(self, days: int = 30, top: int = 10) -> List[Tuple[str, int]]:
+        """최근 days일 동안 도메인별 기사 수 상위 top개를 반환합니다."""
+        start = self._day_range(days)[0]
+        with self._reading() as data:
+            totals = {
+                domain: sum(n for day, n in buckets.items() if day >= start)
+                for domain, buckets in data["domain_daily"].items()
+            }
+        return [(d, n) for d, n in heapq.nlargest(top, totals.items(), key=lambda item: item[1]) if n > 0]
+
+    def top_urls(self, days: int = 30, top: int = 10, min_count: int = 2) -> List[Dict]:
+        """
+        최근 days일 동안 여러 번 검색 결과에 등장한 URL 상위 top개를 반환합니다.
+        URL 버킷은 최근 URL_RETENTION_DAYS일만 보관하므로 그보다 긴 기간은 보관 기간으로 잘립니다.
+        """
+        start = self._day_range(min(days, URL_RETENTION_DAYS))[0]
+        with self._reading() as data:
+            counts: Dict[str, int] = {}
+            for day, bucket in data["url_daily"].items():
+                if day >= start:
+                    for url, n in bucket.items():
+                        counts[url] = counts.get(url, 0) + n
+            ranked = heapq.nlargest(top, ((n, url) for url, n in counts.items() if n >= min_count))
+            titles = data["url_titles"]
+            return [
+                {"url": url, "count": count, "title": titles.get(url, [url, ""])[0], "last_seen": titles.get(url, ["", ""])[1]}
+                for count, url in ranked
+            ]
+
+    def totals(self) -> Dict[str, int]:
+        with self._reading() as data:
+            return {
+                "searches": data["total_searches"],
+                "articles": data["total_articles"],
+                "keywords": len(data["keyword_daily"]),
+                "domains": len(data["domain_daily"]),
+            }
+
+
+_stores: Dict[str, TrendStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_trend_store(path: str) -> TrendStore:
+    """경로별로 프로세스 공유 TrendStore를 반환합니다."""
+    with _stores_lock:
+        if path not in _stores:
+            _stores[path] = TrendStore(path)
+        return _stores[path]
+
+
+def attach_trend_tracking(repository: SearchRepository, trends_path: str) -> TrendStore:
+    """
+    저장될 때마다 트렌드 집계를 갱신하도록 리포지토리에 리스너를 등록합니다.
+
+    등록할 때는 집계 파일을 만들지 않습니다. (앱 첫 화면이 CSV 전체를 읽지 않도록 함)
+    파일이 없으면 첫 저장 때, 또는 트렌드 화면을 열 때(ensure_built) 기존 기록으로 만듭니다.
+    """
+    store = get_trend_store(trends_path)
+    repository.add_save_listener(lambda result: store.apply(result, repository))
+    return store
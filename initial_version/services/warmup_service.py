@@ -0,0 +1,104 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional
+from config.settings import Settings
+from repositories.search_repository import SearchRepository
+from services.pipeline_service import run_warmup_pipeline
+from utils.exceptions import AppError
+from utils.rate_limiter import get_quota_status
+from utils.search_cache import get_search_cache
+from utils.timing import span
+
+# 키워드 1개 예열에 드는 예상 API 호출 수 (Tavily 검색 1 + Gemini 요약 1)
+CALLS_PER_KEYWORD = 2
+
+_status: Dict = {}
+_status_lock = threading.Lock()
+
+
+def _update_status(**fields):
+    with _status_lock:
+        _status.update(fields)
+
+
+def get_warmup_status() -> Dict:
+    """마지막 캐시 예열 진행 상황을 반환합니다. (예열을 시작하지 않았다면 빈 dict)"""
+    with _status_lock:
+        return dict(_status)
+
+
+def _quota_allows(settings: Settings) -> bool:
+    """
+    예열은 사용자 요청보다 우선하지 않으므로, 분당 한도가 절반 이상 남아 있고
+    월간 한도가 WARMUP_MIN_QUOTA_REMAINING 이상 남아 있을 때만 호출합니다.
+    """
+    for status in get_quota_status(settings).values():
+        if status["minute_remaining"] is not None and status["minute_remaining"] < status["per_minute"] / 2:
+            return False
+        if status["month_remaining"] is not None and status["month_remaining"] < settings.WARMUP_MIN_QUOTA_REMAINING:
+            return False
+    return True
+
+
+def warm_up(repository: SearchRepository, settings: Settings) -> Dict:
+    """
+    최근 가장 많이 검색된 키워드를 미리 검색/요약하여 검색 캐시와 요약 캐시를 채웁니다.
+
+    - 결과는 저장하지 않습니다. (검색 기록과 트렌드 집계에 남지 않음)
+    - 예열한 검색 결과는 그 키워드의 첫 대화형 검색에 한 번만 쓰입니다.
+    - WARMUP_CONCURRENCY 개씩 동시에 실행하고, 예상 API 호출 수가 WARMUP_MAX_CALLS를 넘지 않게 키워드 수를 줄입니다.
+    - 이미 캐시에 있는 키워드는 건너뛰며, 한도가 부족하면 남은 키워드를 건너뜁니다.
+
+    Returns:
+        Dict: 예열 결과 (키워드 목록, 예열/건너뜀/실패 수, 소요 시간)
+    """
+    started = time.monotonic()
+    cache = get_search_cache(settings)
+    num_results = settings.WARMUP_NUM_RESULTS
+
+    candidates = repository.get_top_keywords(settings.WARMUP_DAYS, settings.WARMUP_KEYWORDS)
+    keywords = [k for k in candidates if cache is None or (k, num_results) not in cache]
+    keywords = keywords[:settings.WARMUP_MAX_CALLS // CALLS_PER_KEYWORD]
+    _update_status(
+        state="running", keywords=keywords, warmed=0, skipped=len(candidates) - len(keywords), failed=0, elapsed_seconds=0.0
+    )
+
+    def run(keyword: str):
+        if not _quota_allows(settings):
+            with _status_lock:
+                _status["skipped"] += 1
+            return
+        try:
+            with span("warmup", keyword=keyword):
+                warmed = run_warmup_pipeline(keyword, num_results)
+            with _status_lock:
+                _status["warmed" if warmed else "skipped"] += 1
+        except AppError as e:
+            print(f"[warmup] '{keyword}' 예열 실패: {e.error_type}")
+            with _status_lock:
+                _status["failed"] += 1
+        except Exception as e:
+            print(f"[warmup] '{keyword}' 예열 중 알 수 없는 오류: {e}")
+            with _status_lock:
+                _status["failed"] += 1
+
+    with ThreadPoolExecutor(max_workers=max(1, settings.WARMUP_CONCURRENCY), thread_name_prefix="warmup") as executor:
+        list(executor.map(run, keywords))
+
+    _update_status(state="done", elapsed_seconds=round(time.monotonic() - started, 2))
+    status = get_warmup_status()
+    print(
+        f"[warmup] 예열 완료: {status['warmed']}개 예열, {status['skipped']}개 건너뜀, "
+        f"{status['failed']}개 실패 ({status['elapsed_seconds']}초)"
+    )
+    return status
+
+
+def start_warmup(repository: SearchRepository, settings: Settings) -> Optional[threading.Thread]:
+    """캐시 예열을 백그라운드 스레드에서 시작합니다. (WARMUP_KEYWORDS가 0이면 실행하지 않음)"""
+    if settings.WARMUP_KEYWORDS <= 0:
+        return None
+    thread = threading.Thread(target=warm_up, args=(repository, settings), name="cache-warmup", daemon=True)
+    thread.start()
+    return thread
@@ -0,0 +1,70 @@
+import asyncio
+import json
+import pytest
+from services.api_service import MAX_BODY_BYTES, MAX_HEADERS, ApiServer, HttpError
+
+
+def _read(data: bytes):
+    async def run():
+        reader = asyncio.StreamReader()
+        reader.feed_data(data)
+        reader.feed_eof()
+        # _read_request는 인스턴스 상태를 쓰지 않으므로 초기화 없이 호출
+        return await ApiServer.__new__(ApiServer)._read_request(reader)
+
+    return asyncio.run(run())
+
+
+def _error(data: bytes):
+    with pytest.raises(HttpError) as exc:
+        _read(data)
+    return exc.value.status, exc.value.error
+
+
+def test_parses_request_with_body():
+    method, target, version, headers, body = _read(
+        b"post /search HTTP/1.1\r\nHost: x\r\nContent-Length: 4\r\nConnection: close\r\n\r\nbody"
+    )
+    assert (method, target, version) == ("POST", "/search", "HTTP/1.1")
+    assert headers["connection"] == "close"
+    assert body == b"body"
+
+
+def test_closed_connection_returns_none():
+    assert _read(b"") is None
+
+
+def test_bad_request_line():
+    assert _error(b"GET\r\n\r\n") == (400, "bad_request_line")
+
+
+@pytest.mark.parametrize("value", [b"abc", b"-5", b"1.5"])
+def test_bad_content_length(value):
+    assert _error(b"POST / HTTP/1.1\r\nContent-Length: " + value + b"\r\n\r\n") == (400, "bad_content_length")
+
+
+def test_body_too_large():
+    request = b"POST / HTTP/1.1\r\nContent-Length: %d\r\n\r\n" % (MAX_BODY_BYTES + 1)
+    assert _error(request) == (413, "body_too_large")
+
+
+def test_request_line_too_long():
+    assert _error(b"GET /" + b"a" * 70000 + b" HTTP/1.1\r\n\r\n") == (414, "request_line_too_long")
+
+
+def test_too_many_headers():
+    headers = b"".join(b"X-%d: 1\r\n" % i for i in range(MAX_HEADERS + 1))
+    assert _error(b"GET / HTTP/1.1\r\n" + headers + b"\r\n") == (431, "header_too_large")
+
+
+def test_headers_too_large():
+    assert _error(b"GET / HTTP/1.1\r\nX-A: " + b"a" * 20000 + b"\r\n\r\n") == (431, "header_too_large")
+
+
+def test_response_is_standard_json_with_nan():
+    raw = ApiServer._encode_response(200, {"pub_date": float("nan"), "scores": [1.5, float("inf")]}, keep_alive=True)
+    head, body = raw.split(b"\r\n\r\n", 1)
+
+    assert b"Connection: keep-alive" in head
+    assert b"Content-Length: %d" % len(body) in head
+    assert json.loads(body) == {"pub_date": None, "scores": [1.5, None]}
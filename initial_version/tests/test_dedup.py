@@ -0,0 +1,61 @@
+import random
+import time
+from domain.news_article import NewsArticle
+from utils.dedup import collapse_near_duplicates, estimate_similarity, minhash_signature
+
+
+def _article(i: int, title: str, snippet: str = "") -> NewsArticle:
+    return NewsArticle(title=title, url=f"https://news{i}.example.com/a", snippet=snippet)
+
+
+def test_identical_text_has_full_similarity():
+    signature = minhash_signature("삼성전자 3분기 영업이익 10조 돌파")
+    assert estimate_similarity(signature, signature) == 1.0
+
+
+def test_empty_text_has_no_signature():
+    assert minhash_signature("  !! ") == ()
+    assert estimate_similarity((), ()) == 0.0
+
+
+def test_collapses_republished_articles_into_first():
+    title = "삼성전자 3분기 영업이익 10조 돌파 반도체 회복"
+    snippet = "삼성전자가 3분기 영업이익 10조원을 기록했다고 밝혔다"
+    articles = [_article(i, title, snippet) for i in range(4)]
+    articles.append(_article(9, "현대차 전기차 신모델 공개", "현대차가 새 전기차를 공개했다"))
+
+    result = collapse_near_duplicates(articles)
+
+    assert [a.title for a in result] == [title, "현대차 전기차 신모델 공개"]
+    assert result[0].url == "https://news0.example.com/a"
+    assert result[0].alternate_urls == [f"https://news{i}.example.com/a" for i in (1, 2, 3)]
+
+
+def test_does_not_duplicate_alternate_urls():
+    first = _article(0, "같은 제목의 기사 내용", "같은 스니펫")
+    second = _article(1, "같은 제목의 기사 내용", "같은 스니펫")
+    second.alternate_urls = [first.url, "https://mirror.example.com/a"]
+
+    result = collapse_near_duplicates([first, second])
+
+    assert len(result) == 1
+    assert result[0].alternate_urls == [second.url, "https://mirror.example.com/a"]
+
+
+def test_disabled_threshold_keeps_everything():
+    articles = [_article(i, "같은 제목", "같은 내용") for i in range(3)]
+    assert len(collapse_near_duplicates(articles, threshold=0)) == 3
+
+
+def test_many_near_duplicates_stay_fast():
+    """임계값 바로 아래의 비슷한 기사가 많아도 후보 비교 수가 제한되어 빠르게 끝나야 합니다."""
+    words = "반도체 실적 발표 영업이익 증가 메모리 가격 상승 수요 확대 전망 투자자 관심 집중 시장".split()
+    rng = random.Random(1)
+    articles = []
+    for i in range(2000):
+        rng.shuffle(words)
+        articles.append(_article(i, " ".join(words[:8]) + f" {i}", " ".join(words[8:]) + f" n{i * 7919}"))
+
+    started = time.perf_counter()
+    collapse_near_duplicates(articles)
+    assert time.perf_counter() - started < 5
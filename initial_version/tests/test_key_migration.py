@@ -0,0 +1,87 @@
+import json
+from datetime import datetime
+from domain.news_article import NewsArticle
+from domain.search_result import SearchResult
+from repositories.search_repository import SearchRepository
+from tools.migrate_search_keys import migrate_scheduler_state
+from utils.key_generator import (
+    SEARCH_KEY_LENGTH,
+    format_search_label,
+    generate_search_key,
+    is_search_key,
+    search_key_time,
+)
+
+
+def _save(repository: SearchRepository, key: str, when: datetime, base_key=None, url="https://a.example.com/1"):
+    repository.save(SearchResult(
+        search_key=key,
+        search_time=when,
+        keyword="AI",
+        articles=[NewsArticle(title="제목", url=url, snippet="내용")],
+        ai_summary="요약",
+        summary_base_key=base_key,
+    ))
+
+
+def test_generated_keys_are_fixed_length_and_increasing():
+    keys = [generate_search_key() for _ in range(1000)]
+    assert all(len(k) == SEARCH_KEY_LENGTH and is_search_key(k) for k in keys)
+    assert keys == sorted(keys)
+    assert len(set(keys)) == len(keys)
+
+
+def test_key_records_its_time():
+    when = datetime(2026, 3, 1, 12, 30, 15)
+    key = generate_search_key(when)
+    assert search_key_time(key) == when
+    assert format_search_label("AI", when) == "AI (2026-03-01 12:30)"
+
+
+def test_legacy_keys_are_not_search_keys():
+    assert not is_search_key("AI-202603011230")
+    assert not is_search_key(None)
+
+
+def test_migrates_keys_and_splits_collisions(tmp_path):
+    repository = SearchRepository(str(tmp_path / "history.csv"))
+    first, second = datetime(2026, 3, 1, 12, 30, 5), datetime(2026, 3, 1, 12, 30, 40)
+    # 같은 분에 두 번 저장되어 키가 겹친 이전 기록
+    _save(repository, "AI-202603011230", first)
+    _save(repository, "AI-202603011230", second, url="https://a.example.com/2")
+    _save(repository, "AI-202603011300", datetime(2026, 3, 1, 13, 0), base_key="AI-202603011230")
+
+    assert repository.migrate_search_keys(dry_run=True)
+    assert repository.get_all_keys()[0] == "AI-202603011300"
+
+    mapping = repository.migrate_search_keys()
+
+    assert set(mapping) == {"AI-202603011230", "AI-202603011300"}
+    split = mapping["AI-202603011230"]
+    assert len(split) == 2 and split == sorted(split)
+    assert [search_key_time(k) for k in split] == [first, second]
+
+    latest = repository.find_by_key(mapping["AI-202603011300"][0])
+    # 증분 기록의 이전 버전은 그보다 앞선 가장 최근 기록
+    assert latest.summary_base_key == split[1]
+    assert all(is_search_key(k) for k in repository.get_all_keys())
+
+    # 다시 실행해도 바꿀 키가 없음
+    assert repository.migrate_search_keys() == {}
+
+
+def test_migrates_scheduler_state(tmp_path):
+    state_path = tmp_path / "scheduler_state.json"
+    state_path.write_text(json.dumps({
+        "AI": {"last_key": "AI-202603011230", "last_run": 1},
+        "반도체": {"last_key": "01JAB3X6K9Q4T2V7W8Y0Z1M5NP"},
+    }), encoding="utf-8")
+    mapping = {"AI-202603011230": ["01JAB3X6K9Q4T2V7W8Y0Z1M5NA", "01JAB3X6K9Q4T2V7W8Y0Z1M5NB"]}
+
+    assert migrate_scheduler_state(str(state_path), mapping, dry_run=True) == 1
+    assert json.loads(state_path.read_text(encoding="utf-8"))["AI"]["last_key"] == "AI-202603011230"
+
+    assert migrate_scheduler_state(str(state_path), mapping, dry_run=False) == 1
+    state = json.loads(state_path.read_text(encoding="utf-8"))
+    assert state["AI"] == {"last_key": "01JAB3X6K9Q4T2V7W8Y0Z1M5NB", "last_run": 1}
+    assert state["반도체"]["last_key"] == "01JAB3X6K9Q4T2V7W8Y0Z1M5NP"
@@ -0,0 +1,63 @@
+import json
+import pytest
+from utils.exceptions import AppError
+from utils.rate_limiter import RateLimiter
+
+
+def test_allows_up_to_per_minute_then_rejects():
+    limiter = RateLimiter("test", per_minute=3)
+    for _ in range(3):
+        limiter.acquire(max_wait=0)
+
+    with pytest.raises(AppError) as exc:
+        limiter.acquire(max_wait=0)
+    assert exc.value.error_type == "rate_limit_exceeded"
+
+
+def test_waits_for_refill_within_max_wait():
+    # 분당 600회 = 0.1초마다 토큰 1개
+    limiter = RateLimiter("test", per_minute=600)
+    limiter._state["tokens"] = 0.0
+    limiter.acquire(max_wait=1)
+    assert limiter.status()["month_used"] == 1
+
+
+def test_monthly_quota():
+    limiter = RateLimiter("test", per_minute=0, per_month=2)
+    limiter.acquire(max_wait=0)
+    limiter.acquire(max_wait=0)
+
+    with pytest.raises(AppError) as exc:
+        limiter.acquire(max_wait=0)
+    assert exc.value.error_type == "monthly_quota_exceeded"
+    assert limiter.status()["month_remaining"] == 0
+
+
+def test_monthly_usage_resets_when_month_changes():
+    limiter = RateLimiter("test", per_minute=0, per_month=1)
+    limiter.acquire(max_wait=0)
+    limiter._state["month"] = "2000-01"
+    limiter.acquire(max_wait=0)
+    assert limiter.status()["month_used"] == 1
+
+
+def test_state_file_is_shared_between_limiters(tmp_path):
+    """상태 파일을 쓰면 재시작한 프로세스(새 제한기)도 월간 사용량을 이어서 셉니다."""
+    path = str(tmp_path / "state" / "rate_limit_state.json")
+    RateLimiter("tavily", per_minute=0, per_month=5, state_path=path).acquire(max_wait=0)
+    RateLimiter("gemini", per_minute=0, per_month=5, state_path=path).acquire(max_wait=0)
+
+    restarted = RateLimiter("tavily", per_minute=0, per_month=5, state_path=path)
+    restarted.acquire(max_wait=0)
+
+    assert restarted.status()["month_used"] == 2
+    with open(path, encoding="utf-8") as f:
+        assert set(json.load(f)) == {"tavily", "gemini"}
+
+
+def test_corrupt_state_file_starts_fresh(tmp_path):
+    path = tmp_path / "rate_limit_state.json"
+    path.write_text("{not json", encoding="utf-8")
+    limiter = RateLimiter("tavily", per_minute=0, per_month=5, state_path=str(path))
+    limiter.acquire(max_wait=0)
+    assert limiter.status()["month_used"] == 1
@@ -0,0 +1,127 @@
+import pytest
+from utils import retry
+from utils.exceptions import AppError
+from utils.retry import CircuitBreaker, call_with_retry, classify_error, is_retryable
+
+
+class HttpFailure(Exception):
+    def __init__(self, status_code: int):
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+
+
+class UsageLimitExceededError(Exception):
+    """tavily 예외처럼 상태 코드 속성이 없는 예외"""
+
+
+@pytest.fixture(autouse=True)
+def no_sleep(monkeypatch):
+    monkeypatch.setattr(retry.time, "sleep", lambda _: None)
+
+
+def _breaker(name="test", **kwargs) -> CircuitBreaker:
+    # 지표는 get_breaker로 등록된 서비스만 집계하므로 테스트용 이름도 등록
+    retry._metrics[name] = {"calls": 0, "retries": 0, "failures": 0, "rejected": 0}
+    return CircuitBreaker(name, **kwargs)
+
+
+def _failing(*errors, result="ok"):
+    calls = {"count": 0}
+
+    def fn():
+        calls["count"] += 1
+        if calls["count"] <= len(errors):
+            raise errors[calls["count"] - 1]
+        return result
+
+    return fn, calls
+
+
+def test_classify_error():
+    assert classify_error(HttpFailure(401)) == "api_key_invalid"
+    assert classify_error(HttpFailure(429)) == "rate_limit_exceeded"
+    assert classify_error(UsageLimitExceededError()) == "rate_limit_exceeded"
+    assert classify_error(HttpFailure(503)) == "server_error"
+    assert classify_error(ConnectionError()) == "network_error"
+
+
+def test_is_retryable():
+    assert is_retryable(HttpFailure(429))
+    assert is_retryable(HttpFailure(502))
+    assert is_retryable(TimeoutError())
+    assert not is_retryable(HttpFailure(400))
+    assert not is_retryable(ValueError("bad"))
+
+
+def test_retries_until_success():
+    fn, calls = _failing(HttpFailure(503), HttpFailure(429))
+    assert call_with_retry(fn, _breaker(), max_attempts=3) == "ok"
+    assert calls["count"] == 3
+
+
+def test_gives_up_after_max_attempts():
+    fn, calls = _failing(*[HttpFailure(503)] * 5)
+    with pytest.raises(HttpFailure):
+        call_with_retry(fn, _breaker(), max_attempts=2)
+    assert calls["count"] == 2
+
+
+def test_non_retryable_error_is_not_retried():
+    fn, calls = _failing(HttpFailure(400))
+    breaker = _breaker(failure_threshold=1)
+    with pytest.raises(HttpFailure):
+        call_with_retry(fn, breaker, max_attempts=3)
+    assert calls["count"] == 1
+    assert breaker.state == "closed"
+
+
+def test_breaker_opens_and_rejects_without_calling():
+    breaker = _breaker(failure_threshold=2, recovery_timeout=60)
+    fn, calls = _failing(*[HttpFailure(503)] * 5)
+    with pytest.raises(HttpFailure):
+        call_with_retry(fn, breaker, max_attempts=2)
+    assert breaker.state == "open"
+
+    with pytest.raises(AppError) as exc:
+        call_with_retry(fn, breaker)
+    assert exc.value.error_type == "service_unavailable"
+    assert calls["count"] == 2
+
+
+def test_half_open_allows_one_trial_and_closes_on_success():
+    breaker = _breaker(failure_threshold=1, recovery_timeout=0)
+    breaker.record_failure()
+    assert breaker.state == "open"
+
+    breaker.before_call()
+    assert breaker.state == "half_open"
+    # 시험 호출이 진행 중이면 다른 호출은 거절
+    with pytest.raises(AppError):
+        breaker.before_call()
+
+    breaker.record_success()
+    assert breaker.state == "closed"
+
+
+def test_half_open_failure_reopens():
+    breaker = _breaker(failure_threshold=1, recovery_timeout=0)
+    breaker.record_failure()
+    fn, _ = _failing(HttpFailure(503))
+    with pytest.raises(HttpFailure):
+        call_with_retry(fn, breaker, max_attempts=1)
+    assert breaker.state == "open"
+    assert breaker.open_count == 2
+
+
+@pytest.mark.parametrize("error", [HttpFailure(400), AppError("rate_limit_exceeded")])
+def test_half_open_trial_slot_is_released_without_closing(error):
+    """서버 장애가 아닌 오류로 끝난 시험 호출은 브레이커를 닫지 않고 자리만 반납합니다."""
+    breaker = _breaker(failure_threshold=1, recovery_timeout=0)
+    breaker.record_failure()
+    fn, _ = _failing(error)
+    with pytest.raises(type(error)):
+        call_with_retry(fn, breaker)
+    assert breaker.state == "half_open"
+
+    assert call_with_retry(lambda: "ok", breaker) == "ok"
+    assert breaker.state == "closed"
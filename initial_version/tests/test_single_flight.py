@@ -0,0 +1,82 @@
+import threading
+import time
+import pytest
+from utils.single_flight import SingleFlight
+
+
+def _run_concurrently(flight: SingleFlight, key, leader_fn, follower_fn, followers: int = 3):
+    """리더가 fn을 실행하는 동안 follower들이 같은 키로 합류하게 하고 {이름: 결과 또는 예외}를 반환합니다."""
+    started = threading.Event()
+    release = threading.Event()
+    outcomes = {}
+
+    def leader():
+        started.set()
+        release.wait(2)
+        return leader_fn()
+
+    def call(name, fn):
+        try:
+            outcomes[name] = flight.do(key, fn)
+        except BaseException as e:
+            outcomes[name] = e
+
+    threads = [threading.Thread(target=call, args=("leader", leader))]
+    threads[0].start()
+    started.wait(2)
+    for i in range(followers):
+        thread = threading.Thread(target=call, args=(f"follower{i}", follower_fn))
+        thread.start()
+        threads.append(thread)
+    # follower들이 합류할 시간을 준 뒤 리더를 진행
+    time.sleep(0.1)
+    release.set()
+    for thread in threads:
+        thread.join(2)
+    return outcomes
+
+
+def test_coalesces_concurrent_calls():
+    flight = SingleFlight()
+    calls = []
+
+    outcomes = _run_concurrently(flight, "k", lambda: calls.append("leader") or "result", lambda: calls.append("follower"))
+
+    assert calls == ["leader"]
+    assert set(outcomes.values()) == {"result"}
+    assert flight.leader_count == 1
+    assert flight.coalesced_count == 3
+
+
+def test_exception_is_shared_with_followers():
+    flight = SingleFlight()
+
+    def fail():
+        raise ValueError("boom")
+
+    outcomes = _run_concurrently(flight, "k", fail, lambda: "unused")
+
+    assert all(isinstance(o, ValueError) for o in outcomes.values())
+
+
+def test_control_flow_exception_is_not_shared():
+    """리더가 Exception이 아닌 이유로 멈추면 기다리던 호출은 직접 다시 실행합니다."""
+    flight = SingleFlight()
+
+    def interrupted():
+        raise KeyboardInterrupt
+
+    outcomes = _run_concurrently(flight, "k", interrupted, lambda: "retried")
+
+    assert isinstance(outcomes.pop("leader"), KeyboardInterrupt)
+    assert set(outcomes.values()) == {"retried"}
+
+
+def test_key_is_released_after_call():
+    flight = SingleFlight()
+    assert flight.do("k", lambda: 1) == 1
+    assert flight.do("k", lambda: 2) == 2
+
+    with pytest.raises(KeyError):
+        flight.do("k", lambda: {}["missing"])
+    assert flight.do("k", lambda: 3) == 3
@@ -0,0 +1,127 @@
+import json
+import os
+from datetime import datetime, timedelta
+import pytest
+from domain.news_article import NewsArticle
+from domain.search_result import SearchResult
+from repositories.search_repository import SearchRepository
+from services.trend_service import URL_RETENTION_DAYS, TrendStore, attach_trend_tracking
+from utils.key_generator import generate_search_key
+
+
+def _result(keyword: str, when: datetime, paths, domain: str = "news.example.com") -> SearchResult:
+    return SearchResult(
+        search_key=generate_search_key(when),
+        search_time=when,
+        keyword=keyword,
+        articles=[NewsArticle(title=f"제목 {p}", url=f"https://www.{domain}/{p}", snippet="내용") for p in paths],
+        ai_summary="요약",
+    )
+
+
+@pytest.fixture
+def paths(tmp_path):
+    return str(tmp_path / "history.csv"), str(tmp_path / "trends.json")
+
+
+def test_apply_updates_series_domains_and_totals(paths):
+    store = TrendStore(paths[1])
+    now = datetime.now()
+    store.apply(_result("AI", now, ["a", "b"]))
+    store.apply(_result("AI", now - timedelta(days=1), ["a"], domain="other.example.com"))
+    store.apply(_result("반도체", now, ["c"]))
+
+    day_list, series = store.keyword_series(days=7, top=1)
+    assert len(day_list) == 7
+    assert series == {"AI": [0, 0, 0, 0, 0, 1, 1]}
+    assert store.domain_counts(days=7) == [("news.example.com", 3), ("other.example.com", 1)]
+    assert store.totals() == {"searches": 3, "articles": 4, "keywords": 2, "domains": 2}
+
+
+def test_same_search_is_counted_once(paths):
+    store = TrendStore(paths[1])
+    result = _result("AI", datetime.now(), ["a"])
+    store.apply(result)
+    store.apply(result)
+    assert store.totals()["searches"] == 1
+
+
+def test_top_urls_is_scoped_to_period(paths):
+    store = TrendStore(paths[1])
+    now = datetime.now()
+    store.apply(_result("AI", now - timedelta(days=20), ["old"]))
+    store.apply(_result("AI", now - timedelta(days=19), ["old"]))
+    store.apply(_result("AI", now - timedelta(days=1), ["new"]))
+    store.apply(_result("AI", now, ["new"]))
+
+    assert [u["url"] for u in store.top_urls(days=7)] == ["https://www.news.example.com/new"]
+    recent = store.top_urls(days=30)
+    assert {u["url"]: u["count"] for u in recent} == {
+        "https://www.news.example.com/new": 2,
+        "https://www.news.example.com/old": 2,
+    }
+    assert recent[0]["title"].startswith("제목")
+
+
+def test_old_url_buckets_are_pruned(paths):
+    store = TrendStore(paths[1])
+    now = datetime.now()
+    store.apply(_result("AI", now - timedelta(days=URL_RETENTION_DAYS + 5), ["expired"]))
+    store.apply(_result("AI", now, ["fresh"]))
+
+    with open(paths[1], encoding="utf-8") as f:
+        data = json.load(f)
+    assert list(data["url_titles"]) == ["https://www.news.example.com/fresh"]
+    assert all(day >= (now - timedelta(days=URL_RETENTION_DAYS)).strftime("%Y-%m-%d") for day in data["url_daily"])
+    # 검색 수 집계는 URL 보관 기간과 관계없이 유지
+    assert store.totals()["searches"] == 2
+
+
+def test_legacy_url_map_is_upgraded(paths):
+    seen_at = datetime.now().isoformat(timespec="seconds")
+    with open(paths[1], "w", encoding="utf-8") as f:
+        json.dump({"urls": {"https://a.example.com/1": [3, "제목", seen_at]}, "total_searches": 3}, f)
+
+    store = TrendStore(paths[1])
+    assert store.top_urls(days=7) == [
+        {"url": "https://a.example.com/1", "count": 3, "title": "제목", "last_seen": seen_at}
+    ]
+
+
+def test_changes_from_another_process_are_reloaded(paths):
+    reader, writer = TrendStore(paths[1]), TrendStore(paths[1])
+    assert reader.totals()["searches"] == 0
+    writer.apply(_result("AI", datetime.now(), ["a"]))
+    assert reader.totals()["searches"] == 1
+
+
+def test_first_save_builds_from_history_without_double_counting(paths):
+    csv_path, trends_path = paths
+    plain = SearchRepository(csv_path)
+    plain.save(_result("AI", datetime.now() - timedelta(hours=1), ["a"]))
+
+    repository = SearchRepository(csv_path)
+    store = attach_trend_tracking(repository, trends_path)
+    assert not os.path.exists(trends_path)
+
+    repository.save(_result("AI", datetime.now(), ["b"]))
+    assert store.totals()["searches"] == 2
+
+    # 리스너보다 먼저 rebuild가 같은 행을 읽은 경우에도 다시 세지 않음
+    latest = _result("AI", datetime.now(), ["c"])
+    plain.save(latest)
+    store.rebuild(repository)
+    store.apply(latest, repository)
+    assert store.totals()["searches"] == 3
+
+
+def test_ensure_built_does_not_rebuild_existing_file(paths):
+    csv_path, trends_path = paths
+    repository = SearchRepository(csv_path)
+    repository.save(_result("AI", datetime.now(), ["a"]))
+
+    store = TrendStore(trends_path)
+    store.ensure_built(repository)
+    repository.save(_result("AI", datetime.now(), ["b"]))
+    store.ensure_built(repository)
+    assert store.totals()["searches"] == 1
@@ -0,0 +1,360 @@
+"""
+Tavily 검색 / Gemini generate_content 를 흉내 내는 로컬 가짜 HTTP 서버입니다.
+
+유료 할당량을 쓰지 않고 동시성, 캐시, 재시도 기능을 오프라인에서 재현 가능하게 측정하기 위해 사용합니다.
+
+사용 예시:
+    uv run python -m tools.fake_servers --latency-ms 400 --latency-dist lognormal --rate-429 0.05
+
+    # .env (앱/스케줄러/CLI 가 가짜 서버를 사용하도록 설정)
+    TAVILY_BASE_URL=http://127.0.0.1:8765
+    GEMINI_BASE_URL=http://127.0.0.1:8766
+"""
+import argparse
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional
+
+FAKE_DOMAINS = [
+    "www.hani.co.kr", "www.joongang.co.kr", "www.khan.co.kr", "www.donga.com",
+    "www.ytn.co.kr", "www.yna.co.kr", "news.kbs.co.kr", "news.sbs.co.kr",
+]
+
+HEADLINE_TEMPLATES = [
+    "{keyword}, 올해 시장 판도 바꾼다",
+    "정부, {keyword} 관련 지원 대책 발표",
+    "{keyword} 업계 \"하반기 투자 확대\"",
+    "전문가들 \"{keyword} 경쟁 더 치열해질 것\"",
+    "{keyword} 수요 급증에 관련 기업 주가 상승",
+    "{keyword} 규제 논의 본격화…국회 토론회 열려",
+    "국내 {keyword} 스타트업, 해외 진출 속도",
+    "{keyword} 이용자 1년 새 두 배로 늘어",
+]
+
+BODY_TEMPLATES = [
+    "{keyword}에 대한 관심이 높아지면서 관련 업계의 움직임도 빨라지고 있다.",
+    "업계 관계자는 \"{keyword} 분야는 앞으로 몇 년간 가파르게 성장할 것\"이라고 말했다.",
+    "정부는 {keyword} 생태계를 키우기 위해 예산을 늘리고 제도를 정비하겠다고 밝혔다.",
+    "일각에서는 {keyword} 확산에 따른 부작용을 우려하는 목소리도 나온다.",
+    "시장조사기관에 따르면 국내 {keyword} 시장 규모는 지난해보다 30% 이상 커졌다.",
+    "주요 기업들은 {keyword} 관련 인력 채용을 늘리고 연구개발 투자를 확대하고 있다.",
+]
+
+
+class FaultProfile:
+    """응답 지연 분포와 오류 주입 확률을 관리합니다."""
+
+    def __init__(
+        self,
+        latency_ms: float = 300.0,
+        latency_dist: str = "lognormal",
+        latency_spread: float = 0.5,
+        error_rate: float = 0.0,
+        rate_429: float = 0.0,
+        seed: Optional[int] = None
+    ):
+        self.latency_ms = latency_ms
+        self.latency_dist = latency_dist
+        self.latency_spread = latency_spread
+        self.error_rate = error_rate
+        self.rate_429 = rate_429
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self.stats = {"requests": 0, "ok": 0, "429": 0, "5xx": 0}
+
+    def sample_latency(self) -> float:
+        """지연 시간(초)을 분포에 따라 뽑습니다. latency_ms는 중앙값입니다."""
+        with self._lock:
+            median = self.latency_ms / 1000.0
+            if self.latency_dist == "fixed":
+                return median
+            if self.latency_dist == "uniform":
+                return max(0.0, self._rng.uniform(median * (1 - self.latency_spread), median * (1 + self.latency_spread)))
+            if self.latency_dist == "exponential":
+                return self._rng.expovariate(1 / median) if median > 0 else 0.0
+            # lognormal: 대부분 중앙값 근처, 가끔 긴 꼬리 지연
+            return self._rng.lognormvariate(0, self.latency_spread) * median
+
+    def pick_fault(self) -> Optional[int]:
+        """주입할 오류 상태 코드를 고릅니다. 정상 응답이면 None."""
+        with self._lock:
+            self.stats["requests"] += 1
+            roll = self._rng.random()
+            if roll < self.rate_429:
+                self.stats["429"] += 1
+                return 429
+            if roll < self.rate_429 + self.error_rate:
+                self.stats["5xx"] += 1
+                return self._rng.choice([500, 502, 503])
+            self.stats["ok"] += 1
+            return None
+
+
+# ---- 가짜 응답 생성 ----
+
+def _rng_for(text: str) -> random.Random:
+    """같은 입력에는 같은 응답이 나오도록 입력 해시로 난수 생성기를 만듭니다."""
+    return random.Random(int(hashlib.sha256(text.encode("utf-8")).hexdigest()[:16], 16))
+
+
+def build_search_results(query: str, max_results: int, days: Optional[int]) -> List[Dict]:
+    """검색어로 한국어 뉴스 기사 목록을 만듭니다. 전재 기사(같은 본문, 다른 언론사)도 일부 섞습니다."""
+    rng = _rng_for(query)
+    now = datetime.now(timezone.utc)
+    window_hours = (days or 3) * 24
+    results = []
+    for i in range(min(max_results, 20)):
+        if results and rng.random() < 0.2:
+            # 전재 기사: 앞 기사를 다른 도메인으로 복제
+            original = rng.choice(results)
+            domain = rng.choice(FAKE_DOMAINS)
+            results.append({**original, "url": f"https://{domain}/news/{rng.randrange(10**6, 10**7)}"})
+            continue
+
+        domain = rng.choice(FAKE_DOMAINS)
+        headline = rng.choice(HEADLINE_TEMPLATES).format(keyword=query)
+        body = " ".join(rng.sample(BODY_TEMPLATES, 3)).format(keyword=query)
+        published = now - timedelta(hours=rng.uniform(0, window_hours))
+        results.append({
+            "title": headline,
+            "url": f"https://{domain}/news/{rng.randrange(10**6, 10**7)}",
+            "content": body,
+            "score": round(rng.uniform(0.5, 0.99), 3),
+            "published_date": format_datetime(published, usegmt=True),
+        })
+    return results
+
+
+def _prompt_text(body: Dict) -> str:
+    parts = []
+    for content in body.get("contents", []):
+        if isinstance(content, dict):
+            for part in content.get("parts", []):
+                parts.append(part.get("text", ""))
+        elif isinstance(content, str):
+            parts.append(content)
+    return "\n".join(parts)
+
+
+def build_summary(prompt: str) -> str:
+    """프롬프트의 기사 제목을 이용해 5개 항목의 한국어 요약을 만듭니다."""
+    titles = re.findall(r"제목:\s*(.+)", prompt) or ["주요 뉴스"]
+    rng = _rng_for(prompt)
+    bullets = []
+    for title in titles[:5]:
+        bullets.append(f"* **{title.strip()}**: {rng.choice(BODY_TEMPLATES).format(keyword='관련 분야')}")
+    return "\n".join(bullets)
+
+
+def build_batch_summary(prompt: str) -> str:
+    """일괄 요약 요청([키워드: ...] 구역)에 대해 키워드별 요약 JSON 배열을 만듭니다."""
+    sections = re.split(r"\[키워드: (.+?)\]\n", prompt)[1:]
+    items = [
+        {"keyword": keyword, "summary": build_summary(body)}
+        for keyword, body in zip(sections[0::2], sections[1::2])
+    ]
+    return json.dumps(items, ensure_ascii=False)
+
+
+def _estimate_tokens(text: str) -> int:
+    return max(1, len(text) // 2)
+
+
+def build_generate_response(prompt: str, text: str) -> Dict:
+    return {
+        "candidates": [{
+            "content": {"parts": [{"text": text}], "role": "model"},
+            "finishReason": "STOP",
+            "index": 0,
+        }],
+        "usageMetadata": {
+            "promptTokenCount": _estimate_tokens(prompt),
+            "candidatesTokenCount": _estimate_tokens(text),
+            "totalTokenCount": _estimate_tokens(prompt) + _estimate_tokens(text),
+        },
+        "modelVersion": "fake-gemini",
+    }
+
+
+# ---- HTTP 핸들러 ----
+
+class _BaseHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    @property
+    def profile(self) -> FaultProfile:
+        return self.server.profile
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def _read_json(self) -> Dict:
+        length = int(self.headers.get("Content-Length") or 0)
+        raw = self.rfile.read(length) if length else b"{}"
+        try:
+            return json.loads(raw or b"{}")
+        except json.JSONDecodeError:
+            return {}
+
+    def _send_json(self, status: int, payload: Dict):
+        data = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        if self.path.startswith("/__stats"):
+            self._send_json(200, self.profile.stats)
+        else:
+            self._send_json(404, {"error": "not found"})
+
+
+class TavilyHandler(_BaseHandler):
+    def do_POST(self):
+        body = self._read_json()
+        if not self.path.rstrip("/").endswith("/search"):
+            self._send_json(404, {"detail": {"error": "not found"}})
+            return
+
+        time.sleep(self.profile.sample_latency())
+        fault = self.profile.pick_fault()
+        if fault == 429:
+            self._send_json(429, {"detail": {"error": "Rate limit exceeded (fake server)"}})
+            return
+        if fault:
+            self._send_json(fault, {"detail": {"error": "Internal server error (fake server)"}})
+            return
+
+        query = body.get("query", "")
+        results = build_search_results(query, int(body.get("max_results", 5)), body.get("days"))
+        self._send_json(200, {
+            "query": query,
+            "results": results,
+            "response_time": round(self.profile.latency_ms / 1000.0, 3),
+        })
+
+
+class GeminiHandler(_BaseHandler):
+    PATH_PATTERN = re.compile(r"/v1(?:beta|alpha)?/models/([^:/]+):(\w+)")
+
+    def _send_error_status(self, status: int):
+        names = {429: "RESOURCE_EXHAUSTED", 500: "INTERNAL", 502: "UNAVAILABLE", 503: "UNAVAILABLE"}
+        self._send_json(status, {"error": {
+            "code": status,
+            "message": "Injected error (fake server)",
+            "status": names.get(status, "UNKNOWN"),
+        }})
+
+    def do_POST(self):
+        match = self.PATH_PATTERN.search(self.path)
+        body = self._read_json()
+        if not match:
+            self._send_json(404, {"error": {"code": 404, "message": "not found", "status": "NOT_FOUND"}})
+            return
+
+        method = match.group(2)
+        prompt = _prompt_text(body)
+
+        if method == "countTokens":
+            self._send_json(200, {"totalTokens": _estimate_tokens(prompt)})
+            return
+
+        latency = self.profile.sample_latency()
+        fault = self.profile.pick_fault()
+        if fault:
+            time.sleep(latency)
+            self._send_error_status(fault)
+            return
+
+        generation_config = body.get("generationConfig") or {}
+        if generation_config.get("responseMimeType") == "application/json":
+            text = build_batch_summary(prompt)
+        else:
+            text = build_summary(prompt)
+        if method == "generateContent":
+            time.sleep(latency)
+            self._send_json(200, build_generate_response(prompt, text))
+        elif method == "streamGenerateContent":
+            self._stream(prompt, text, latency)
+        else:
+            self._send_json(404, {"error": {"code": 404, "message": "unknown method", "status": "NOT_FOUND"}})
+
+    def _stream(self, prompt: str, text: str, latency: float):
+        """SSE 형식으로 줄 단위 조각을 보냅니다. 전체 지연의 30%가 첫 조각까지의 시간입니다."""
+        chunks = [line + "\n" for line in text.split("\n")]
+        time.sleep(latency * 0.3)
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        for i, chunk in enumerate(chunks):
+            if i:
+                time.sleep(latency * 0.7 / max(1, len(chunks) - 1))
+            event = f"data: {json.dumps(build_generate_response(prompt, chunk), ensure_ascii=False)}\r\n\r\n".encode("utf-8")
+            self.wfile.write(f"{len(event):X}\r\n".encode() + event + b"\r\n")
+            self.wfile.flush()
+        self.wfile.write(b"0\r\n\r\n")
+
+
+def start_server(handler_cls, host: str, port: int, profile: FaultProfile, verbose: bool = False) -> ThreadingHTTPServer:
+    """가짜 서버를 백그라운드 스레드에서 시작하고 서버 객체를 반환합니다. (port=0이면 빈 포트 사용)"""
+    server = ThreadingHTTPServer((host, port), handler_cls)
+    server.daemon_threads = True
+    server.profile = profile
+    server.verbose = verbose
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Tavily / Gemini 가짜 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--tavily-port", type=int, default=8765)
+    parser.add_argument("--gemini-port", type=int, default=8766)
+    parser.add_argument("--latency-ms", type=float, default=300.0, help="응답 지연 중앙값(ms)")
+    parser.add_argument("--gemini-latency-ms", type=float, default=None, help="Gemini 지연 중앙값(ms, 기본: --latency-ms의 3배)")
+    parser.add_argument("--latency-dist", choices=["fixed", "uniform", "lognormal", "exponential"], default="lognormal")
+    parser.add_argument("--latency-spread", type=float, default=0.5, help="uniform: ±비율, lognormal: sigma")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="5xx 응답 비율 (0~1)")
+    parser.add_argument("--rate-429", type=float, default=0.0, help="429 응답 비율 (0~1)")
+    parser.add_argument("--seed", type=int, default=None, help="지연/오류 주입 난수 시드 (재현용)")
+    parser.add_argument("--verbose", action="store_true", help="요청 로그 출력")
+    args = parser.parse_args()
+
+    def profile(latency_ms: float, seed_offset: int) -> FaultProfile:
+        return FaultProfile(
+            latency_ms=latency_ms,
+            latency_dist=args.latency_dist,
+            latency_spread=args.latency_spread,
+            error_rate=args.error_rate,
+            rate_429=args.rate_429,
+            seed=None if args.seed is None else args.seed + seed_offset,
+        )
+
+    gemini_latency = args.gemini_latency_ms if args.gemini_latency_ms is not None else args.latency_ms * 3
+    tavily = start_server(TavilyHandler, args.host, args.tavily_port, profile(args.latency_ms, 0), args.verbose)
+    gemini = start_server(GeminiHandler, args.host, args.gemini_port, profile(gemini_latency, 1), args.verbose)
+
+    print(f"Tavily 가짜 서버: http://{args.host}:{tavily.server_address[1]}")
+    print(f"Gemini 가짜 서버: http://{args.host}:{gemini.server_address[1]}")
+    print("요청 통계: GET /__stats  |  종료: Ctrl+C")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        tavily.shutdown()
+        gemini.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""
+모듈 import 시간을 측정하고 기준값(budget)과 비교합니다. (`python -X importtime` 결과 분석)
+
+앱 첫 화면이 뜨기까지의 시간(cold start)은 대부분 import 시간이므로,
+무거운 SDK(google.genai, tavily, pandas)가 다시 시작 경로로 들어오는 것을 막기 위해 사용합니다.
+
+사용 예시:
+    uv run python -m tools.import_profiler                     # app 모듈 import 시간 상위 20개
+    uv run python -m tools.import_profiler --repeat 5 --top 30
+    uv run python -m tools.import_profiler --check             # 기준값 초과 또는 금지 모듈 import 시 종료 코드 1
+    uv run python -m tools.import_profiler --module services.pipeline_service --forbid pandas
+"""
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_BUDGET_PATH = os.path.join(PROJECT_ROOT, "tools", "import_budget.json")
+
+# "import time:       123 |       4567 |   some.module"
+_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+
+def parse_importtime(stderr: str) -> Dict[str, Tuple[int, int, int]]:
+    """-X importtime 출력을 {모듈: (self_us, cumulative_us, 깊이)}로 변환합니다."""
+    modules = {}
+    for line in stderr.splitlines():
+        match = _LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            modules[name] = (int(self_us), int(cumulative_us), (len(indent) - 1) // 2)
+    return modules
+
+
+def profile_once(module: str) -> Dict[str, Tuple[int, int, int]]:
+    """새 인터프리터에서 module을 import 하고 모듈별 import 시간을 반환합니다."""
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+    )
+    if completed.returncode != 0:
+        errors = [line for line in completed.stderr.splitlines() if not line.startswith("import time:")]
+        raise RuntimeError(f"'{module}' import 실패:\n" + "\n".join(errors[-10:]))
+    return parse_importtime(completed.stderr)
+
+
+def profile(module: str, repeat: int) -> Dict[str, Dict[str, float]]:
+    """repeat 번 측정한 모듈별 import 시간의 중앙값(ms)을 반환합니다."""
+    runs = [profile_once(module) for _ in range(max(1, repeat))]
+    merged = {}
+    for name in runs[0]:
+        samples = [run[name] for run in runs if name in run]
+        merged[name] = {
+            "self_ms": statistics.median(s[0] for s in samples) / 1000,
+            "cumulative_ms": statistics.median(s[1] for s in samples) / 1000,
+            "depth": samples[0][2],
+        }
+    return merged
+
+
+def check(results: Dict[str, Dict[str, float]], module: str, budget: Dict, forbid: List[str]) -> List[str]:
+    """기준값을 넘거나 금지 모듈이 import 되면 위반 내용을 반환합니다."""
+    violations = []
+    for name in forbid:
+        if name in results:
+            violations.append(f"{name}: '{module}' import 경로에서 불러오면 안 됩니다 (누적 {results[name]['cumulative_ms']:.1f}ms)")
+
+    for name, limit_ms in budget.get("max_cumulative_ms", {}).items():
+        if name in results and results[name]["cumulative_ms"] > limit_ms:
+            violations.append(f"{name}: 누적 {results[name]['cumulative_ms']:.1f}ms > 기준 {limit_ms}ms")
+    return violations
+
+
+def print_report(results: Dict[str, Dict[str, float]], module: str, top: int):
+    total = results.get(module, {}).get("cumulative_ms")
+    if total is not None:
+        print(f"'{module}' import 총 {total:.1f}ms (모듈 {len(results)}개)\n")
+
+    print(f"{'누적(ms)':>10}{'자체(ms)':>10}  모듈")
+    ranked = sorted(results.items(), key=lambda item: item[1]["cumulative_ms"], reverse=True)
+    for name, r in ranked[:top]:
+        print(f"{r['cumulative_ms']:>10.1f}{r['self_ms']:>10.1f}  {'  ' * r['depth']}{name}")
+
+    # 프로젝트 모듈만 따로 표시 (어느 모듈이 무거운 의존성을 끌어오는지 확인용)
+    local_prefixes = ("app", "config", "domain", "services", "repositories", "components", "utils")
+    local = [(n, r) for n, r in ranked if n.split(".")[0] in local_prefixes]
+    if local:
+        print(f"\n{'누적(ms)':>10}{'자체(ms)':>10}  프로젝트 모듈")
+        for name, r in local[:top]:
+            print(f"{r['cumulative_ms']:>10.1f}{r['self_ms']:>10.1f}  {name}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="모듈 import 시간 측정 및 기준값 검사")
+    parser.add_argument("--module", default="app", help="측정할 모듈 (기본값: app)")
+    parser.add_argument("--repeat", type=int, default=3, help="측정 횟수 (중앙값 사용)")
+    parser.add_argument("--top", type=int, default=20, help="출력할 상위 모듈 수")
+    parser.add_argument("--budget", default=DEFAULT_BUDGET_PATH, help="기준값 JSON 파일")
+    parser.add_argument("--forbid", default=None, help="import 되면 안 되는 모듈 (쉼표 구분, 기본값: 기준값 파일의 forbid)")
+    parser.add_argument("--check", action="store_true", help="기준값 위반 시 종료 코드 1")
+    parser.add_argument("--json", action="store_true", help="결과를 JSON으로 출력")
+    args = parser.parse_args()
+
+    budget = {}
+    if os.path.exists(args.budget):
+        with open(args.budget, encoding="utf-8") as f:
+            budget = json.load(f).get(args.module, {})
+    forbid = args.forbid.split(",") if args.forbid is not None else budget.get("forbid", [])
+
+    results = profile(args.module, args.repeat)
+    if args.json:
+        print(json.dumps(results, ensure_ascii=False, indent=2))
+    else:
+        print_report(results, args.module, args.top)
+
+    violations = check(results, args.module, budget, [name for name in forbid if name])
+    if violations:
+        print("\n기준값 위반:", file=sys.stderr)
+        for violation in violations:
+            print(f"  - {violation}", file=sys.stderr)
+        if args.check:
+            sys.exit(1)
+    elif args.check:
+        print("\n기준값 통과", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,251 @@
+"""
+HTTP API 서버(api_server.py)에 지속적으로 요청을 보내 초당 처리량과 지연 시간을 측정합니다.
+
+--spawn 을 지정하면 가짜 Tavily/Gemini 서버와 임시 CSV를 쓰는 API 서버를 직접 띄운 뒤 측정하므로
+실제 할당량을 쓰지 않고 재현 가능한 결과를 얻을 수 있습니다.
+
+사용 예시:
+    uv run python -m tools.load_test --spawn --duration 20 --concurrency 32
+    uv run python -m tools.load_test --url http://127.0.0.1:8080 --mix search=1,history=4,item=4,article=1
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import quote, urlsplit
+from tools.fake_servers import FaultProfile, GeminiHandler, TavilyHandler, start_server
+
+DEFAULT_KEYWORDS = ["AI", "반도체", "전기차", "2차전지", "기후", "부동산", "금리", "K팝", "우주", "바이오"]
+
+
+class Connection:
+    """keep-alive 로 재사용하는 HTTP/1.1 연결 1개"""
+
+    def __init__(self, host: str, port: int):
+        self.host = host
+        self.port = port
+        self.reader: Optional[asyncio.StreamReader] = None
+        self.writer: Optional[asyncio.StreamWriter] = None
+
+    async def request(self, method: str, path: str, body: Optional[Dict] = None) -> Tuple[int, Dict]:
+        if self.writer is None:
+            self.reader, self.writer = await asyncio.open_connection(self.host, self.port)
+
+        data = json.dumps(body, ensure_ascii=False).encode("utf-8") if body is not None else b""
+        head = (
+            f"{method} {path} HTTP/1.1\r\nHost: {self.host}\r\n"
+            f"Content-Type: application/json\r\nContent-Length: {len(data)}\r\n\r\n"
+        )
+        try:
+            self.writer.write(head.encode("latin-1") + data)
+            await self.writer.drain()
+
+            status = int((await self.reader.readline()).split()[1])
+            headers = {}
+            while True:
+                line = await self.reader.readline()
+                if line in (b"\r\n", b"\n", b""):
+                    break
+                name, _, value = line.decode("latin-1").partition(":")
+                headers[name.strip().lower()] = value.strip()
+            payload = await self.reader.readexactly(int(headers.get("content-length", 0)))
+        except (ConnectionError, asyncio.IncompleteReadError, IndexError, ValueError):
+            self.close()
+            raise
+
+        if headers.get("connection", "").lower() == "close":
+            self.close()
+        return status, json.loads(payload) if payload else {}
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+        self.reader = self.writer = None
+
+
+class LoadTest:
+    def __init__(self, url: str, keywords: List[str], mix: Dict[str, float], num_results: int):
+        parts = urlsplit(url)
+        self.host = parts.hostname or "127.0.0.1"
+        self.port = parts.port or 80
+        self.keywords = keywords
+        self.mix = mix
+        self.num_results = num_results
+        self.search_keys: List[str] = []
+        self.article_urls: List[str] = []
+        # 엔드포인트별 (지연 시간 목록, 상태 코드별 횟수)
+        self.latencies: Dict[str, List[float]] = {}
+        self.statuses: Dict[str, Dict[int, int]] = {}
+
+    def _pick_request(self) -> Tuple[str, str, str, Optional[Dict]]:
+        kinds = [k for k in self.mix if k not in ("item", "article") or self.search_keys]
+        kind = random.choices(kinds, weights=[self.mix[k] for k in kinds])[0]
+        if kind == "search":
+            return kind, "POST", "/search", {"keyword": random.choice(self.keywords), "num_results": self.num_results}
+        if kind == "history":
+            prefix = random.choice(["", random.choice(self.keywords)[:1]])
+            return kind, "GET", f"/history?prefix={quote(prefix)}&page=1&page_size=20", None
+        if kind == "item":
+            return kind, "GET", f"/history/{quote(random.choice(self.search_keys), safe='')}", None
+        if self.article_urls:
+            return kind, "GET", f"/articles?url={quote(random.choice(self.article_urls), safe='')}", None
+        return "history", "GET", "/history", None
+
+    def _remember(self, kind: str, status: int, payload: Dict):
+        """응답에서 이후 조회 요청에 쓸 search_key와 기사 URL을 모읍니다."""
+        if status != 200:
+            return
+        if kind in ("search", "item") and payload.get("search_key"):
+            if payload["search_key"] not in self.search_keys:
+                self.search_keys.append(payload["search_key"])
+            self.article_urls.extend(a["url"] for a in payload.get("articles", [])[:3])
+            del self.article_urls[:-500]
+        elif kind == "history":
+            for item in payload.get("items", []):
+                if item["search_key"] not in self.search_keys:
+                    self.search_keys.append(item["search_key"])
+
+    async def _worker(self, deadline: float):
+        conn = Connection(self.host, self.port)
+        while time.monotonic() < deadline:
+            kind, method, path, body = self._pick_request()
+            started = time.perf_counter()
+            try:
+                status, payload = await conn.request(method, path, body)
+            except (ConnectionError, asyncio.IncompleteReadError, IndexError, ValueError, OSError):
+                status, payload = 0, {}
+            self.latencies.setdefault(kind, []).append((time.perf_counter() - started) * 1000)
+            counts = self.statuses.setdefault(kind, {})
+            counts[status] = counts.get(status, 0) + 1
+            self._remember(kind, status, payload)
+        conn.close()
+
+    async def run(self, concurrency: int, duration: float, warmup: int) -> float:
+        # 조회 요청에 쓸 기록을 만들기 위해 먼저 몇 건 검색
+        conn = Connection(self.host, self.port)
+        for keyword in self.keywords[:warmup]:
+            status, payload = await conn.request("POST", "/search", {"keyword": keyword, "num_results": self.num_results})
+            self._remember("search", status, payload)
+        conn.close()
+
+        started = time.monotonic()
+        await asyncio.gather(*(self._worker(started + duration) for _ in range(concurrency)))
+        return time.monotonic() - started
+
+    def report(self, elapsed: float):
+        def pct(values: List[float], q: float) -> float:
+            ordered = sorted(values)
+            return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+        total = sum(len(v) for v in self.latencies.values())
+        all_latencies = [x for v in self.latencies.values() for x in v]
+        print(f"\n총 {total:,}건 / {elapsed:.1f}초 → {total / elapsed:,.1f} req/s")
+        if all_latencies:
+            print(f"전체 지연: p50 {pct(all_latencies, 0.5):.1f}ms · p95 {pct(all_latencies, 0.95):.1f}ms · p99 {pct(all_latencies, 0.99):.1f}ms")
+        print(f"\n{'엔드포인트':<10}{'요청':>8}{'req/s':>9}{'p50(ms)':>10}{'p95(ms)':>10}{'p99(ms)':>10}  상태 코드")
+        for kind, values in sorted(self.latencies.items()):
+            statuses = ", ".join(f"{code}:{n}" for code, n in sorted(self.statuses[kind].items()))
+            print(
+                f"{kind:<10}{len(values):>8,}{len(values) / elapsed:>9.1f}"
+                f"{pct(values, 0.5):>10.1f}{pct(values, 0.95):>10.1f}{pct(values, 0.99):>10.1f}  {statuses}"
+            )
+
+
+def spawn_stack(latency_ms: float, port: int) -> Tuple[subprocess.Popen, str]:
+    """가짜 Tavily/Gemini 서버(이 프로세스)와 임시 CSV를 쓰는 API 서버(자식 프로세스)를 띄웁니다."""
+    tavily = start_server(TavilyHandler, "127.0.0.1", 0, FaultProfile(latency_ms=latency_ms, seed=1))
+    gemini = start_server(GeminiHandler, "127.0.0.1", 0, FaultProfile(latency_ms=latency_ms * 3, seed=2))
+    workdir = tempfile.mkdtemp(prefix="trendtracker-load-")
+
+    env = dict(
+        os.environ,
+        TAVILY_API_KEY="fake",
+        GEMINI_API_KEY="fake",
+        CSV_PATH=os.path.join(workdir, "search_history.csv"),
+        TAVILY_BASE_URL=f"http://127.0.0.1:{tavily.server_address[1]}",
+        GEMINI_BASE_URL=f"http://127.0.0.1:{gemini.server_address[1]}",
+        # 처리량 측정이 목적이므로 요청 제한과 디스크 캐시는 끔
+        TAVILY_RATE_PER_MINUTE="0",
+        TAVILY_MONTHLY_QUOTA="0",
+        GEMINI_RATE_PER_MINUTE="0",
+        GEMINI_MONTHLY_QUOTA="0",
+        RATE_LIMIT_STATE_PATH="",
+        SUMMARY_CACHE_DIR="",
+    )
+    project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    process = subprocess.Popen(
+        [sys.executable, os.path.join(project_root, "api_server.py"), "--port", str(port)],
+        env=env,
+        cwd=project_root,
+    )
+    return process, f"http://127.0.0.1:{port}"
+
+
+async def wait_until_ready(url: str, timeout: float = 20.0):
+    parts = urlsplit(url)
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            conn = Connection(parts.hostname, parts.port)
+            status, _ = await conn.request("GET", "/health")
+            conn.close()
+            if status == 200:
+                return
+        except OSError:
+            pass
+        await asyncio.sleep(0.2)
+    raise RuntimeError(f"API 서버가 {timeout}초 안에 응답하지 않습니다: {url}")
+
+
+def parse_mix(raw: str) -> Dict[str, float]:
+    mix = {}
+    for part in raw.split(","):
+        name, _, weight = part.partition("=")
+        if name.strip() not in ("search", "history", "item", "article"):
+            raise argparse.ArgumentTypeError(f"알 수 없는 요청 종류: {name}")
+        mix[name.strip()] = float(weight or 1)
+    return mix
+
+
+def main():
+    parser = argparse.ArgumentParser(description="TrendTracker API 서버 부하 테스트")
+    parser.add_argument("--url", default="http://127.0.0.1:8080", help="API 서버 주소 (--spawn이면 무시)")
+    parser.add_argument("--spawn", action="store_true", help="가짜 API 서버와 임시 API 서버를 직접 띄워서 측정")
+    parser.add_argument("--spawn-port", type=int, default=18080)
+    parser.add_argument("--fake-latency-ms", type=float, default=100.0, help="--spawn 시 가짜 Tavily 지연 중앙값 (Gemini는 3배)")
+    parser.add_argument("--concurrency", "-c", type=int, default=32, help="동시 연결 수")
+    parser.add_argument("--duration", "-d", type=float, default=20.0, help="측정 시간(초)")
+    parser.add_argument("--mix", type=parse_mix, default=parse_mix("search=1,history=3,item=4,article=2"),
+                        help="요청 종류별 비율 (search, history, item, article)")
+    parser.add_argument("--keywords", default=",".join(DEFAULT_KEYWORDS), help="검색 키워드 (쉼표 구분)")
+    parser.add_argument("--num-results", type=int, default=5)
+    parser.add_argument("--warmup", type=int, default=3, help="측정 전에 검색해 둘 키워드 수")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    process = None
+    url = args.url
+    if args.spawn:
+        process, url = spawn_stack(args.fake_latency_ms, args.spawn_port)
+
+    test = LoadTest(url, [k.strip() for k in args.keywords.split(",") if k.strip()], args.mix, args.num_results)
+    try:
+        asyncio.run(wait_until_ready(url))
+        print(f"{url} 에 {args.concurrency}개 연결로 {args.duration:.0f}초 동안 요청합니다...")
+        elapsed = asyncio.run(test.run(args.concurrency, args.duration, args.warmup))
+        test.report(elapsed)
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait(timeout=10)
+
+
+if __name__ == "__main__":
+    main()
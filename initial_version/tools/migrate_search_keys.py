@@ -0,0 +1,91 @@
+"""
+검색 기록 CSV의 이전 형식 키("키워드-yyyymmddhhmm")를 ULID 형식의 고정 길이 키로 바꿉니다.
+
+- CSV의 search_key와 summary_base_key, 스케줄러 상태 파일의 last_key를 함께 바꿉니다.
+- 바꾸기 전에 원본을 "<경로>.bak"으로 복사합니다. (--no-backup으로 생략)
+- 이미 ULID 형식인 키는 그대로 두므로 여러 번 실행해도 안전합니다.
+- 앱, 스케줄러, API 서버를 멈춘 뒤 실행하세요. (실행 중인 프로세스의 캐시에는 이전 키가 남아 있음)
+
+사용 예시:
+    uv run python -m tools.migrate_search_keys --dry-run
+    uv run python -m tools.migrate_search_keys
+"""
+import argparse
+import json
+import os
+import shutil
+import sys
+from typing import Dict, List
+from config.settings import Settings
+from repositories.search_repository import SearchRepository
+
+
+def migrate_scheduler_state(state_path: str, mapping: Dict[str, List[str]], dry_run: bool) -> int:
+    """스케줄러 상태 파일의 last_key를 가장 최근 새 키로 바꾸고, 바꾼 개수를 반환합니다."""
+    if not os.path.exists(state_path):
+        return 0
+    with open(state_path, encoding="utf-8") as f:
+        state = json.load(f)
+
+    changed = 0
+    for record in state.values():
+        last_key = record.get("last_key") if isinstance(record, dict) else None
+        if last_key in mapping:
+            record["last_key"] = mapping[last_key][-1]
+            changed += 1
+
+    if changed and not dry_run:
+        tmp_path = f"{state_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(state, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, state_path)
+    return changed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="검색 키를 ULID 형식으로 이전")
+    parser.add_argument("--csv", default=None, help="검색 기록 CSV 경로 (기본값: CSV_PATH)")
+    parser.add_argument("--state", default=None, help="스케줄러 상태 파일 경로 (기본값: SCHEDULER_STATE_PATH)")
+    parser.add_argument("--dry-run", action="store_true", help="바뀔 내용만 출력하고 파일은 수정하지 않음")
+    parser.add_argument("--no-backup", action="store_true", help="원본 CSV 백업(.bak)을 만들지 않음")
+    args = parser.parse_args()
+
+    csv_path, state_path = args.csv, args.state
+    if not csv_path or not state_path:
+        try:
+            settings = Settings()
+        except ValueError as e:
+            print(e, file=sys.stderr)
+            sys.exit(2)
+        csv_path = csv_path or settings.CSV_PATH
+        state_path = state_path or settings.SCHEDULER_STATE_PATH
+
+    if not os.path.exists(csv_path):
+        print(f"검색 기록 파일이 없습니다: {csv_path}")
+        return
+
+    repository = SearchRepository(csv_path)
+    mapping = repository.migrate_search_keys(dry_run=True)
+    if not mapping:
+        print("이전할 키가 없습니다.")
+        return
+
+    if not args.dry_run:
+        # 이미 이전한 파일로 이전 백업을 덮어쓰지 않도록 바꿀 키가 있을 때만 백업
+        if not args.no_backup:
+            shutil.copy2(csv_path, f"{csv_path}.bak")
+            print(f"백업: {csv_path}.bak")
+        mapping = repository.migrate_search_keys()
+
+    for old_key, new_keys in mapping.items():
+        suffix = f" (같은 키로 겹친 기록 {len(new_keys)}건 분리)" if len(new_keys) > 1 else ""
+        print(f"{old_key} -> {', '.join(new_keys)}{suffix}")
+
+    state_changed = migrate_scheduler_state(state_path, mapping, args.dry_run)
+    total = sum(len(new_keys) for new_keys in mapping.values())
+    action = "이전 예정" if args.dry_run else "이전 완료"
+    print(f"\n{action}: 이전 키 {len(mapping)}개 → 새 키 {total}개, 스케줄러 상태 {state_changed}건")
+
+
+if __name__ == "__main__":
+    main()
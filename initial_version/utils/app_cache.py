@@ -0,0 +1,110 @@
+import threading
+from typing import Dict, Optional
+import streamlit as st
+from config.settings import Settings
+from domain.search_result import SearchResult
+from repositories.search_repository import SearchRepository
+from services.trend_service import attach_trend_tracking
+from utils.history_index import HistoryIndex
+
+# Streamlit은 위젯을 조작할 때마다 스크립트 전체를 다시 실행하므로,
+# 설정/리포지토리는 프로세스에 한 번만 만들고 CSV 조회 결과는 파일 버전별로 캐시합니다.
+
+# 캐시별 호출/실패(실제 계산) 횟수 - 적중 횟수는 calls - misses
+_stats = {name: {"calls": 0, "misses": 0} for name in ("history_index", "find_by_key", "csv")}
+_stats_lock = threading.Lock()
+
+
+def _count(name: str, field: str):
+    with _stats_lock:
+        _stats[name][field] += 1
+
+
+@st.cache_resource
+def get_settings() -> Settings:
+    """설정을 한 번만 읽어 재사용합니다. (필수 값이 없으면 ValueError, 예외는 캐시되지 않습니다)"""
+    return Settings()
+
+
+@st.cache_resource
+def get_repository(csv_path: str, trends_path: str) -> SearchRepository:
+    """
+    리포지토리를 한 번만 만들고, 저장할 때마다 조회 캐시를 비우고 트렌드 집계를 갱신하도록 등록합니다.
+    """
+    repository = SearchRepository(csv_path)
+    repository.add_save_listener(lambda _: clear_data_cache())
+    attach_trend_tracking(repository, trends_path)
+    return repository
+
+
+@st.cache_resource
+def start_sdk_preload() -> threading.Thread:
+    """첫 화면을 그린 뒤 검색/요약 SDK를 백그라운드에서 미리 불러옵니다. (프로세스당 한 번)"""
+    from services.clients import preload_sdks
+
+    thread = threading.Thread(target=preload_sdks, name="sdk-preload", daemon=True)
+    thread.start()
+    return thread
+
+
+@st.cache_resource
+def start_cache_warmup(csv_path: str, trends_path: str) -> Optional[threading.Thread]:
+    """최근 많이 검색된 키워드로 검색/요약 캐시를 백그라운드에서 미리 채웁니다. (프로세스당 한 번)"""
+    from services.warmup_service import start_warmup
+
+    return start_warmup(get_repository(csv_path, trends_path), get_settings())
+
+
+# 캐시 키에 CSV 버전(수정 시각)을 포함하여 다른 프로세스(스케줄러 등)의 저장도 반영합니다.
+# 인덱스는 크기가 커서 복사(pickle) 비용이 없는 cache_resource로 보관 (읽기 전용으로만 사용)
+@st.cache_resource(show_spinner=False, max_entries=2)
+def _load_history_index(csv_path: str, version: int) -> HistoryIndex:
+    _count("history_index", "misses")
+    return HistoryIndex(SearchRepository(csv_path).get_key_summaries())
+
+
+@st.cache_data(show_spinner=False, max_entries=256)
+def _load_result(csv_path: str, version: int, search_key: str) -> Optional[SearchResult]:
+    _count("find_by_key", "misses")
+    # 증분 검색 기록은 요약이 이전 기사까지 다루므로 이전 버전 기사도 함께 표시
+    return SearchRepository(csv_path).find_by_key(search_key, follow_base=True)
+
+
+@st.cache_data(show_spinner=False)
+def _load_csv(csv_path: str, version: int) -> str:
+    _count("csv", "misses")
+    return SearchRepository(csv_path).get_all_as_csv()
+
+
+def get_history_index(repository: SearchRepository) -> HistoryIndex:
+    """검색 기록 인덱스(표시 문구, 키워드 접두어 검색)를 CSV 버전별로 한 번만 만들어 반환합니다."""
+    _count("history_index", "calls")
+    return _load_history_index(repository.csv_path, repository.get_version())
+
+
+def find_by_key(repository: SearchRepository, search_key: str) -> Optional[SearchResult]:
+    """repository.find_by_key()의 캐시 버전"""
+    _count("find_by_key", "calls")
+    return _load_result(repository.csv_path, repository.get_version(), search_key)
+
+
+def get_all_as_csv(repository: SearchRepository) -> str:
+    """repository.get_all_as_csv()의 캐시 버전"""
+    _count("csv", "calls")
+    return _load_csv(repository.csv_path, repository.get_version())
+
+
+def clear_data_cache():
+    """CSV 조회 캐시를 모두 비웁니다."""
+    _load_history_index.clear()
+    _load_result.clear()
+    _load_csv.clear()
+
+
+def get_cache_stats() -> Dict[str, Dict[str, int]]:
+    """캐시별 호출/적중 횟수를 반환합니다."""
+    with _stats_lock:
+        return {
+            name: {"calls": s["calls"], "hits": s["calls"] - s["misses"]}
+            for name, s in _stats.items()
+        }
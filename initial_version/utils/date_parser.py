@@ -0,0 +1,25 @@
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+
+def parse_pub_date(value) -> Optional[datetime]:
+    """
+    기사 발행일 문자열을 UTC 기준 datetime으로 변환합니다.
+    Tavily의 RFC 2822 형식("Tue, 27 Jan 2026 04:12:00 GMT")과 ISO 8601 형식을 지원합니다.
+    변환할 수 없으면 None을 반환합니다.
+    """
+    if not value or not isinstance(value, str):
+        return None
+
+    try:
+        dt = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        try:
+            dt = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.astimezone(timezone.utc)
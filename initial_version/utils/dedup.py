@@ -0,0 +1,134 @@
+import hashlib
+import heapq
+import operator
+import re
+from typing import Dict, List, Tuple
+from domain.news_article import NewsArticle
+
+# MinHash 서명 길이와 LSH 밴드 구성 (16개 밴드 x 4행)
+NUM_HASHES = 64
+NUM_BANDS = 16
+ROWS_PER_BAND = NUM_HASHES // NUM_BANDS
+# 기사 1건당 유사도를 비교할 최대 후보 수
+# (임계값 바로 아래의 비슷한 기사가 많아 버킷이 커져도 비교 횟수가 기사 수에 비례하도록 제한)
+MAX_CANDIDATES = 16
+# 버킷 1개에 넣는 최대 대표 기사 수 (후보를 세는 비용도 제한, 버킷이 차면 다른 밴드로만 찾음)
+MAX_BUCKET_SIZE = 64
+# 문자 n-gram 크기 (한국어는 형태소 분석 없이 문자 단위 shingle이 안정적입니다)
+SHINGLE_SIZE = 3
+
+_NON_WORD = re.compile(r"[\W_]+", re.UNICODE)
+
+
+def _normalize(text: str) -> str:
+    """소문자 변환 후 공백/특수문자를 제거합니다."""
+    return _NON_WORD.sub("", (text or "").lower())
+
+
+def _shingles(text: str) -> set:
+    normalized = _normalize(text)
+    if len(normalized) <= SHINGLE_SIZE:
+        return {normalized} if normalized else set()
+    return {normalized[i:i + SHINGLE_SIZE] for i in range(len(normalized) - SHINGLE_SIZE + 1)}
+
+
+def minhash_signature(text: str) -> Tuple[int, ...]:
+    """
+    텍스트의 MinHash 서명을 계산합니다.
+
+    shingle마다 해시를 한 번만 계산하는 One Permutation Hashing 방식을 사용합니다.
+    해시값으로 NUM_HASHES 개의 칸 중 하나를 고르고, 칸마다 최솟값을 기록합니다.
+    비어 있는 칸은 오른쪽의 가장 가까운 칸 값으로 채웁니다.
+    """
+    shingles = _shingles(text)
+    if not shingles:
+        return ()
+
+    empty = 1 << 64
+    bins = [empty] * NUM_HASHES
+    for shingle in shingles:
+        digest = hashlib.blake2b(shingle.encode("utf-8"), digest_size=8).digest()
+        h = int.from_bytes(digest, "big")
+        idx, value = h % NUM_HASHES, h // NUM_HASHES
+        if value < bins[idx]:
+            bins[idx] = value
+
+    # 빈 칸 채우기 (densification)
+    for i in range(NUM_HASHES):
+        if bins[i] == empty:
+            j = (i + 1) % NUM_HASHES
+            while bins[j] == empty:
+                j = (j + 1) % NUM_HASHES
+            bins[i] = bins[j] + 1 + (j - i) % NUM_HASHES
+    return tuple(bins)
+
+
+def estimate_similarity(a: Tuple[int, ...], b: Tuple[int, ...]) -> float:
+    """두 MinHash 서명으로 Jaccard 유사도를 추정합니다."""
+    if not a or not b:
+        return 0.0
+    return sum(map(operator.eq, a, b)) / NUM_HASHES
+
+
+def collapse_near_duplicates(articles: List[NewsArticle], threshold: float = 0.7) -> List[NewsArticle]:
+    """
+    제목과 스니펫이 거의 같은 기사(다른 언론사에 전재된 기사 등)를 하나로 합칩니다.
+
+    - 리스트 순서상 먼저 나온 기사를 대표 기사로 남기고,
+      중복 기사의 URL은 대표 기사의 `alternate_urls`에 추가합니다.
+    - 추정 Jaccard 유사도가 threshold 이상이면 중복으로 판단합니다. (0 이하이면 비활성화)
+    - 서명을 밴드로 나누어 버킷에 넣고 같은 버킷에 들어간 후보끼리만 비교하므로(LSH),
+      전체 쌍을 비교하지 않고 기사 수에 대해 선형 시간에 동작합니다.
+    - 기사 1건당 최대 MAX_CANDIDATES개 후보와만 비교합니다. 여러 밴드에서 겹친 후보(더 비슷할 가능성이 높음)부터
+      비교하므로, 서로 조금씩 다른 기사가 많아도 진짜 중복은 대부분 찾으면서 비교 횟수가 늘어나지 않습니다.
+    """
+    if threshold <= 0 or len(articles) < 2:
+        return list(articles)
+
+    buckets: Dict[Tuple[int, Tuple[int, ...]], List[int]] = {}
+    representatives: List[NewsArticle] = []
+    signatures: List[Tuple[int, ...]] = []
+
+    for article in articles:
+        signature = minhash_signature(f"{article.title} {article.snippet}")
+        if not signature:
+            representatives.append(article)
+            signatures.append(signature)
+            continue
+
+        bands = [
+            (band, signature[band * ROWS_PER_BAND:(band + 1) * ROWS_PER_BAND])
+            for band in range(NUM_BANDS)
+        ]
+
+        # 후보별로 겹친 밴드 수를 세고, 많이 겹친 후보부터(같으면 먼저 나온 대표 기사부터) 비교
+        overlaps: Dict[int, int] = {}
+        for band in bands:
+            for idx in buckets.get(band, ()):
+                overlaps[idx] = overlaps.get(idx, 0) + 1
+        candidates = heapq.nsmallest(MAX_CANDIDATES, overlaps, key=lambda idx: (-overlaps[idx], idx))
+
+        duplicate_of = None
+        for idx in candidates:
+            if estimate_similarity(signature, signatures[idx]) >= threshold:
+                duplicate_of = idx
+                break
+
+        if duplicate_of is not None:
+            representative = representatives[duplicate_of]
+            known_urls = {representative.url, *representative.alternate_urls}
+            for url in [article.url, *article.alternate_urls]:
+                if url and url not in known_urls:
+                    representative.alternate_urls.append(url)
+                    known_urls.add(url)
+            continue
+
+        idx = len(representatives)
+        representatives.append(article)
+        signatures.append(signature)
+        for band in bands:
+            bucket = buckets.setdefault(band, [])
+            if len(bucket) < MAX_BUCKET_SIZE:
+                bucket.append(idx)
+
+    return representatives
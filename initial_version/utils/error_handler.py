@@ -4,13 +4,16 @@ ERROR_MESSAGES = {
     "api_key_invalid": "API 키가 유효하지 않습니다. 설정을 확인해주세요.",
     "daily_limit_exceeded": "일일 검색 한도(100건)를 초과했습니다.",
     "rate_limit_exceeded": "요청이 너무 많습니다. 잠시 후(약 30초~1분) 다시 시도해주세요.",
+    "monthly_quota_exceeded": "이번 달 API 사용 한도를 모두 사용했습니다. 다음 달에 다시 시도해주세요.",
     "no_results": "검색 결과가 없습니다.",
     "network_error": "네트워크 연결을 확인해주세요 (또는 검색 서버 오류).",
     "file_error": "파일 접근에 실패했습니다.",
     "empty_input": "검색어를 입력해주세요.",
     "ai_error": "AI 요약 중 오류가 발생했습니다. 잠시 후 다시 시도해주세요.",
     "bad_request": "잘못된 요청입니다. 입력값 등을 확인해주세요.",
-    "server_error": "서버 오류가 발생했습니다. 잠시 후 다시 시도해주세요."
+    "server_error": "서버 오류가 발생했습니다. 잠시 후 다시 시도해주세요.",
+    "service_unavailable": "외부 서비스(검색/AI 요약) 장애가 계속되어 잠시 요청을 중단했습니다. 잠시 후 다시 시도해주세요.",
+    "token_budget_too_small": "요약 입력 토큰 예산(SUMMARY_INPUT_TOKEN_BUDGET)이 너무 작아 기사를 요약할 수 없습니다. 설정을 확인해주세요."
 }
 
 def handle_error(error_type: str, level: str = "error"):
@@ -0,0 +1,57 @@
+from bisect import bisect_left
+from datetime import datetime
+from typing import Dict, List, Tuple
+from utils.key_generator import format_search_label
+
+
+class HistoryIndex:
+    """
+    검색 기록 목록을 빠르게 찾고 나누어 보여주기 위한 인덱스입니다.
+
+    - 표시 문구("키워드 (yyyy-mm-dd HH:MM)")는 인덱스를 만들 때 한 번만 계산합니다.
+    - 키워드(소문자)로 정렬된 목록을 이분 탐색하여 접두어 검색을 O(log n + 결과 수)로 처리합니다.
+    - 결과는 항상 최신순이며, 화면에는 한 페이지 분량만 전달합니다.
+    """
+
+    def __init__(self, summaries: List[Tuple[str, str, datetime]]):
+        """
+        Args:
+            summaries: 최신순 (search_key, keyword, search_time) 목록
+                (SearchRepository.get_key_summaries 결과)
+        """
+        self.keys: List[str] = [key for key, _, _ in summaries]
+        self.labels: Dict[str, str] = {
+            key: format_search_label(keyword, search_time)
+            for key, keyword, search_time in summaries
+        }
+        # (소문자 키워드, 최신순 위치) 정렬 목록 - 같은 키워드 안에서는 최신순 유지
+        self._sorted: List[Tuple[str, int]] = sorted(
+            (keyword.lower(), position) for position, (_, keyword, _) in enumerate(summaries)
+        )
+        self._sorted_keywords = [keyword for keyword, _ in self._sorted]
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def label(self, key: str) -> str:
+        return self.labels.get(key, key)
+
+    def search(self, prefix: str = "") -> List[str]:
+        """키워드가 prefix로 시작하는 검색 키를 최신순으로 반환합니다. (대소문자 무시)"""
+        prefix = prefix.strip().lower()
+        if not prefix:
+            return self.keys
+
+        start = bisect_left(self._sorted_keywords, prefix)
+        positions = []
+        for keyword, position in self._sorted[start:]:
+            if not keyword.startswith(prefix):
+                break
+            positions.append(position)
+        return [self.keys[p] for p in sorted(positions)]
+
+    @staticmethod
+    def page(keys: List[str], page: int, page_size: int) -> List[str]:
+        """page(1부터 시작) 번째 페이지의 키를 반환합니다."""
+        start = (max(page, 1) - 1) * page_size
+        return keys[start:start + page_size]
@@ -1,9 +1,80 @@
+import os
+import re
+import threading
+import time
 from datetime import datetime
+from typing import Optional
 
-def generate_search_key(keyword: str) -> str:
+# ULID 형식: 밀리초 타임스탬프(48비트) + 난수(80비트)를 Crockford Base32로 인코딩한 26자
+# 예) 01JAB3X6K9Q4T2V7W8Y0Z1M5NP
+_ALPHABET = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"
+_DECODE = {c: i for i, c in enumerate(_ALPHABET)}
+_TIME_CHARS = 10
+_RANDOM_CHARS = 16
+_RANDOM_MAX = (1 << 80) - 1
+SEARCH_KEY_LENGTH = _TIME_CHARS + _RANDOM_CHARS
+
+_KEY_PATTERN = re.compile(f"^[{_ALPHABET}]{{{SEARCH_KEY_LENGTH}}}$")
+
+_lock = threading.Lock()
+_last_ms = -1
+_last_random = 0
+
+
+def _encode(value: int, length: int) -> str:
+    chars = []
+    for _ in range(length):
+        value, index = divmod(value, 32)
+        chars.append(_ALPHABET[index])
+    return "".join(reversed(chars))
+
+
+def generate_search_key(timestamp: Optional[datetime] = None) -> str:
     """
-    현재 시간을 기준으로 "키워드-yyyymmddhhmm" 형식의 검색 키를 생성합니다.
+    시간순으로 정렬되는 26자 고정 길이 검색 키(ULID)를 생성합니다.
+
+    - 같은 밀리초 안에서 여러 번 호출하면 난수 부분을 1씩 늘려 항상 이전 키보다 큰 값을 반환합니다.
+      (같은 키워드를 같은 분에 여러 번 검색해도 키가 겹치지 않음)
+    - 키워드는 키에 넣지 않습니다. 화면 표시는 format_search_label을 사용합니다.
+
+    Args:
+        timestamp: 키에 기록할 시각 (기존 기록 이전 시 사용, 기본값: 현재 시각)
+            지정하면 단조 증가 보장 없이 해당 시각과 난수로 만듭니다.
     """
-    now = datetime.now()
-    timestamp = now.strftime("%Y%m%d%H%M")
-    return f"{keyword}-{timestamp}"
+    global _last_ms, _last_random
+
+    if timestamp is not None:
+        ms = int(timestamp.timestamp() * 1000)
+        return _encode(ms, _TIME_CHARS) + _encode(int.from_bytes(os.urandom(10), "big"), _RANDOM_CHARS)
+
+    ms = time.time_ns() // 1_000_000
+    with _lock:
+        if ms <= _last_ms and _last_random < _RANDOM_MAX:
+            # 같은 밀리초(또는 시계가 뒤로 간 경우)에는 직전 키 바로 다음 값을 사용
+            ms = _last_ms
+            random_part = _last_random + 1
+        else:
+            random_part = int.from_bytes(os.urandom(10), "big")
+        _last_ms, _last_random = ms, random_part
+
+    return _encode(ms, _TIME_CHARS) + _encode(random_part, _RANDOM_CHARS)
+
+
+def is_search_key(key: str) -> bool:
+    """ULID 형식의 검색 키인지 확인합니다. (이전 "키워드-yyyymmddhhmm" 형식은 False)"""
+    return isinstance(key, str) and bool(_KEY_PATTERN.match(key))
+
+
+def search_key_time(key: str) -> datetime:
+    """검색 키에 기록된 생성 시각(로컬 시간)을 반환합니다."""
+    if not is_search_key(key):
+        raise ValueError(f"ULID 형식의 검색 키가 아닙니다: {key}")
+    ms = 0
+    for char in key[:_TIME_CHARS]:
+        ms = ms * 32 + _DECODE[char]
+    return datetime.fromtimestamp(ms / 1000)
+
+
+def format_search_label(keyword: str, search_time: datetime) -> str:
+    """검색 기록을 화면에 표시할 문구("키워드 (yyyy-mm-dd HH:MM)")를 만듭니다."""
+    return f"{keyword} ({search_time.strftime('%Y-%m-%d %H:%M')})"
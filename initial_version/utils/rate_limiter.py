@@ -0,0 +1,162 @@
+import json
+import os
+import threading
+import time
+from datetime import datetime
+from typing import Dict, Optional
+from utils.exceptions import AppError
+
+try:
+    import fcntl  # 여러 프로세스가 상태 파일을 공유할 때 사용 (Windows에는 없음)
+except ImportError:  # pragma: no cover
+    fcntl = None
+
+
+class RateLimiter:
+    """
+    분당 요청 수(토큰 버킷)와 월간 할당량을 함께 관리하는 요청 제한기입니다.
+
+    - 분당 제한: 용량 per_minute 의 버킷이 초당 per_minute/60 개씩 채워집니다.
+    - 월간 제한: 달이 바뀌면 사용량이 0으로 초기화됩니다. (0이면 무제한)
+    - state_path 를 지정하면 상태를 JSON 파일에 저장하여 여러 프로세스가 같은 한도를 공유합니다.
+    """
+
+    def __init__(self, name: str, per_minute: int, per_month: int = 0, state_path: Optional[str] = None):
+        self.name = name
+        self.per_minute = per_minute
+        self.per_month = per_month
+        self.state_path = state_path
+        self._lock = threading.Lock()
+        self._state = self._initial_state()
+
+    def _initial_state(self) -> Dict:
+        return {
+            "tokens": float(self.per_minute),
+            "updated": time.time(),
+            "month": datetime.now().strftime("%Y-%m"),
+            "month_used": 0,
+        }
+
+    # ---- 상태 저장/불러오기 ----
+
+    def _read_state(self, f) -> Dict:
+        f.seek(0)
+        raw = f.read()
+        try:
+            all_states = json.loads(raw) if raw.strip() else {}
+        except json.JSONDecodeError:
+            all_states = {}
+        return all_states
+
+    def _with_state(self, update):
+        """잠금을 잡은 상태에서 update(state)를 실행하고 변경된 상태를 저장합니다."""
+        with self._lock:
+            if not self.state_path:
+                return update(self._state)
+
+            os.makedirs(os.path.dirname(self.state_path) or ".", exist_ok=True)
+            with open(self.state_path, "a+", encoding="utf-8") as f:
+                if fcntl:
+                    fcntl.flock(f, fcntl.LOCK_EX)
+                try:
+                    all_states = self._read_state(f)
+                    state = all_states.get(self.name) or self._initial_state()
+                    result = update(state)
+                    all_states[self.name] = state
+                    f.seek(0)
+                    f.truncate()
+                    json.dump(all_states, f)
+                    f.flush()
+                    return result
+                finally:
+                    if fcntl:
+                        fcntl.flock(f, fcntl.LOCK_UN)
+
+    def _refill(self, state: Dict):
+        now = time.time()
+        elapsed = max(0.0, now - state["updated"])
+        state["tokens"] = min(float(self.per_minute), state["tokens"] + elapsed * self.per_minute / 60.0)
+        state["updated"] = now
+
+        month = datetime.now().strftime("%Y-%m")
+        if state["month"] != month:
+            state["month"] = month
+            state["month_used"] = 0
+
+    # ---- 공개 API ----
+
+    def acquire(self, max_wait: float = 10.0):
+        """
+        요청 1건에 대한 허가를 받습니다.
+        토큰이 부족하면 최대 max_wait 초까지 기다린 뒤(대기열), 그래도 부족하면 AppError를 발생시킵니다.
+
+        Raises:
+            AppError("monthly_quota_exceeded"): 월간 할당량을 모두 사용한 경우
+            AppError("rate_limit_exceeded"): max_wait 안에 토큰을 얻지 못한 경우
+        """
+        deadline = time.monotonic() + max_wait
+
+        while True:
+            def take(state):
+                self._refill(state)
+                if self.per_month and state["month_used"] >= self.per_month:
+                    return "quota"
+                if self.per_minute <= 0 or state["tokens"] >= 1:
+                    if self.per_minute > 0:
+                        state["tokens"] -= 1
+                    state["month_used"] += 1
+                    return 0.0
+                # 다음 토큰이 채워질 때까지 남은 시간
+                return (1 - state["tokens"]) * 60.0 / self.per_minute
+
+            wait = self._with_state(take)
+            if wait == "quota":
+                raise AppError("monthly_quota_exceeded")
+            if wait == 0.0:
+                return
+            if time.monotonic() + wait > deadline:
+                raise AppError("rate_limit_exceeded")
+            time.sleep(wait)
+
+    def status(self) -> Dict:
+        """사이드바 표시용 현재 남은 한도를 반환합니다."""
+        def read(state):
+            self._refill(state)
+            return {
+                "name": self.name,
+                "minute_remaining": int(state["tokens"]) if self.per_minute > 0 else None,
+                "per_minute": self.per_minute,
+                "month_used": state["month_used"],
+                "per_month": self.per_month,
+                "month_remaining": max(0, self.per_month - state["month_used"]) if self.per_month else None,
+            }
+        return self._with_state(read)
+
+
+# 프로세스 전체에서 공유하는 제한기 (Streamlit 세션들은 같은 프로세스의 스레드로 동작합니다)
+_limiters: Dict[str, RateLimiter] = {}
+_registry_lock = threading.Lock()
+
+
+def get_limiter(name: str, settings) -> RateLimiter:
+    """
+    이름("tavily", "gemini")에 해당하는 공유 제한기를 반환합니다.
+    최초 호출 시 Settings 값으로 생성합니다.
+    """
+    with _registry_lock:
+        limiter = _limiters.get(name)
+        if limiter is None:
+            prefix = name.upper()
+            limiter = RateLimiter(
+                name=name,
+                per_minute=getattr(settings, f"{prefix}_RATE_PER_MINUTE"),
+                per_month=getattr(settings, f"{prefix}_MONTHLY_QUOTA"),
+                state_path=settings.RATE_LIMIT_STATE_PATH or None,
+            )
+            _limiters[name] = limiter
+        return limiter
+
+
+def get_quota_status(settings) -> Dict[str, Dict]:
+    """모든 API의 남은 한도를 반환합니다."""
+    return {name: get_limiter(name, settings).status() for name in ("tavily", "gemini")}
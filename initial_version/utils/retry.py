@@ -0,0 +1,202 @@
+import random
+import threading
+import time
+from typing import Callable, Dict, Optional, TypeVar
+from utils.exceptions import AppError
+
+T = TypeVar("T")
+
+# tavily-python 예외 클래스 이름 → HTTP 상태 코드
+# (상태 코드를 속성으로 갖지 않는 예외를 위한 매핑)
+_EXCEPTION_STATUS = {
+    "InvalidAPIKeyError": 401,
+    "MissingAPIKeyError": 401,
+    "ForbiddenError": 403,
+    "BadRequestError": 400,
+    "UsageLimitExceededError": 429,
+}
+
+
+def get_status_code(exc: Exception) -> Optional[int]:
+    """
+    예외에서 HTTP 상태 코드를 추출합니다.
+    - requests.HTTPError: exc.response.status_code
+    - google.genai APIError: exc.code
+    - tavily 예외: 클래스 이름으로 매핑
+    상태 코드를 알 수 없으면(연결 실패, 타임아웃 등) None을 반환합니다.
+    """
+    for attr in ("status_code", "code"):
+        value = getattr(exc, attr, None)
+        if isinstance(value, int) and 100 <= value < 600:
+            return value
+
+    response = getattr(exc, "response", None)
+    value = getattr(response, "status_code", None)
+    if isinstance(value, int):
+        return value
+
+    return _EXCEPTION_STATUS.get(type(exc).__name__)
+
+
+def classify_error(exc: Exception, default: str = "network_error") -> str:
+    """예외를 HTTP 상태 코드 기준으로 AppError 에러 타입으로 분류합니다."""
+    status = get_status_code(exc)
+    if status in (401, 403):
+        return "api_key_invalid"
+    if status == 429:
+        return "rate_limit_exceeded"
+    if status == 400:
+        return "bad_request"
+    if status is not None and status >= 500:
+        return "server_error"
+    return default
+
+
+def is_retryable(exc: Exception) -> bool:
+    """429, 5xx, 연결 실패/타임아웃처럼 잠시 후 다시 시도하면 성공할 수 있는 오류인지 판단합니다."""
+    status = get_status_code(exc)
+    if status is not None:
+        return status == 429 or status >= 500
+    name = type(exc).__name__
+    return isinstance(exc, (ConnectionError, TimeoutError)) or "Timeout" in name or "Connection" in name
+
+
+class CircuitBreaker:
+    """
+    외부 서비스 장애 시 요청을 즉시 실패시키는 서킷 브레이커입니다.
+
+    - closed: 정상 상태. 연속 실패가 failure_threshold 회에 도달하면 open
+    - open: recovery_timeout 초 동안 호출 없이 즉시 AppError("service_unavailable")
+    - half_open: 대기 시간이 지나면 1건만 시험 호출하여 성공 시 closed, 실패 시 다시 open
+    """
+
+    def __init__(self, name: str, failure_threshold: int = 5, recovery_timeout: float = 30.0):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.state = "closed"
+        self.consecutive_failures = 0
+        self.opened_at = 0.0
+        self.open_count = 0
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    def before_call(self):
+        with self._lock:
+            if self.state == "open":
+                if time.monotonic() - self.opened_at < self.recovery_timeout:
+                    raise AppError("service_unavailable")
+                self.state = "half_open"
+                self._trial_in_flight = False
+            if self.state == "half_open":
+                if self._trial_in_flight:
+                    raise AppError("service_unavailable")
+                self._trial_in_flight = True
+
+    def record_success(self):
+        with self._lock:
+            self.state = "closed"
+            self.consecutive_failures = 0
+            self._trial_in_flight = False
+
+    def release(self):
+        """서버에 요청하지 못한 경우(요청 제한 등) 상태 변경 없이 시험 호출 자리만 반납합니다."""
+        with self._lock:
+            self._trial_in_flight = False
+
+    def record_failure(self):
+        with self._lock:
+            self.consecutive_failures += 1
+            self._trial_in_flight = False
+            if self.state == "half_open" or self.consecutive_failures >= self.failure_threshold:
+                if self.state != "open":
+                    self.open_count += 1
+                self.state = "open"
+                self.opened_at = time.monotonic()
+
+
+# 서비스별 재시도/브레이커 지표
+_metrics: Dict[str, Dict] = {}
+_breakers: Dict[str, CircuitBreaker] = {}
+_registry_lock = threading.Lock()
+
+
+def get_breaker(name: str, settings) -> CircuitBreaker:
+    """서비스 이름에 해당하는 프로세스 공유 서킷 브레이커를 반환합니다."""
+    with _registry_lock:
+        breaker = _breakers.get(name)
+        if breaker is None:
+            breaker = CircuitBreaker(
+                name,
+                failure_threshold=settings.BREAKER_FAILURE_THRESHOLD,
+                recovery_timeout=settings.BREAKER_RECOVERY_SECONDS,
+            )
+            _breakers[name] = breaker
+            _metrics[name] = {"calls": 0, "retries": 0, "failures": 0, "rejected": 0}
+        return breaker
+
+
+def get_retry_metrics() -> Dict[str, Dict]:
+    """서비스별 호출/재시도/실패 횟수와 서킷 브레이커 상태를 반환합니다."""
+    with _registry_lock:
+        return {
+            name: {
+                **_metrics[name],
+                "state": breaker.state,
+                "open_count": breaker.open_count,
+            }
+            for name, breaker in _breakers.items()
+        }
+
+
+def _count(name: str, field: str):
+    with _registry_lock:
+        _metrics[name][field] += 1
+
+
+def call_with_retry(
+    fn: Callable[[], T],
+    breaker: CircuitBreaker,
+    max_attempts: int = 3,
+    base_delay: float = 0.5,
+    max_delay: float = 8.0,
+) -> T:
+    """
+    fn을 호출하고 재시도 가능한 오류면 지수 백오프(full jitter)로 최대 max_attempts 회 시도합니다.
+
+    - AppError는 이미 분류된 오류(요청 제한 등)이므로 그대로 전달합니다.
+    - 재시도 불가능한 오류(401, 400 등)는 서버 장애가 아니므로 브레이커 실패로 세지 않습니다. (성공으로도 세지 않음)
+    - 서킷이 열려 있으면 호출하지 않고 AppError("service_unavailable")을 발생시킵니다.
+    """
+    name = breaker.name
+    attempt = 0
+    while True:
+        attempt += 1
+        try:
+            breaker.before_call()
+        except AppError:
+            _count(name, "rejected")
+            raise
+
+        _count(name, "calls")
+        try:
+            result = fn()
+        except AppError:
+            breaker.release()
+            raise
+        except Exception as e:
+            if not is_retryable(e):
+                # 서버 장애는 아니지만 시험 호출이 성공한 것도 아니므로 상태는 바꾸지 않고 자리만 반납
+                breaker.release()
+                raise
+            breaker.record_failure()
+            if attempt >= max_attempts:
+                _count(name, "failures")
+                raise
+            _count(name, "retries")
+            delay = random.uniform(0, min(max_delay, base_delay * (2 ** (attempt - 1))))
+            time.sleep(delay)
+            continue
+
+        breaker.record_success()
+        return result
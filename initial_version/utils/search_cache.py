@@ -0,0 +1,74 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+from domain.news_article import NewsArticle
+
+
+class SearchCache:
+    """
+    시작 시 예열한 뉴스 검색 결과 캐시입니다.
+
+    - (키워드, 기사 수)별 결과를 ttl_seconds 동안 메모리에 보관합니다. (최신 뉴스이므로 디스크에 두지 않음)
+    - 최근 사용 순서(LRU)로 max_entries 개까지 보관합니다.
+    - 항목은 take로 한 번만 꺼낼 수 있습니다. 예열 결과는 그 키워드의 첫 검색에만 쓰이고,
+      이후 검색은 항상 새 결과를 받습니다. (사용자가 다시 검색했는데 같은 기사가 나오지 않도록 함)
+    같은 검색 결과는 요약 캐시 키도 같으므로, 캐시 적중 시 요약도 API 호출 없이 반환됩니다.
+    """
+
+    def __init__(self, ttl_seconds: float, max_entries: int = 128):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[str, int], Tuple[float, List[NewsArticle]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "expired": 0}
+
+    def take(self, keyword: str, num_results: int) -> Optional[List[NewsArticle]]:
+        """보관 중인 결과를 꺼내고 캐시에서 지웁니다. (없거나 만료되었으면 None)"""
+        with self._lock:
+            entry = self._entries.pop((keyword, num_results), None)
+            if entry is None:
+                self.stats["misses"] += 1
+                return None
+            if time.monotonic() - entry[0] > self.ttl_seconds:
+                self.stats["expired"] += 1
+                return None
+            self.stats["hits"] += 1
+            return entry[1]
+
+    def set(self, keyword: str, num_results: int, articles: List[NewsArticle]):
+        key = (keyword, num_results)
+        with self._lock:
+            self._entries[key] = (time.monotonic(), list(articles))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def discard(self, keyword: str, num_results: int):
+        with self._lock:
+            self._entries.pop((keyword, num_results), None)
+
+    def __contains__(self, key: Tuple[str, int]) -> bool:
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry is not None and time.monotonic() - entry[0] <= self.ttl_seconds
+
+
+_cache: Optional[SearchCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_search_cache(settings) -> Optional[SearchCache]:
+    """프로세스 전체에서 공유하는 예열 검색 결과 캐시를 반환합니다. (SEARCH_CACHE_TTL_SECONDS가 0이면 None)"""
+    global _cache
+    if settings.SEARCH_CACHE_TTL_SECONDS <= 0:
+        return None
+    with _cache_lock:
+        if _cache is None:
+            _cache = SearchCache(settings.SEARCH_CACHE_TTL_SECONDS, settings.SEARCH_CACHE_SIZE)
+        return _cache
+
+
+def get_search_cache_stats() -> Dict[str, int]:
+    """검색 캐시 적중/실패 횟수를 반환합니다. (캐시를 아직 사용하지 않았다면 빈 dict)"""
+    return dict(_cache.stats) if _cache else {}
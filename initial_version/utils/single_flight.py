@@ -0,0 +1,66 @@
+import threading
+from typing import Any, Callable, Dict, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Exception = None
+        # 리더가 Exception이 아닌 이유(KeyboardInterrupt, Streamlit 세션 중단 등)로 멈춤
+        self.aborted = False
+
+
+class SingleFlight:
+    """
+    같은 키로 동시에 들어온 호출을 하나로 합치는 도구입니다.
+
+    먼저 들어온 호출(리더)만 실제로 fn을 실행하고,
+    실행 중에 같은 키로 들어온 호출들은 리더의 결과(또는 예외)를 그대로 돌려받습니다.
+    실행이 끝나면 키가 제거되므로 결과를 캐시하지는 않습니다.
+    리더가 Exception이 아닌 이유로 멈추면 그 예외는 리더에게만 전달하고, 기다리던 호출들은 다시 실행합니다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self.leader_count = 0     # 실제로 실행된 호출 수
+        self.coalesced_count = 0  # 다른 호출에 합류한 호출 수
+
+    def do(self, key: Hashable, fn: Callable[[], T]) -> T:
+        while True:
+            with self._lock:
+                call = self._calls.get(key)
+                if call is not None:
+                    self.coalesced_count += 1
+                    is_leader = False
+                else:
+                    call = _Call()
+                    self._calls[key] = call
+                    self.leader_count += 1
+                    is_leader = True
+
+            if not is_leader:
+                call.done.wait()
+                if call.aborted:
+                    # 리더의 중단은 이 호출과 무관하므로 다시 시도 (먼저 들어온 호출이 새 리더가 됨)
+                    continue
+                if call.error is not None:
+                    raise call.error
+                return call.result
+
+            try:
+                call.result = fn()
+                return call.result
+            except Exception as e:
+                call.error = e
+                raise
+            except BaseException:
+                call.aborted = True
+                raise
+            finally:
+                with self._lock:
+                    self._calls.pop(key, None)
+                call.done.set()
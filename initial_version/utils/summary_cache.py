@@ -0,0 +1,105 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional
+from domain.news_article import NewsArticle
+
+
+def make_summary_key(model: str, prompt_version: str, articles: List[NewsArticle]) -> str:
+    """
+    (모델, 프롬프트 템플릿 버전, 기사 순서대로의 제목/스니펫)으로 요약 캐시 키를 만듭니다.
+    같은 기사 묶음을 같은 모델/프롬프트로 요약하면 항상 같은 키가 나옵니다.
+    """
+    payload = json.dumps(
+        {
+            "model": model,
+            "prompt_version": prompt_version,
+            "articles": [[a.title, a.snippet] for a in articles],
+        },
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class SummaryCache:
+    """
+    AI 요약 결과 캐시입니다.
+
+    - 메모리 계층: 최근 사용 순서(LRU)로 max_entries 개까지 보관
+    - 디스크 계층: cache_dir 아래 키별 JSON 파일로 영구 보관 (cache_dir가 비어 있으면 사용 안 함)
+    디스크에서 찾은 값은 메모리 계층으로 올립니다.
+    """
+
+    def __init__(self, cache_dir: Optional[str], max_entries: int = 256):
+        self.cache_dir = cache_dir
+        self.max_entries = max_entries
+        self._memory: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {"memory_hits": 0, "disk_hits": 0, "misses": 0}
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key[:2], f"{key}.json")
+
+    def _remember(self, key: str, summary: str):
+        self._memory[key] = summary
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                self.stats["memory_hits"] += 1
+                return self._memory[key]
+
+        if self.cache_dir:
+            try:
+                with open(self._path(key), encoding="utf-8") as f:
+                    summary = json.load(f)["summary"]
+                with self._lock:
+                    self._remember(key, summary)
+                    self.stats["disk_hits"] += 1
+                return summary
+            except (OSError, ValueError, KeyError):
+                pass
+
+        with self._lock:
+            self.stats["misses"] += 1
+        return None
+
+    def set(self, key: str, summary: str, model: str = ""):
+        with self._lock:
+            self._remember(key, summary)
+
+        if self.cache_dir:
+            path = self._path(key)
+            try:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                tmp_path = f"{path}.tmp"
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    json.dump({"summary": summary, "model": model, "created": time.time()}, f, ensure_ascii=False)
+                os.replace(tmp_path, path)
+            except OSError as e:
+                print(f"요약 캐시 저장 중 오류 발생: {e}")
+
+
+_cache: Optional[SummaryCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_summary_cache(settings) -> SummaryCache:
+    """프로세스 전체에서 공유하는 요약 캐시를 반환합니다."""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = SummaryCache(settings.SUMMARY_CACHE_DIR or None, settings.SUMMARY_CACHE_SIZE)
+        return _cache
+
+
+def get_summary_cache_stats() -> Dict[str, int]:
+    """요약 캐시 적중/실패 횟수를 반환합니다. (캐시를 아직 사용하지 않았다면 빈 dict)"""
+    return dict(_cache.stats) if _cache else {}
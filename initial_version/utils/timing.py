@@ -0,0 +1,87 @@
+import functools
+import json
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Dict, Optional
+
+# 최근 측정 기록 (단계 이름, 소요 시간 ms, 기록 시각)
+_records = deque(maxlen=2000)
+_log_path: Optional[str] = None
+_log_lock = threading.Lock()
+
+
+def configure_timing(settings):
+    """설정에 따라 기록 보관 개수와 JSONL 로그 파일 경로를 지정합니다. (TIMING_LOG_PATH가 비어 있으면 파일 기록 안 함)"""
+    global _records, _log_path
+    if _records.maxlen != settings.TIMING_BUFFER_SIZE:
+        _records = deque(_records, maxlen=settings.TIMING_BUFFER_SIZE)
+    _log_path = settings.TIMING_LOG_PATH or None
+
+
+def record(name: str, duration_ms: float, **attrs):
+    """측정값 1건을 기록합니다."""
+    _records.append((name, duration_ms, time.time()))
+    if not _log_path:
+        return
+
+    entry = {"ts": datetime.now().isoformat(timespec="milliseconds"), "span": name, "ms": round(duration_ms, 3), **attrs}
+    try:
+        with _log_lock, open(_log_path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry, ensure_ascii=False, default=str) + "\n")
+    except OSError as e:
+        print(f"시간 측정 로그 기록 중 오류 발생: {e}")
+
+
+@contextmanager
+def span(name: str, **attrs):
+    """
+    with 블록의 소요 시간을 기록합니다. 예외가 발생해도 기록하며, 이때 error 속성을 남깁니다.
+
+    사용 예시:
+    with span("tavily", keyword=keyword):
+        response = client.search(...)
+    """
+    started = time.perf_counter()
+    try:
+        yield
+    except BaseException as e:
+        attrs["error"] = type(e).__name__
+        raise
+    finally:
+        record(name, (time.perf_counter() - started) * 1000, **attrs)
+
+
+def timed(name: str):
+    """함수 실행 시간을 name 단계로 기록하는 데코레이터입니다."""
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            with span(name):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def _percentile(ordered, q: float) -> float:
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+def get_timing_stats() -> Dict[str, Dict[str, float]]:
+    """단계별 측정 횟수와 p50/p95/최근 소요 시간(ms)을 반환합니다."""
+    durations: Dict[str, list] = {}
+    for name, duration_ms, _ in list(_records):
+        durations.setdefault(name, []).append(duration_ms)
+
+    stats = {}
+    for name, values in durations.items():
+        ordered = sorted(values)
+        stats[name] = {
+            "count": len(values),
+            "p50_ms": _percentile(ordered, 0.5),
+            "p95_ms": _percentile(ordered, 0.95),
+            "last_ms": values[-1],
+        }
+    return stats